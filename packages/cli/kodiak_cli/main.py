@@ -9,6 +9,8 @@ This module handles:
 """
 
 import json as json_lib
+import sys
+import traceback
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
@@ -66,11 +68,6 @@ def _get_json_flag(ctx: click.Context) -> bool:
 @click.pass_context
 def cli(ctx: click.Context, prod: bool, as_json: bool) -> None:
     """Kodiak - CLI-based automated trading system."""
-    import sys
-    import traceback
-    from datetime import datetime
-    from pathlib import Path
-
     log_file = Path.home() / "kodiak_mcp_debug.log"
 
     try:
@@ -90,11 +87,12 @@ def cli(ctx: click.Context, prod: bool, as_json: bool) -> None:
         with open(log_file, "a") as f:
             f.write(f"{datetime.now().isoformat()} | CLI setup complete\n")
     except Exception as e:
+        tb = traceback.format_exc()
         with open(log_file, "a") as f:
             f.write(f"{datetime.now().isoformat()} | CLI error: {e}\n")
-            f.write(traceback.format_exc())
+            f.write(tb)
         print(f"CLI initialization error: {e}", file=sys.stderr, flush=True)
-        print(traceback.format_exc(), file=sys.stderr, flush=True)
+        print(tb, file=sys.stderr, flush=True)
         raise
 
 
@@ -537,7 +535,7 @@ def sell(ctx: click.Context, symbol: str, price: float, qty: int) -> None:
 @cli.command(name="reconcile-orders")
 @click.option(
     "--orders-dir", type=click.Path(),
-    help="Path to config directory containing orders.yaml",
+    help="Path to config directory containing orders.jsonl",
 )
 @click.pass_context
 def reconcile_orders(ctx: click.Context, orders_dir: str | None) -> None:
@@ -2201,7 +2199,7 @@ def backtest() -> None:
     type=click.Path(exists=True),
     help="Historical data directory for charting",
 )
-@click.option("--output", type=click.Path(dir_okay=False), help="Save chart to HTML file")
+@click.option("--output", type=click.Path(dir_okay=False), help="Save chart to HTML file (use .html.gz to gzip)")
 @click.option("--show", is_flag=True, help="Open chart in browser")
 @click.option(
     "--theme",
@@ -2400,7 +2398,7 @@ def optimize(
 )
 @click.option("--initial-capital", type=float, default=100000.0, help="Starting capital")
 @click.option("--save/--no-save", default=True, help="Save backtest results")
-@click.option("--chart", type=click.Path(dir_okay=False), help="Save chart to HTML file")
+@click.option("--chart", type=click.Path(dir_okay=False), help="Save chart to HTML file (use .html.gz to gzip)")
 @click.option("--show", is_flag=True, help="Open chart in browser")
 @click.option(
     "--theme",
@@ -2563,7 +2561,7 @@ def backtest_list(ctx: click.Context, data_dir: str | None) -> None:
     default="csv",
     help="Data source for charting",
 )
-@click.option("--chart", type=click.Path(dir_okay=False), help="Save chart to HTML file")
+@click.option("--chart", type=click.Path(dir_okay=False), help="Save chart to HTML file (use .html.gz to gzip)")
 @click.option("--show", is_flag=True, help="Open chart in browser")
 @click.option(
     "--theme",
@@ -2852,7 +2850,6 @@ def mcp_serve(ctx: click.Context) -> None:
     For HTTP transport, use kodiak-server instead.
     """
     import asyncio
-    import sys
 
     from kodiak.utils.logging import setup_logging
 
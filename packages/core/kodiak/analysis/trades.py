@@ -1,5 +1,6 @@
 """Trade analysis helpers."""
 
+from collections import deque
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
@@ -90,8 +91,10 @@ def analyze_trades(trades: Iterable[TradeRecord]) -> TradeAnalysisReport:
 
     open_positions = []
     for symbol, lots in open_lots.items():
-        total_qty = sum((lot.quantity for lot in lots), Decimal("0"))
-        total_cost = sum((lot.quantity * lot.price for lot in lots), Decimal("0"))
+        total_qty = total_cost = Decimal("0")
+        for lot in lots:
+            total_qty += lot.quantity
+            total_cost += lot.quantity * lot.price
         avg_cost = (total_cost / total_qty) if total_qty > 0 else Decimal("0")
         open_positions.append(
             OpenPosition(
@@ -114,37 +117,39 @@ def analyze_trades(trades: Iterable[TradeRecord]) -> TradeAnalysisReport:
 
 def _build_trade_pnls(
     trades: list[TradeRecord],
-) -> tuple[list[TradePnL], dict[str, list[_Lot]], dict[str, Decimal]]:
-    positions: dict[str, list[_Lot]] = {}
+) -> tuple[list[TradePnL], dict[str, deque[_Lot]], dict[str, Decimal]]:
+    positions: dict[str, deque[_Lot]] = {}
     pnls: list[TradePnL] = []
     unmatched_sells: dict[str, Decimal] = {}
 
     for trade in trades:
         symbol = trade.symbol
-        positions.setdefault(symbol, [])
+        lots = positions.setdefault(symbol, deque())
         unmatched_sells.setdefault(symbol, Decimal("0"))
+        price = trade.price
+        timestamp = trade.timestamp
 
         if trade.is_buy:
-            positions[symbol].append(
+            lots.append(
                 _Lot(
                     quantity=trade.quantity,
-                    price=trade.price,
-                    timestamp=trade.timestamp,
+                    price=price,
+                    timestamp=timestamp,
                 )
             )
             continue
 
         remaining = trade.quantity
         while remaining > 0:
-            if not positions[symbol]:
+            if not lots:
                 unmatched_sells[symbol] += remaining
                 break
 
-            lot = positions[symbol][0]
+            lot = lots[0]
             matched_qty = remaining if remaining <= lot.quantity else lot.quantity
-            pnl = matched_qty * (trade.price - lot.price)
+            pnl = matched_qty * (price - lot.price)
             holding_minutes = Decimal(
-                str((trade.timestamp - lot.timestamp).total_seconds() / 60)
+                str((timestamp - lot.timestamp).total_seconds() / 60)
             )
 
             pnls.append(
@@ -152,17 +157,17 @@ def _build_trade_pnls(
                     symbol=symbol,
                     quantity=matched_qty,
                     buy_price=lot.price,
-                    sell_price=trade.price,
+                    sell_price=price,
                     pnl=pnl,
                     buy_time=lot.timestamp,
-                    sell_time=trade.timestamp,
+                    sell_time=timestamp,
                     holding_minutes=holding_minutes,
                 )
             )
 
             remaining -= matched_qty
             if matched_qty >= lot.quantity:
-                positions[symbol].pop(0)
+                lots.popleft()
             else:
                 lot.quantity -= matched_qty
 
@@ -171,11 +176,22 @@ def _build_trade_pnls(
 
 def _summarize_pnls(pnls: list[TradePnL]) -> TradeStats:
     total_trades = len(pnls)
-    winning = [pnl.pnl for pnl in pnls if pnl.pnl > 0]
-    losing = [pnl.pnl for pnl in pnls if pnl.pnl < 0]
-
-    winning_trades = len(winning)
-    losing_trades = len(losing)
+    winning_trades = losing_trades = 0
+    gross_profit = losses = total_hold = Decimal("0")
+    largest_win = largest_loss = Decimal("0")
+    for pnl in pnls:
+        value = pnl.pnl
+        if value > 0:
+            winning_trades += 1
+            gross_profit += value
+            if value > largest_win:
+                largest_win = value
+        elif value < 0:
+            losing_trades += 1
+            losses += value
+            if value < largest_loss:
+                largest_loss = value
+        total_hold += pnl.holding_minutes
 
     win_rate = (
         (Decimal(winning_trades) / Decimal(total_trades)) * Decimal("100")
@@ -183,23 +199,15 @@ def _summarize_pnls(pnls: list[TradePnL]) -> TradeStats:
         else Decimal("0")
     )
 
-    gross_profit = sum(winning, Decimal("0"))
-    gross_loss = abs(sum(losing, Decimal("0")))
+    gross_loss = abs(losses)
     net_profit = gross_profit - gross_loss
 
     avg_win = (gross_profit / Decimal(winning_trades)) if winning_trades > 0 else Decimal("0")
-    avg_loss = (sum(losing, Decimal("0")) / Decimal(losing_trades)) if losing_trades > 0 else Decimal("0")
-
-    largest_win = max(winning) if winning else Decimal("0")
-    largest_loss = min(losing) if losing else Decimal("0")
+    avg_loss = (losses / Decimal(losing_trades)) if losing_trades > 0 else Decimal("0")
 
     profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else Decimal("0")
 
-    avg_hold_minutes = (
-        sum((pnl.holding_minutes for pnl in pnls), Decimal("0")) / Decimal(total_trades)
-        if total_trades > 0
-        else Decimal("0")
-    )
+    avg_hold_minutes = total_hold / Decimal(total_trades) if total_trades > 0 else Decimal("0")
 
     return TradeStats(
         total_trades=total_trades,
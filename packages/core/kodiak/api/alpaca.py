@@ -88,8 +88,21 @@ class AlpacaBroker(Broker):
         """Get current quote for a symbol."""
         request = StockLatestQuoteRequest(symbol_or_symbols=symbol)
         quotes = self.data_client.get_stock_latest_quote(request)
-        quote = quotes[symbol]
+        return self._convert_quote(symbol, quotes[symbol])
 
+    def get_quotes(self, symbols: list[str]) -> dict[str, Quote]:
+        """Get current quotes for several symbols in one request."""
+        if not symbols:
+            return {}
+        request = StockLatestQuoteRequest(symbol_or_symbols=list(symbols))
+        quotes = self.data_client.get_stock_latest_quote(request)
+        return {
+            symbol: self._convert_quote(symbol, quote)
+            for symbol, quote in quotes.items()
+        }
+
+    def _convert_quote(self, symbol: str, quote: object) -> Quote:
+        """Convert Alpaca quote to our Quote model."""
         return Quote(
             symbol=symbol,
             bid=Decimal(str(quote.bid_price)),
@@ -36,6 +36,20 @@ class OrderStatus(Enum):
     EXPIRED = "expired"
 
 
+# Statuses of orders still working at the broker
+OPEN_ORDER_STATUSES = frozenset(
+    {
+        OrderStatus.NEW,
+        OrderStatus.PENDING,
+        OrderStatus.ACCEPTED,
+        OrderStatus.PARTIALLY_FILLED,
+    }
+)
+
+# Statuses of orders that ended without filling
+DEAD_ORDER_STATUSES = frozenset({OrderStatus.CANCELED, OrderStatus.REJECTED, OrderStatus.EXPIRED})
+
+
 @dataclass
 class Account:
     """Trading account information."""
@@ -145,6 +159,20 @@ class Broker(ABC):
         """
         pass
 
+    def get_quotes(self, symbols: list[str]) -> dict[str, Quote]:
+        """Get current quotes for several symbols.
+
+        Brokers with a multi-symbol quote endpoint should override this to
+        fetch all symbols in one request; the default calls `get_quote` per symbol.
+
+        Args:
+            symbols: Stock symbols.
+
+        Returns:
+            Dict mapping symbol to quote.
+        """
+        return {symbol: self.get_quote(symbol) for symbol in symbols}
+
     @abstractmethod
     def place_order(
         self,
@@ -0,0 +1,55 @@
+"""Per-cycle broker snapshot for read-only broker calls."""
+
+from kodiak.api.broker import Account, Broker, Position, Quote
+
+
+class BrokerSnapshot:
+    """Broker state captured for one engine cycle.
+
+    Exposes the read methods of `Broker` used during evaluation and safety
+    checks. Each piece of state is fetched lazily, at most once per snapshot,
+    so K checks in a cycle cost one round-trip per distinct request instead of K.
+    """
+
+    def __init__(self, broker: Broker) -> None:
+        """Initialize snapshot.
+
+        Args:
+            broker: Broker to read from.
+        """
+        self.broker = broker
+        self._account: Account | None = None
+        self._positions: dict[str, Position] | None = None
+        self._quotes: dict[str, Quote] = {}
+
+    def get_account(self) -> Account:
+        """Get account information, fetched once per snapshot."""
+        if self._account is None:
+            self._account = self.broker.get_account()
+        return self._account
+
+    def get_positions(self) -> list[Position]:
+        """Get all open positions, fetched once per snapshot."""
+        if self._positions is None:
+            self._positions = {p.symbol: p for p in self.broker.get_positions()}
+        return list(self._positions.values())
+
+    def get_position(self, symbol: str) -> Position | None:
+        """Get position for a symbol from the snapshot's positions."""
+        if self._positions is None:
+            self.get_positions()
+        return self._positions.get(symbol)
+
+    def prefetch_quotes(self, symbols: list[str]) -> None:
+        """Fetch quotes for all given symbols not yet cached, in one batched call."""
+        missing = [s for s in dict.fromkeys(symbols) if s not in self._quotes]
+        if missing:
+            self._quotes.update(self.broker.get_quotes(missing))
+
+    def get_quote(self, symbol: str) -> Quote:
+        """Get quote for a symbol, fetched once per snapshot."""
+        quote = self._quotes.get(symbol)
+        if quote is None:
+            quote = self.broker.get_quote(symbol)
+            self._quotes[symbol] = quote
+        return quote
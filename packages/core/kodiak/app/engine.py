@@ -110,7 +110,7 @@ def start_engine(dry_run: bool = False, interval: int = 60) -> dict[str, str]:
                         suggestion="Use stop_engine first, or force-start via CLI with --force",
                     )
                 except ProcessLookupError:
-                    lock_path.unlink()  # stale lock — clean up and continue
+                    pass  # stale PID — the new engine re-locks the same file
         except (ValueError, FileNotFoundError):
             pass
 
@@ -176,7 +176,6 @@ def stop_engine(force: bool = False) -> dict[str, str]:
         with open(lock_path) as f:
             pid_str = f.read().strip()
             if not pid_str:
-                lock_path.unlink()
                 raise EngineError(
                     message="Lock file is empty - no engine running",
                     code="ENGINE_NOT_RUNNING",
@@ -192,15 +191,11 @@ def stop_engine(force: bool = False) -> dict[str, str]:
     try:
         os.kill(pid, 0)
     except ProcessLookupError:
-        try:
-            lock_path.unlink()
-        except Exception:
-            pass
         raise EngineError(
             message=f"Engine process (PID {pid}) is not running",
             code="ENGINE_NOT_RUNNING",
             details={"pid": pid, "stale_lock": True},
-            suggestion="Stale lock file was cleaned up",
+            suggestion="Stale lock file is ignored; the next engine start will reuse it",
         )
     except PermissionError:
         raise EngineError(
@@ -222,10 +217,6 @@ def stop_engine(force: bool = False) -> dict[str, str]:
             log_dir=load_config().log_dir,
         )
         if force:
-            try:
-                lock_path.unlink()
-            except Exception:
-                pass
             return {"status": "killed", "pid": str(pid)}
         else:
             return {"status": "stopping", "pid": str(pid)}
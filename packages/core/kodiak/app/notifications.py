@@ -3,10 +3,9 @@
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from kodiak.notifications.formatters import TradeNotification
 from kodiak.notifications.manager import NotificationManager
+from kodiak.utils.yaml_io import load_yaml
 
 
 def _config_dir() -> Path:
@@ -20,7 +19,7 @@ def _load_notifications_config() -> dict[str, Any]:
     if not path.is_file():
         return {}
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
     if not data or "notifications" not in data:
         return {}
     return data["notifications"]
@@ -34,7 +33,7 @@ def get_notification_manager(config_dir: Path | None = None) -> NotificationMana
     config: dict[str, Any] = {}
     if config_path.is_file():
         with open(config_path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
         if data and "notifications" in data:
             config = data["notifications"]
     return NotificationManager(config)
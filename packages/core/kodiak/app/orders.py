@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from kodiak.api.broker import OrderSide, OrderStatus, OrderType
+from kodiak.api.broker import OPEN_ORDER_STATUSES, OrderSide, OrderType
 from kodiak.app import get_broker
 from kodiak.audit import log_action as audit_log
 from kodiak.core.safety import SafetyCheck
@@ -110,13 +110,7 @@ def list_orders(config: Config, show_all: bool = False) -> list[OrderResponse]:
     orders_list = broker.get_orders()
 
     if not show_all:
-        open_statuses = {
-            OrderStatus.NEW,
-            OrderStatus.PENDING,
-            OrderStatus.ACCEPTED,
-            OrderStatus.PARTIALLY_FILLED,
-        }
-        orders_list = [o for o in orders_list if o.status in open_statuses]
+        orders_list = [o for o in orders_list if o.status in OPEN_ORDER_STATUSES]
 
     return [OrderResponse.from_domain(o) for o in orders_list]
 
@@ -44,8 +44,10 @@ def get_balance(config: Config) -> BalanceResponse:
             code="BROKER_FETCH_FAILED",
         )
 
-    total_value = sum((p.market_value for p in positions_list), Decimal("0"))
-    total_pl = sum((p.unrealized_pl for p in positions_list), Decimal("0"))
+    total_value = total_pl = Decimal("0")
+    for p in positions_list:
+        total_value += p.market_value
+        total_pl += p.unrealized_pl
 
     day_change = None
     day_change_pct = None
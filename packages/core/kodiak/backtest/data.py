@@ -45,12 +45,14 @@ def load_csv_data(file_path: Path) -> pd.DataFrame:
     # Set timestamp as index
     df = df.set_index("timestamp")
 
-    # Sort by timestamp
-    df = df.sort_index()
+    # Sort by timestamp; exported history is usually already in order
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
 
     # Validate data quality
-    if df.isnull().any().any():
-        raise ValueError("CSV contains NaN values")
+    if pd.isna(df.to_numpy()).any():
+        nan_columns = df.columns[df.isna().any()].tolist()
+        raise ValueError(f"CSV contains NaN values in {nan_columns}")
 
     if len(df) == 0:
         raise ValueError("CSV file is empty")
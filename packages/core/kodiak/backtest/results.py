@@ -244,17 +244,9 @@ def _calculate_trade_pnls(filled_orders: list[Order]) -> list[Decimal]:
     buys = [o for o in filled_orders if o.side == OrderSide.BUY]
     sells = [o for o in filled_orders if o.side == OrderSide.SELL]
 
-    # Match buys to sells using FIFO
+    # Match buys to sells using FIFO: the i-th sell closes the i-th buy
     pnls = []
-    buy_queue = list(buys)  # Copy to avoid modifying original
-
-    for sell in sells:
-        if not buy_queue:
-            break
-
-        # Match with first buy
-        buy = buy_queue.pop(0)
-
+    for buy, sell in zip(buys, sells):
         # Calculate P/L
         buy_cost = buy.filled_avg_price * buy.qty
         sell_proceeds = sell.filled_avg_price * sell.qty
@@ -1,20 +1,32 @@
 """Trading engine - main execution loop."""
 
 import fcntl
+import functools
 import os
 import signal
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 
 from kodiak.api.broker import Broker
-from kodiak.models.order import OrderStatus as LocalOrderStatus
-from kodiak.oms.store import load_orders, save_order
+from kodiak.api.snapshot import BrokerSnapshot
+from kodiak.models.order import FINAL_STATUSES
+from kodiak.oms.store import LOCAL_STATUS_BY_BROKER, get_orders_file, load_orders, save_order
 from kodiak.strategies.evaluator import StrategyEvaluator
-from kodiak.strategies.loader import get_active_strategies
+from kodiak.strategies.loader import (
+    filter_active_strategies,
+    get_strategies_file,
+    load_strategies,
+    save_strategy,
+)
+from kodiak.strategies.models import Strategy
 from kodiak.utils.config import StrategyDefaults
 from kodiak.utils.logging import get_logger
 
+# Seconds to reuse the broker's market-open answer between cycles
+MARKET_OPEN_TTL = 30.0
+
 
 class EngineAlreadyRunningError(Exception):
     """Raised when another engine instance is already running."""
@@ -22,8 +34,13 @@ class EngineAlreadyRunningError(Exception):
     pass
 
 
+@functools.cache
 def get_lock_file_path() -> Path:
-    """Get the path to the engine lock file."""
+    """Get the path to the engine lock file.
+
+    Resolved once per process; resolving the config directory walks the
+    filesystem and creates it if missing.
+    """
     # Store in config directory alongside strategies.yaml
     from kodiak.utils.paths import get_config_dir
     config_dir = get_config_dir()
@@ -61,9 +78,17 @@ class TradingEngine:
         self.logger = get_logger("trader.engine")
         self._running = False
         self._stop_requested = False
+        # Set by stop() to cut the inter-cycle wait short
+        self._wake = threading.Event()
         self.orders_dir = orders_dir
         self._lock_file = None
-        self._lock_fd = None
+        self._lock_fd: int | None = None
+        # (monotonic time checked, is_open)
+        self._market_open_cache: tuple[float, bool] | None = None
+        # ((mtime_ns, size), wall time loaded, strategies)
+        self._strategies_cache: tuple[tuple[int, int], float, list[Strategy]] | None = None
+        # (mtime_ns, size) of the orders file when it last held no open orders
+        self._settled_orders_key: tuple[int, int] | None = None
 
     def _acquire_lock(self) -> None:
         """Acquire exclusive lock to prevent multiple engine instances.
@@ -74,57 +99,52 @@ class TradingEngine:
         lock_path = get_lock_file_path()
         self._lock_file = lock_path
 
+        # Open without truncating so a running holder's PID stays readable;
+        # O_CLOEXEC keeps child processes from inheriting the lock
+        fd = os.open(lock_path, os.O_CREAT | os.O_RDWR | os.O_CLOEXEC, 0o644)
         try:
-            # Open (or create) the lock file
-            self._lock_fd = open(lock_path, "w")
-
             # Try to acquire exclusive lock (non-blocking)
-            fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-
-            # Write PID to lock file for debugging
-            self._lock_fd.write(str(os.getpid()))
-            self._lock_fd.flush()
-
-            self.logger.debug(f"Acquired engine lock: {lock_path}")
-
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
         except BlockingIOError:
-            # Another process holds the lock
-            if self._lock_fd:
-                self._lock_fd.close()
-                self._lock_fd = None
-
-            # Try to read the PID of the other process
+            # Another process holds the lock; report its PID
             try:
-                with open(lock_path) as f:
-                    other_pid = f.read().strip()
+                other_pid = os.pread(fd, 32, 0).decode(errors="replace").strip()
+            finally:
+                os.close(fd)
+            if other_pid:
                 raise EngineAlreadyRunningError(
                     f"Another trading engine is already running (PID: {other_pid}). "
                     "Stop it first or use --force to override."
                 )
-            except FileNotFoundError:
-                raise EngineAlreadyRunningError(
-                    "Another trading engine is already running."
-                )
+            raise EngineAlreadyRunningError(
+                "Another trading engine is already running."
+            )
+
+        # Write PID to lock file for debugging, now that we hold the lock
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, str(os.getpid()).encode(), 0)
+        self._lock_fd = fd
+
+        self.logger.debug(f"Acquired engine lock: {lock_path}")
 
     def _release_lock(self) -> None:
-        """Release the engine lock."""
-        if self._lock_fd:
+        """Release the engine lock.
+
+        The lock file itself is left in place: unlinking it would let a new
+        engine lock a fresh inode while another process still holds the old one.
+        """
+        if self._lock_fd is not None:
             try:
-                fcntl.flock(self._lock_fd.fileno(), fcntl.LOCK_UN)
-                self._lock_fd.close()
+                # Clear our PID before unlocking so it never looks stale
+                os.ftruncate(self._lock_fd, 0)
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+                os.close(self._lock_fd)
                 self.logger.debug("Released engine lock")
             except Exception as e:
                 self.logger.warning(f"Error releasing lock: {e}")
             finally:
                 self._lock_fd = None
 
-        # Clean up lock file
-        if self._lock_file and self._lock_file.exists():
-            try:
-                self._lock_file.unlink()
-            except Exception:
-                pass
-
     def start(self) -> None:
         """Start the trading engine loop.
 
@@ -136,6 +156,7 @@ class TradingEngine:
 
         self._running = True
         self._stop_requested = False
+        self._wake.clear()
 
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._handle_shutdown)
@@ -156,27 +177,36 @@ class TradingEngine:
             self._run_loop()
         finally:
             self._running = False
+            self.strategy_evaluator.close()
             self._release_lock()
             self.logger.info("Trading engine stopped")
 
     def _reconcile_orders(self) -> None:
         """Load locally persisted orders and reconcile status with broker."""
-        orders = load_orders(self.orders_dir)
-        if not orders:
+        try:
+            st = get_orders_file(self.orders_dir).stat()
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        # Nothing left to reconcile since the last pass and the file is unchanged
+        if key is not None and key == self._settled_orders_key:
             return
 
-        for o in orders:
-            # Only reconcile non-final statuses
-            if o.status in (LocalOrderStatus.FILLED, LocalOrderStatus.CANCELED):
-                continue
+        # Only reconcile non-final statuses
+        open_orders = [o for o in load_orders(self.orders_dir) if o.status not in FINAL_STATUSES]
+        if not open_orders:
+            self._settled_orders_key = key
+            return
 
+        for o in open_orders:
             try:
                 broker_order = self.broker.get_order(o.external_id or o.id)
                 if not broker_order:
                     continue
 
                 # If status changed, persist updated broker order
-                if getattr(broker_order, "status", None) and broker_order.status.value != o.status.value:
+                broker_status = getattr(broker_order, "status", None)
+                if LOCAL_STATUS_BY_BROKER.get(broker_status, o.status) != o.status:
                     save_order(broker_order, self.orders_dir)
                     self.logger.info(f"Reconciled order {o.id} -> {broker_order.status.value}")
 
@@ -186,6 +216,7 @@ class TradingEngine:
     def stop(self) -> None:
         """Request engine stop."""
         self._stop_requested = True
+        self._wake.set()
         self.logger.info("Stop requested, will exit after current cycle")
 
     def _handle_shutdown(self, signum: int, frame: object | None) -> None:
@@ -208,7 +239,7 @@ class TradingEngine:
             sleep_time = max(0, self.poll_interval - elapsed)
 
             if sleep_time > 0 and not self._stop_requested:
-                time.sleep(sleep_time)
+                self._wake.wait(sleep_time)
 
     def _run_cycle(self) -> list[str]:
         """Run a single evaluation cycle. Returns list of strategy IDs that had actions."""
@@ -216,26 +247,73 @@ class TradingEngine:
         self._check_scheduled_strategies()
 
         # Check if market is open
-        if not self.broker.is_market_open():
+        if not self._is_market_open():
             self.logger.debug("Market closed, skipping cycle")
             return []
 
+        # Keep persisted order statuses in step with the broker between restarts
+        try:
+            self._reconcile_orders()
+        except Exception as e:
+            self.logger.error(f"Error reconciling orders: {e}")
+
         # Evaluate strategies
-        strategies = get_active_strategies()
+        strategies = filter_active_strategies(self._load_strategies())
         if strategies:
             self.logger.debug(f"Evaluating {len(strategies)} active strategies")
-            strategy_ids = self.strategy_evaluator.run_once(strategies, dry_run=self.dry_run)
+            # One snapshot per cycle: account, positions and quotes fetched at most once
+            snapshot = BrokerSnapshot(self.broker)
+            try:
+                snapshot.prefetch_quotes([s.symbol for s in strategies])
+            except Exception as e:
+                # Fall back to per-symbol fetches during evaluation
+                self.logger.debug(f"Batched quote fetch failed: {e}")
+            strategy_ids = self.strategy_evaluator.run_once(
+                strategies, dry_run=self.dry_run, snapshot=snapshot
+            )
             if strategy_ids:
                 self.logger.info(f"Strategy actions executed: {strategy_ids}")
             return strategy_ids or []
         self.logger.debug("No active strategies")
         return []
 
-    def _check_scheduled_strategies(self) -> None:
-        """Check scheduled strategies and enable them when schedule time arrives."""
-        from kodiak.strategies.loader import load_strategies, save_strategy
+    def _is_market_open(self) -> bool:
+        """Check if the market is open, reusing the broker's answer for MARKET_OPEN_TTL."""
+        now = time.monotonic()
+        if self._market_open_cache is not None:
+            checked_at, is_open = self._market_open_cache
+            if now - checked_at < MARKET_OPEN_TTL:
+                return is_open
+
+        is_open = self.broker.is_market_open()
+        self._market_open_cache = (now, is_open)
+        return is_open
+
+    def _load_strategies(self) -> list[Strategy]:
+        """Load strategies, re-parsing the YAML file only when it has changed.
+
+        A file modified within a second of the last load is always re-read,
+        since coarse mtime resolution could otherwise hide the change.
+        """
+        path = get_strategies_file()
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._strategies_cache = None
+            return []
+
+        key = (st.st_mtime_ns, st.st_size)
+        cache = self._strategies_cache
+        if cache is not None and cache[0] == key and st.st_mtime < cache[1] - 1:
+            return cache[2]
 
         strategies = load_strategies()
+        self._strategies_cache = (key, time.time(), strategies)
+        return strategies
+
+    def _check_scheduled_strategies(self) -> None:
+        """Check scheduled strategies and enable them when schedule time arrives."""
+        strategies = self._load_strategies()
         now = datetime.now()
 
         for strategy in strategies:
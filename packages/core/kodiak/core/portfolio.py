@@ -1,9 +1,10 @@
 """Portfolio tracking and analysis."""
 
+import heapq
 from dataclasses import dataclass
 from decimal import Decimal
 
-from kodiak.api.broker import Broker
+from kodiak.api.broker import Broker, Position
 from kodiak.data.ledger import TradeLedger
 
 
@@ -88,32 +89,35 @@ class Portfolio:
         Returns:
             List of position details.
         """
-        positions = self.broker.get_positions()
-        account = self.broker.get_account()
-        total_equity = account.equity
-
-        details = []
-        for pos in positions:
-            cost_basis = pos.avg_entry_price * pos.qty
-            weight = (pos.market_value / total_equity * 100) if total_equity > 0 else Decimal("0")
-
-            details.append(
-                PositionDetail(
-                    symbol=pos.symbol,
-                    quantity=pos.qty,
-                    avg_cost=pos.avg_entry_price,
-                    current_price=pos.current_price,
-                    market_value=pos.market_value,
-                    cost_basis=cost_basis,
-                    unrealized_pnl=pos.unrealized_pl,
-                    unrealized_pnl_pct=pos.unrealized_pl_pct,
-                    weight_pct=weight,
-                )
-            )
-
-        # Sort by market value descending
-        details.sort(key=lambda x: x.market_value, reverse=True)
-        return details
+        positions, total_equity = self._positions_by_value()
+        return [self._detail(pos, total_equity) for pos in positions]
+
+    def _positions_by_value(self) -> tuple[list[Position], Decimal]:
+        """Fetch positions, by market value descending, and total equity."""
+        positions = sorted(
+            self.broker.get_positions(), key=lambda p: p.market_value, reverse=True
+        )
+        return positions, self.broker.get_account().equity
+
+    @staticmethod
+    def _weight(market_value: Decimal, total_equity: Decimal) -> Decimal:
+        """Percentage of total equity held in a position."""
+        return (market_value / total_equity * 100) if total_equity > 0 else Decimal("0")
+
+    @classmethod
+    def _detail(cls, pos: Position, total_equity: Decimal) -> PositionDetail:
+        """Build the detail record for one position."""
+        return PositionDetail(
+            symbol=pos.symbol,
+            quantity=pos.qty,
+            avg_cost=pos.avg_entry_price,
+            current_price=pos.current_price,
+            market_value=pos.market_value,
+            cost_basis=pos.avg_entry_price * pos.qty,
+            unrealized_pnl=pos.unrealized_pl,
+            unrealized_pnl_pct=pos.unrealized_pl_pct,
+            weight_pct=cls._weight(pos.market_value, total_equity),
+        )
 
     def get_allocation(self) -> dict[str, Decimal]:
         """Get portfolio allocation by symbol.
@@ -121,33 +125,71 @@ class Portfolio:
         Returns:
             Dict mapping symbol to percentage of portfolio.
         """
-        positions = self.get_positions_detail()
-        return {p.symbol: p.weight_pct for p in positions}
+        positions, total_equity = self._positions_by_value()
+        return {p.symbol: self._weight(p.market_value, total_equity) for p in positions}
 
     def get_top_gainers(self, limit: int = 5) -> list[PositionDetail]:
         """Get top gaining positions.
 
+        Use `get_top_movers` when losers are wanted too; it fetches once for both.
+
         Args:
             limit: Number of positions to return.
 
         Returns:
             List of top gaining positions.
         """
-        positions = self.get_positions_detail()
-        gainers = [p for p in positions if p.unrealized_pnl > 0]
-        gainers.sort(key=lambda x: x.unrealized_pnl, reverse=True)
-        return gainers[:limit]
+        return self._details(self._top_k(self.broker.get_positions(), limit, ascending=False))
 
     def get_top_losers(self, limit: int = 5) -> list[PositionDetail]:
         """Get top losing positions.
 
+        Use `get_top_movers` when gainers are wanted too; it fetches once for both.
+
         Args:
             limit: Number of positions to return.
 
         Returns:
             List of top losing positions.
         """
-        positions = self.get_positions_detail()
-        losers = [p for p in positions if p.unrealized_pnl < 0]
-        losers.sort(key=lambda x: x.unrealized_pnl)
-        return losers[:limit]
+        return self._details(self._top_k(self.broker.get_positions(), limit, ascending=True))
+
+    def get_top_movers(self, limit: int = 5) -> tuple[list[PositionDetail], list[PositionDetail]]:
+        """Get top gaining and top losing positions from one broker fetch.
+
+        Args:
+            limit: Number of positions to return on each side.
+
+        Returns:
+            Tuple of (gainers by P/L descending, losers by P/L ascending).
+        """
+        positions = self.broker.get_positions()
+        gainers = self._top_k(positions, limit, ascending=False)
+        losers = self._top_k(positions, limit, ascending=True)
+        if not gainers and not losers:
+            return [], []
+
+        total_equity = self.broker.get_account().equity
+        return (
+            [self._detail(pos, total_equity) for pos in gainers],
+            [self._detail(pos, total_equity) for pos in losers],
+        )
+
+    def _details(self, positions: list[Position]) -> list[PositionDetail]:
+        """Detail records for positions, fetching the account only if there are any."""
+        if not positions:
+            return []
+        total_equity = self.broker.get_account().equity
+        return [self._detail(pos, total_equity) for pos in positions]
+
+    @staticmethod
+    def _top_k(positions: list[Position], k: int, ascending: bool) -> list[Position]:
+        """The k largest gains (or losses if ascending), O(N log k).
+
+        Equal P/L is broken by market value, largest first.
+        """
+        if ascending:
+            losers = [p for p in positions if p.unrealized_pl < 0]
+            return heapq.nsmallest(k, losers, key=lambda p: (p.unrealized_pl, -p.market_value))
+        gainers = [p for p in positions if p.unrealized_pl > 0]
+        return heapq.nlargest(k, gainers, key=lambda p: (p.unrealized_pl, p.market_value))
@@ -5,14 +5,12 @@ from decimal import Decimal
 from pathlib import Path
 
 from kodiak.api.broker import Broker
-from kodiak.api.broker import OrderSide as BrokerOrderSide
-from kodiak.api.broker import OrderStatus as BrokerOrderStatus
 from kodiak.data.ledger import TradeLedger
-from kodiak.models.order import OrderSide as LocalOrderSide
-from kodiak.models.order import OrderStatus as LocalOrderStatus
-from kodiak.oms.store import load_orders, save_order
+from kodiak.oms.reconcile import OrderReconciler, PendingOrdersCache
 from kodiak.utils.logging import get_logger
 
+_ZERO = Decimal("0")
+
 
 @dataclass
 class SafetyLimits:
@@ -34,6 +32,7 @@ class SafetyCheck:
         ledger: TradeLedger,
         limits: SafetyLimits | None = None,
         orders_dir: Path | None = None,
+        pending_orders: PendingOrdersCache | None = None,
     ) -> None:
         """Initialize safety checker.
 
@@ -41,11 +40,17 @@ class SafetyCheck:
             broker: Broker instance.
             ledger: Trade ledger.
             limits: Safety limits (uses defaults if None).
+            orders_dir: Optional custom orders directory.
+            pending_orders: Optional shared pending-orders cache. It is
+                refreshed from the broker on an order check once it is older
+                than `PENDING_ORDERS_TTL_SECONDS`.
         """
         self.broker = broker
         self.ledger = ledger
         self.limits = limits or SafetyLimits()
         self.orders_dir = orders_dir
+        self.pending_orders = pending_orders or PendingOrdersCache()
+        self.reconciler = OrderReconciler(broker, orders_dir)
         self.logger = get_logger("trader.safety")
         self._killed = False
 
@@ -73,8 +78,11 @@ class SafetyCheck:
         if self._killed:
             return False, "Kill switch is active"
 
+        return self._check_daily_limits(*self.ledger.get_today_stats())
+
+    def _check_daily_limits(self, daily_pnl: Decimal, trade_count: int) -> tuple[bool, str]:
+        """Check today's P/L and trade count against the daily limits."""
         # Check daily loss limit
-        daily_pnl = self.ledger.get_total_today_pnl()
         if daily_pnl < -self.limits.max_daily_loss:
             self.logger.warning(
                 f"Daily loss limit reached: ${daily_pnl:.2f} (limit: -${self.limits.max_daily_loss})"
@@ -82,7 +90,6 @@ class SafetyCheck:
             return False, f"Daily loss limit reached: ${daily_pnl:.2f}"
 
         # Check daily trade count
-        trade_count = self.ledger.get_trade_count_today()
         if trade_count >= self.limits.max_daily_trades:
             self.logger.warning(
                 f"Daily trade limit reached: {trade_count} (limit: {self.limits.max_daily_trades})"
@@ -114,82 +121,27 @@ class SafetyCheck:
         if not can_trade:
             return False, reason
 
-        order_value = Decimal(str(quantity)) * price
+        # Decimal * int is exact, so no string round-trip is needed
+        order_value = price * quantity
 
         # Check order value limit
         if order_value > self.limits.max_order_value:
             return False, f"Order value ${order_value:.2f} exceeds limit ${self.limits.max_order_value}"
 
-        # Get actual pending orders from broker (source of truth)
-        # Also reconcile local orders.yaml with broker to keep it in sync
-        try:
-            broker_orders = self.broker.get_orders()
-            # Filter to only pending orders for this symbol
-            pending_broker_orders = [
-                o for o in broker_orders
-                if o.symbol == symbol
-                and o.status in (
-                    BrokerOrderStatus.NEW,
-                    BrokerOrderStatus.PENDING,
-                    BrokerOrderStatus.ACCEPTED,
-                    BrokerOrderStatus.PARTIALLY_FILLED,
-                )
-            ]
-
-            # Reconcile local orders.yaml with broker (update statuses)
-            try:
-                local_orders = load_orders(self.orders_dir)
-                for local_order in local_orders:
-                    if local_order.symbol != symbol:
-                        continue
-                    # Skip if already in final state
-                    if local_order.status in (LocalOrderStatus.FILLED, LocalOrderStatus.CANCELED):
-                        continue
-
-                    # Find matching broker order
-                    broker_order = None
-                    for bo in broker_orders:
-                        if (bo.id == local_order.id or
-                            bo.id == local_order.external_id or
-                            (local_order.external_id and bo.id == local_order.external_id)):
-                            broker_order = bo
-                            break
-
-                    # Update local order if broker shows different status
-                    if broker_order:
-                        broker_status = broker_order.status
-                        local_status = local_order.status
-                        # Compare status values
-                        broker_status_str = broker_status.value if hasattr(broker_status, 'value') else str(broker_status)
-                        local_status_str = local_status.value if hasattr(local_status, 'value') else str(local_status)
-
-                        if broker_status_str != local_status_str:
-                            try:
-                                # Save updated broker order to sync status
-                                save_order(broker_order, self.orders_dir)
-                                self.logger.debug(f"Reconciled order {local_order.id}: {local_status_str} -> {broker_status_str}")
-                            except Exception as e:
-                                self.logger.debug(f"Failed to reconcile order {local_order.id}: {e}")
-            except Exception as e:
-                self.logger.debug(f"Failed to reconcile local orders: {e}")
-        except Exception as e:
-            self.logger.debug(f"Failed to get broker orders, falling back to local: {e}")
-            pending_broker_orders = []
-
-        # Calculate pending quantities from broker orders (source of truth)
+        # Pending orders come from the reconciled cache rather than per-check I/O
+        if self.reconciler.is_stale(self.pending_orders):
+            self.reconciler.refresh(self.pending_orders)
+
         pending_buy_qty = 0
-        pending_buy_value = Decimal("0")
+        pending_buy_value = _ZERO
         pending_sell_qty = 0
         midpoint = None
-        for o in pending_broker_orders:
-            is_buy_order = o.side == BrokerOrderSide.BUY
-            qty = int(o.qty)
-
-            if is_buy_order:
-                pending_buy_qty += qty
+        for o in self.pending_orders.get(symbol):
+            if o.is_buy:
+                pending_buy_qty += o.qty
                 # estimate value
                 if o.limit_price is not None:
-                    pending_buy_value += Decimal(str(o.limit_price)) * qty
+                    pending_buy_value += o.limit_price * o.qty
                 else:
                     # lazy fetch midpoint once
                     if midpoint is None:
@@ -197,37 +149,10 @@ class SafetyCheck:
                             q = self.broker.get_quote(symbol)
                             midpoint = (q.bid + q.ask) / 2
                         except Exception:
-                            midpoint = Decimal("0")
-                    pending_buy_value += (midpoint or Decimal("0")) * qty
+                            midpoint = _ZERO
+                    pending_buy_value += midpoint * o.qty
             else:
-                pending_sell_qty += qty
-
-        # When broker returned no pending orders (e.g. mock or API failure), use local orders dir so we still reserve buying power / position size
-        if (pending_buy_qty == 0 and pending_sell_qty == 0) and self.orders_dir is not None:
-            try:
-                local_orders = load_orders(self.orders_dir)
-                for local_order in local_orders:
-                    if local_order.symbol != symbol:
-                        continue
-                    if local_order.status in (LocalOrderStatus.FILLED, LocalOrderStatus.CANCELED):
-                        continue
-                    qty = int(local_order.qty)
-                    if local_order.side == LocalOrderSide.BUY:
-                        pending_buy_qty += qty
-                        if local_order.limit_price is not None:
-                            pending_buy_value += local_order.limit_price * qty
-                        else:
-                            if midpoint is None:
-                                try:
-                                    q = self.broker.get_quote(symbol)
-                                    midpoint = (q.bid + q.ask) / 2
-                                except Exception:
-                                    midpoint = Decimal("0")
-                            pending_buy_value += (midpoint or Decimal("0")) * qty
-                    else:
-                        pending_sell_qty += qty
-            except Exception as e:
-                self.logger.debug(f"Failed to load local orders for pending reserve: {e}")
+                pending_sell_qty += o.qty
 
         # Check against current position quantity as well
         current_position = self.broker.get_position(symbol)
@@ -238,9 +163,7 @@ class SafetyCheck:
         # For buys, check position limits
         if is_buy:
             # Check if this would exceed position value limit
-            current_value = Decimal("0")
-            if current_position:
-                current_value = current_position.market_value
+            current_value = current_position.market_value if current_position else _ZERO
 
             new_value = current_value + order_value + pending_buy_value
             if new_value > self.limits.max_position_value:
@@ -264,8 +187,7 @@ class SafetyCheck:
         Returns:
             Dict with safety metrics.
         """
-        daily_pnl = self.ledger.get_total_today_pnl()
-        trade_count = self.ledger.get_trade_count_today()
+        daily_pnl, trade_count = self.ledger.get_today_stats()
 
         return {
             "kill_switch": self._killed,
@@ -275,5 +197,5 @@ class SafetyCheck:
             "trade_count": trade_count,
             "trade_limit": self.limits.max_daily_trades,
             "trades_remaining": self.limits.max_daily_trades - trade_count,
-            "can_trade": self.check_can_trade()[0],
+            "can_trade": not self._killed and self._check_daily_limits(daily_pnl, trade_count)[0],
         }
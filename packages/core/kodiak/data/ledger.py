@@ -1,13 +1,27 @@
 """Trade ledger for recording all trades."""
 
 import sqlite3
-from dataclasses import dataclass
-from datetime import datetime
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
 
 from kodiak.api.broker import OrderSide, OrderStatus
 
+# Amounts are stored as REAL; SQLite renders them as text (15 significant
+# digits) so rows hydrate straight into Decimal without a Python float detour
+_MONEY_COLUMNS = (
+    "CAST(quantity AS TEXT) AS quantity, CAST(price AS TEXT) AS price, "
+    "CAST(total AS TEXT) AS total"
+)
+
+
+def _epoch_ms(value: datetime) -> int:
+    """Milliseconds since the epoch; naive datetimes are local time, as stored."""
+    return int(value.timestamp() * 1000)
+
 
 @dataclass
 class TradeRecord:
@@ -33,6 +47,64 @@ class TradeRecord:
         return self.side == "sell"
 
 
+@dataclass
+class NewTrade:
+    """A trade to be recorded in the ledger."""
+
+    order_id: str
+    symbol: str
+    side: OrderSide
+    quantity: Decimal
+    price: Decimal
+    status: OrderStatus
+    rule_id: str | None = None
+    timestamp: datetime | None = None
+
+
+@dataclass
+class _TodayTotals:
+    """Today's realized P/L and trade count, folded in trade by trade."""
+
+    day: date
+    last_id: int = 0
+    last_epoch_ms: int = 0
+    trade_count: int = 0
+    total_pnl: Decimal = Decimal("0")
+    pnl: dict[str, Decimal] = field(default_factory=dict)
+    # symbol -> open buy lots (qty, price) in FIFO order
+    lots: dict[str, deque[tuple[Decimal, Decimal]]] = field(default_factory=dict)
+
+    def add(self, symbol: str, side: str, quantity: Decimal, price: Decimal) -> None:
+        """Fold one trade into the totals, matching sells against buys FIFO."""
+        self.trade_count += 1
+        lots = self.lots.setdefault(symbol, deque())
+        self.pnl.setdefault(symbol, Decimal("0"))
+
+        if side == "buy":
+            lots.append((quantity, price))
+            return
+
+        remaining = quantity
+        while remaining > 0 and lots:
+            buy_qty, buy_price = lots[0]
+            sell_qty = min(remaining, buy_qty)
+
+            # P/L for this portion
+            realized = sell_qty * (price - buy_price)
+            self.pnl[symbol] += realized
+            self.total_pnl += realized
+
+            remaining -= sell_qty
+            if sell_qty >= buy_qty:
+                lots.popleft()
+            else:
+                lots[0] = (buy_qty - sell_qty, buy_price)
+
+
+# Untracked runtime file (see .gitignore); tests point this at a temp dir
+DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "trades.db"
+
+
 class TradeLedger:
     """SQLite-backed trade ledger."""
 
@@ -43,15 +115,28 @@ class TradeLedger:
             db_path: Path to SQLite database. If None, uses default location.
         """
         if db_path is None:
-            db_path = Path(__file__).parent.parent.parent / "data" / "trades.db"
+            db_path = DEFAULT_DB_PATH
 
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
+        self._today: _TodayTotals | None = None
+        # (data_version, total_changes) when today's totals were last brought up to date
+        self._today_version: tuple[int, int] | None = None
+        # One connection per ledger, shared across threads under this lock
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
         self._init_db()
 
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
+            # WAL lets readers (CLI, MCP server) run alongside the engine's
+            # writes, and synchronous=NORMAL fsyncs at checkpoints, not per commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-20000")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS trades (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -64,16 +149,51 @@ class TradeLedger:
                     status TEXT NOT NULL,
                     rule_id TEXT,
                     timestamp TEXT NOT NULL,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    epoch_ms INTEGER
                 )
             """)
+            # Time filters and ordering use epoch_ms; the ISO timestamp is kept for display
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(trades)")}
+            if "epoch_ms" not in columns:
+                conn.execute("ALTER TABLE trades ADD COLUMN epoch_ms INTEGER")
+                conn.executemany(
+                    "UPDATE trades SET epoch_ms = ? WHERE id = ?",
+                    [
+                        (_epoch_ms(datetime.fromisoformat(ts)), row_id)
+                        for row_id, ts in conn.execute("SELECT id, timestamp FROM trades")
+                    ],
+                )
+            has_indexes = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_trades_epoch'"
+            ).fetchone()
+            # Per-symbol history: symbol filter plus time order in one index
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)
+                CREATE INDEX IF NOT EXISTS idx_trades_symbol_epoch ON trades(symbol, epoch_ms)
             """)
+            # Covers the today's-P/L scan (rowid is implicit), so it never touches the table
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp)
+                CREATE INDEX IF NOT EXISTS idx_trades_epoch
+                ON trades(epoch_ms, symbol, side, quantity, price)
             """)
-            conn.commit()
+            # Superseded by the two indexes above
+            for old_index in (
+                "idx_trades_symbol",
+                "idx_trades_timestamp",
+                "idx_trades_symbol_time",
+                "idx_trades_today_cover",
+            ):
+                conn.execute(f"DROP INDEX IF EXISTS {old_index}")
+            if not has_indexes:
+                conn.execute("ANALYZE")
+
+    def close(self) -> None:
+        """Close the database connection, letting SQLite refresh planner stats first."""
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA optimize")
+            finally:
+                self._conn.close()
 
     def record_trade(
         self,
@@ -101,31 +221,66 @@ class TradeLedger:
         Returns:
             Trade record ID.
         """
-        if timestamp is None:
-            timestamp = datetime.now()
+        return self.record_trades_batch(
+            [
+                NewTrade(
+                    order_id=order_id,
+                    symbol=symbol,
+                    side=side,
+                    quantity=quantity,
+                    price=price,
+                    status=status,
+                    rule_id=rule_id,
+                    timestamp=timestamp,
+                )
+            ]
+        )[0]
 
-        total = quantity * price
+    def record_trades_batch(self, trades: list[NewTrade]) -> list[int]:
+        """Record several trades in one transaction.
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO trades (order_id, symbol, side, quantity, price, total, status, rule_id, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        Args:
+            trades: Trades to record, in order.
+
+        Returns:
+            Trade record IDs, in the same order.
+        """
+        if not trades:
+            return []
+
+        now = datetime.now()
+        rows = []
+        for t in trades:
+            timestamp = t.timestamp or now
+            rows.append(
                 (
-                    order_id,
-                    symbol,
-                    side.value,
-                    float(quantity),
-                    float(price),
-                    float(total),
-                    status.value,
-                    rule_id,
+                    t.order_id,
+                    t.symbol,
+                    t.side.value,
+                    float(t.quantity),
+                    float(t.price),
+                    float(t.quantity * t.price),
+                    t.status.value,
+                    t.rule_id,
                     timestamp.isoformat(),
-                ),
+                    _epoch_ms(timestamp),
+                )
             )
-            conn.commit()
-            return cursor.lastrowid or 0
+
+        with self._lock, self._conn as conn:
+            conn.executemany(
+                """
+                INSERT INTO trades (
+                    order_id, symbol, side, quantity, price, total, status, rule_id,
+                    timestamp, epoch_ms
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            # The transaction holds the write lock, so the new ids are contiguous
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
 
     def get_trades(
         self,
@@ -143,23 +298,9 @@ class TradeLedger:
         Returns:
             List of trade records.
         """
-        query = "SELECT id, order_id, symbol, side, quantity, price, total, status, rule_id, timestamp FROM trades WHERE 1=1"
-        params: list = []
-
-        if symbol:
-            query += " AND symbol = ?"
-            params.append(symbol)
-
-        if since:
-            query += " AND timestamp >= ?"
-            params.append(since.isoformat())
-
-        query += " ORDER BY timestamp DESC LIMIT ?"
-        params.append(limit)
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
+        query, params = self._trades_query(symbol, since, limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
 
         return [
             TradeRecord(
@@ -167,9 +308,9 @@ class TradeLedger:
                 order_id=row[1],
                 symbol=row[2],
                 side=row[3],
-                quantity=Decimal(str(row[4])),
-                price=Decimal(str(row[5])),
-                total=Decimal(str(row[6])),
+                quantity=Decimal(row[4]),
+                price=Decimal(row[5]),
+                total=Decimal(row[6]),
                 status=row[7],
                 rule_id=row[8],
                 timestamp=datetime.fromisoformat(row[9]),
@@ -177,6 +318,26 @@ class TradeLedger:
             for row in rows
         ]
 
+    @staticmethod
+    def _trades_query(
+        symbol: str | None, since: datetime | None, limit: int
+    ) -> tuple[str, list]:
+        """Build the trade-records query, newest first."""
+        query = f"SELECT id, order_id, symbol, side, {_MONEY_COLUMNS}, status, rule_id, timestamp FROM trades WHERE 1=1"
+        params: list = []
+
+        if symbol:
+            query += " AND symbol = ?"
+            params.append(symbol)
+
+        if since:
+            query += " AND epoch_ms >= ?"
+            params.append(_epoch_ms(since))
+
+        query += " ORDER BY epoch_ms DESC LIMIT ?"
+        params.append(limit)
+        return query, params
+
     def get_today_trades(self) -> list[TradeRecord]:
         """Get all trades from today."""
         today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -188,49 +349,85 @@ class TradeLedger:
         Returns:
             Dict mapping symbol to realized P/L.
         """
-        trades = self.get_today_trades()
-        pnl: dict[str, Decimal] = {}
-
-        # Track cost basis per symbol
-        positions: dict[str, list[tuple[Decimal, Decimal]]] = {}  # symbol -> [(qty, price), ...]
-
-        for trade in sorted(trades, key=lambda t: t.timestamp):
-            symbol = trade.symbol
-
-            if symbol not in positions:
-                positions[symbol] = []
-            if symbol not in pnl:
-                pnl[symbol] = Decimal("0")
-
-            if trade.is_buy:
-                # Add to position
-                positions[symbol].append((trade.quantity, trade.price))
-            else:
-                # Sell - calculate P/L using FIFO
-                remaining = trade.quantity
-                while remaining > 0 and positions[symbol]:
-                    buy_qty, buy_price = positions[symbol][0]
-                    sell_qty = min(remaining, buy_qty)
-
-                    # P/L for this portion
-                    pnl[symbol] += sell_qty * (trade.price - buy_price)
-
-                    remaining -= sell_qty
-                    if sell_qty >= buy_qty:
-                        positions[symbol].pop(0)
-                    else:
-                        positions[symbol][0] = (buy_qty - sell_qty, buy_price)
-
-        return pnl
+        return dict(self._refresh_today().pnl)
 
     def get_total_today_pnl(self) -> Decimal:
         """Get total realized P/L for today."""
-        pnl = self.get_today_pnl()
-        return sum(pnl.values(), Decimal("0"))
+        return self._refresh_today().total_pnl
+
+    def get_today_stats(self) -> tuple[Decimal, int]:
+        """Get today's total realized P/L and trade count from one refresh.
+
+        Returns:
+            Tuple of (total realized P/L, trade count).
+        """
+        totals = self._refresh_today()
+        return totals.total_pnl, totals.trade_count
 
     def get_trade_count_today(self) -> int:
         """Get number of trades today."""
-        return len(self.get_today_trades())
+        return self._refresh_today().trade_count
+
+    def _refresh_today(self) -> _TodayTotals:
+        """Bring today's totals up to date and return them.
+
+        Only trades added since the last call are read, so repeated safety
+        checks cost one indexed query instead of re-scanning the whole day.
+        Trades recorded by other processes are picked up the same way. The
+        totals are rebuilt from scratch at midnight, or if a trade arrives
+        timestamped before ones already folded in (FIFO order would differ).
+        If neither this connection nor any other has written since the last
+        refresh, the cached totals are returned without querying the table.
+        """
+        now = datetime.now()
+        today_start = _epoch_ms(now.replace(hour=0, minute=0, second=0, microsecond=0))
+
+        with self._lock:
+            totals = self._today
+            if totals is None or totals.day != now.date():
+                totals = _TodayTotals(day=now.date())
+
+            with self._conn as conn:
+                # data_version moves on commits from other connections,
+                # total_changes on writes through this one
+                version = (
+                    conn.execute("PRAGMA data_version").fetchone()[0],
+                    conn.total_changes,
+                )
+                if totals is self._today and version == self._today_version:
+                    return totals
+
+                rows = conn.execute(
+                    """
+                    SELECT id, symbol, side, CAST(quantity AS TEXT), CAST(price AS TEXT), epoch_ms
+                    FROM trades
+                    WHERE id > ? AND epoch_ms >= ?
+                    ORDER BY epoch_ms, id
+                    """,
+                    (totals.last_id, today_start),
+                ).fetchall()
+
+                if rows and rows[0][5] < totals.last_epoch_ms:
+                    totals = _TodayTotals(day=now.date())
+                    rows = conn.execute(
+                        """
+                        SELECT id, symbol, side, CAST(quantity AS TEXT), CAST(price AS TEXT),
+                               epoch_ms
+                        FROM trades
+                        WHERE epoch_ms >= ?
+                        ORDER BY epoch_ms, id
+                        """,
+                        (today_start,),
+                    ).fetchall()
+
+            for row_id, symbol, side, quantity, price, epoch_ms in rows:
+                totals.add(symbol, side, Decimal(quantity), Decimal(price))
+                totals.last_id = max(totals.last_id, row_id)
+                totals.last_epoch_ms = epoch_ms
+
+            self._today = totals
+            self._today_version = version
+            return totals
 
     def export_csv(self, path: Path, since: datetime | None = None) -> int:
         """Export trades to CSV.
@@ -242,14 +439,12 @@ class TradeLedger:
         Returns:
             Number of records exported.
         """
-        trades = self.get_trades(since=since, limit=100000)
-
-        with open(path, "w") as f:
-            f.write("id,order_id,symbol,side,quantity,price,total,status,rule_id,timestamp\n")
-            for t in trades:
-                f.write(
-                    f"{t.id},{t.order_id},{t.symbol},{t.side},{t.quantity},{t.price},"
-                    f"{t.total},{t.status},{t.rule_id or ''},{t.timestamp.isoformat()}\n"
-                )
+        import pandas as pd
+
+        query, params = self._trades_query(None, since, 100000)
+        with self._lock:
+            df = pd.read_sql_query(query, self._conn, params=params)
 
-        return len(trades)
+        # Columns are written as stored; timestamps are already ISO strings
+        df.to_csv(path, index=False)
+        return len(df)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pandas as pd
@@ -17,6 +18,10 @@ from kodiak.utils.logging import get_logger
 
 _EASTERN_TZ = pytz.timezone("US/Eastern")
 
+# Symbols per bars request, and how many such requests run at once
+MAX_SYMBOLS_PER_REQUEST = 200
+MAX_CONCURRENT_REQUESTS = 4
+
 
 class AlpacaDataProvider(DataProvider):
     """Fetch historical OHLCV data from Alpaca."""
@@ -40,30 +45,49 @@ class AlpacaDataProvider(DataProvider):
         if start > end:
             raise ValueError("start date must be <= end date")
 
-        request = StockBarsRequest(
-            symbol_or_symbols=symbols,
-            start=start,
-            end=end,
-            timeframe=_to_alpaca_timeframe(timeframe),
-            feed=self.feed,
-        )
-
-        response = self.client.get_stock_bars(request)
-        df = response.df
-
-        if df is None or df.empty:
+        chunks = [
+            symbols[i : i + MAX_SYMBOLS_PER_REQUEST]
+            for i in range(0, len(symbols), MAX_SYMBOLS_PER_REQUEST)
+        ]
+        if len(chunks) == 1:
+            frames = [self._fetch_bars(chunks[0], start, end, timeframe)]
+        else:
+            # The client shares one HTTP session; chunks overlap network round-trips
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(chunks))) as pool:
+                frames = list(
+                    pool.map(lambda chunk: self._fetch_bars(chunk, start, end, timeframe), chunks)
+                )
+
+        frames = [f for f in frames if f is not None and not f.empty]
+        if not frames:
             raise ValueError("No data returned from Alpaca for requested symbols/date range")
+        df = frames[0] if len(frames) == 1 else pd.concat(frames)
 
-        result = _split_bars(df, symbols)
+        # Normalize the combined frame once, then hand out per-symbol slices
+        result = _split_bars(_normalize_bars(df, symbols), symbols)
         missing = [symbol for symbol in symbols if symbol not in result]
         if missing:
             raise ValueError(f"No Alpaca data returned for symbols: {', '.join(missing)}")
 
-        for symbol, bars in result.items():
-            result[symbol] = _normalize_bars(bars, symbol)
-
         return result
 
+    def _fetch_bars(
+        self,
+        symbols: list[str],
+        start: datetime,
+        end: datetime,
+        timeframe: TimeFrame,
+    ) -> pd.DataFrame | None:
+        """Fetch bars for up to MAX_SYMBOLS_PER_REQUEST symbols in one request."""
+        request = StockBarsRequest(
+            symbol_or_symbols=symbols,
+            start=start,
+            end=end,
+            timeframe=_to_alpaca_timeframe(timeframe),
+            feed=self.feed,
+        )
+        return self.client.get_stock_bars(request).df
+
 
 def _to_alpaca_timeframe(timeframe: TimeFrame) -> AlpacaTimeFrame:
     if timeframe == TimeFrame.DAY_1:
@@ -81,13 +105,10 @@ def _to_alpaca_timeframe(timeframe: TimeFrame) -> AlpacaTimeFrame:
 
 def _split_bars(df: pd.DataFrame, symbols: Iterable[str]) -> dict[str, pd.DataFrame]:
     if "symbol" in df.index.names:
-        reset = df.reset_index()
-        result: dict[str, pd.DataFrame] = {}
-        for symbol, group in reset.groupby("symbol"):
-            group = group.drop(columns=["symbol"])
-            group = group.set_index("timestamp")
-            result[symbol] = group
-        return result
+        return {
+            symbol: df.xs(symbol, level="symbol")
+            for symbol in df.index.unique(level="symbol")
+        }
 
     symbol_list = list(symbols)
     if len(symbol_list) != 1:
@@ -95,28 +116,49 @@ def _split_bars(df: pd.DataFrame, symbols: Iterable[str]) -> dict[str, pd.DataFr
     return {symbol_list[0]: df}
 
 
-def _normalize_bars(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+def _normalize_bars(df: pd.DataFrame, symbols: list[str]) -> pd.DataFrame:
+    """Normalize a bars response, indexed by timestamp or by (symbol, timestamp).
+
+    Columns are lower-cased, cut to OHLCV and cast to float64, rows sorted,
+    and timestamps converted to US/Eastern, all on the whole response so the
+    per-symbol frames split from it need no further work.
+    """
     if "timestamp" in df.columns:
         df = df.set_index("timestamp")
 
     df = df.rename(columns=str.lower)
+    label = ", ".join(symbols)
 
     required = ["open", "high", "low", "close", "volume"]
     missing = [col for col in required if col not in df.columns]
     if missing:
-        raise ValueError(f"Alpaca data for {symbol} missing columns: {missing}")
+        raise ValueError(f"Alpaca data for {label} missing columns: {missing}")
 
-    df = df[required].copy()
-    df = df.sort_index()
+    # Under copy-on-write, columns that are already float64 are not copied
+    df = df[required].astype("float64")
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
 
-    if df.index.tz is None:
-        df.index = df.index.tz_localize("UTC").tz_convert(_EASTERN_TZ)
+    if isinstance(df.index, pd.MultiIndex):
+        # Only the distinct timestamps in the level are converted
+        level = df.index.levels[df.index.names.index("timestamp")]
+        df.index = df.index.set_levels(_to_eastern(level), level="timestamp")
     else:
-        df.index = df.index.tz_convert(_EASTERN_TZ)
+        df.index = _to_eastern(df.index)
 
-    df = df.astype("float64")
-
-    if df.isnull().any().any():
-        raise ValueError(f"Alpaca data for {symbol} contains NaN values")
+    # One pass over the float64 block; per-column detail only on failure
+    if pd.isna(df.to_numpy()).any():
+        nan_columns = df.columns[df.isna().any()].tolist()
+        if isinstance(df.index, pd.MultiIndex):
+            rows = df.isna().any(axis=1)
+            label = ", ".join(df.index[rows].unique(level="symbol"))
+        raise ValueError(f"Alpaca data for {label} contains NaN values in {nan_columns}")
 
     return df
+
+
+def _to_eastern(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Convert a bar timestamp index to US/Eastern; naive timestamps are UTC."""
+    if index.tz is None:
+        index = pd.DatetimeIndex(index.values, tz="UTC", name=index.name)
+    return index.tz_convert(_EASTERN_TZ)
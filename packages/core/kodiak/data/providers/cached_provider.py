@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import json
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -11,22 +15,88 @@ import pandas as pd
 from kodiak.data.providers.base import DataProvider, TimeFrame
 from kodiak.utils.logging import get_logger
 
+# Parquet reads/writes release the GIL in pyarrow, so a few threads overlap I/O
+MAX_IO_WORKERS = 8
+
+# zstd packs float OHLCV columns noticeably smaller than snappy at similar decode
+# speed; statistics per row group let filtered reads skip groups outside a range
+PARQUET_WRITE_OPTIONS = {
+    "engine": "pyarrow",
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 50_000,
+    "write_statistics": True,
+}
+
 
 @dataclass(frozen=True)
-class CacheKey:
-    symbol: str
+class CoveredRange:
+    """A range of bars fetched in one request (UTC, inclusive) and when."""
+
     start: datetime
     end: datetime
-    timeframe: TimeFrame
+    fetched_at: float  # POSIX timestamp
+
+
+@dataclass(frozen=True)
+class Coverage:
+    """Ranges a symbol's cache file holds bars for, sorted by start."""
+
+    ranges: tuple[CoveredRange, ...] = ()
+
+    def fresh(self, now: float, ttl_seconds: float) -> Coverage:
+        """Only the ranges fetched within the TTL (all of them if it is 0)."""
+        if ttl_seconds <= 0:
+            return self
+        return Coverage(tuple(r for r in self.ranges if now - r.fetched_at <= ttl_seconds))
 
-    def filename(self) -> str:
-        start_str = self.start.strftime("%Y%m%dT%H%M%S")
-        end_str = self.end.strftime("%Y%m%dT%H%M%S")
-        return f"{self.symbol}_{self.timeframe.value}_{start_str}_{end_str}.parquet"
+    def add(self, start: datetime, end: datetime, fetched_at: float) -> Coverage:
+        """Record a fetched range, replacing the parts of older ranges it overlaps."""
+        kept = []
+        for r in self.ranges:
+            if r.end < start or r.start > end:
+                kept.append(r)
+                continue
+            if r.start < start:
+                kept.append(CoveredRange(r.start, start, r.fetched_at))
+            if r.end > end:
+                kept.append(CoveredRange(end, r.end, r.fetched_at))
+        kept.append(CoveredRange(start, end, fetched_at))
+        return Coverage(tuple(sorted(kept, key=lambda r: r.start)))
+
+    def gaps(self, start: datetime, end: datetime) -> list[tuple[datetime, datetime]]:
+        """Ranges of [start, end] not yet covered.
+
+        Gaps are widened to touch the neighbouring covered ranges; boundary
+        bars fetched twice are de-duplicated.
+        """
+        if start == end:
+            covered = any(r.start <= start <= r.end for r in self.ranges)
+            return [] if covered else [(start, end)]
+        gaps = []
+        cursor = start
+        for r in self.ranges:
+            if r.end < cursor:
+                continue
+            if r.start > end:
+                break
+            if r.start > cursor:
+                gaps.append((cursor, r.start))
+            cursor = max(cursor, r.end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
 
 
 class CachedDataProvider(DataProvider):
-    """Wrap another data provider with Parquet caching."""
+    """Wrap another data provider with Parquet caching.
+
+    Bars are stored as one Parquet file per (symbol, timeframe) holding the
+    union of all ranges fetched so far. A JSON sidecar lists the covered
+    ranges and when each was fetched. Requests are trimmed from that file,
+    and only the parts of a range not covered by a range fetched within the
+    TTL are fetched from the wrapped provider.
+    """
 
     def __init__(
         self,
@@ -49,38 +119,134 @@ class CachedDataProvider(DataProvider):
         if not symbols:
             raise ValueError("symbols list cannot be empty")
 
-        cached: dict[str, pd.DataFrame] = {}
-        missing: list[str] = []
+        start_utc, end_utc = _to_utc(start), _to_utc(end)
+        now = time.time()
+        ttl_seconds = self.ttl_minutes * 60
 
+        coverage: dict[str, Coverage | None] = {}
+        # Symbols needing the same upstream range are fetched in one request
+        fetch_plan: dict[tuple[datetime, datetime], list[str]] = {}
         for symbol in symbols:
-            cache_path = self._cache_path(CacheKey(symbol, start, end, timeframe))
-            if self._is_cache_valid(cache_path):
-                cached[symbol] = _read_parquet(cache_path)
-            else:
-                missing.append(symbol)
-
-        if missing:
-            fetched = self.provider.get_bars(missing, start, end, timeframe)
-            for symbol, df in fetched.items():
-                cache_path = self._cache_path(CacheKey(symbol, start, end, timeframe))
-                cache_path.parent.mkdir(parents=True, exist_ok=True)
-                _write_parquet(cache_path, df)
-            cached.update(fetched)
-
-        return cached
-
-    def _cache_path(self, key: CacheKey) -> Path:
-        safe_symbol = key.symbol.replace("/", "_")
-        return self.cache_dir / safe_symbol / key.filename()
-
-    def _is_cache_valid(self, path: Path) -> bool:
-        if not path.exists():
-            return False
-        if self.ttl_minutes <= 0:
-            return True
-        mtime = datetime.fromtimestamp(path.stat().st_mtime, tz=UTC)
-        age_seconds = (datetime.now(UTC) - mtime).total_seconds()
-        return age_seconds <= self.ttl_minutes * 60
+            cov = _read_coverage(self._cache_path(symbol, timeframe))
+            coverage[symbol] = cov
+            fresh = cov.fresh(now, ttl_seconds) if cov else Coverage()
+            for gap in fresh.gaps(start_utc, end_utc):
+                fetch_plan.setdefault(gap, []).append(symbol)
+
+        cached_symbols = [s for s in symbols if coverage[s] is not None]
+        stored = dict(
+            zip(
+                cached_symbols,
+                _map_io(_read_parquet, [self._cache_path(s, timeframe) for s in cached_symbols]),
+            )
+        )
+
+        fetched: dict[str, list[pd.DataFrame]] = {}
+        fetched_gaps: dict[str, list[tuple[datetime, datetime]]] = {}
+        for gap, gap_symbols in fetch_plan.items():
+            try:
+                bars = self.provider.get_bars(gap_symbols, *gap, timeframe)
+            except ValueError:
+                # An uncovered edge can legitimately hold no bars (weekend, holiday);
+                # it stays uncovered, so a transient failure is retried next time
+                if any(coverage[s] is None for s in gap_symbols):
+                    raise
+                self.logger.debug(f"No bars for {gap_symbols} in {gap[0]} - {gap[1]}")
+                continue
+            for symbol, df in bars.items():
+                fetched.setdefault(symbol, []).append(df)
+                fetched_gaps.setdefault(symbol, []).append(gap)
+
+        updates = []
+        for symbol, gaps in fetched_gaps.items():
+            frames = ([stored[symbol]] if symbol in stored else []) + fetched[symbol]
+            merged = _merge(frames)
+            stored[symbol] = merged
+            # Expired ranges are dropped; their bars are replaced when refetched
+            cov = coverage.get(symbol)
+            new_cov = cov.fresh(now, ttl_seconds) if cov else Coverage()
+            for gap_start, gap_end in gaps:
+                new_cov = new_cov.add(gap_start, gap_end, now)
+            updates.append((self._cache_path(symbol, timeframe), merged, new_cov))
+
+        if updates:
+            for path, _, _ in updates:
+                path.parent.mkdir(parents=True, exist_ok=True)
+            _map_io(_write_cache, *map(list, zip(*updates)))
+
+        return {
+            symbol: _trim(stored[symbol], start_utc, end_utc)
+            for symbol in symbols
+            if symbol in stored
+        }
+
+    def _cache_path(self, symbol: str, timeframe: TimeFrame) -> Path:
+        safe_symbol = symbol.replace("/", "_")
+        return self.cache_dir / safe_symbol / f"{timeframe.value}.parquet"
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Normalize a request bound; naive datetimes are taken as UTC, like Alpaca does."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _merge(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Combine bar frames, later frames winning on duplicate timestamps."""
+    df = pd.concat(frames) if len(frames) > 1 else frames[0]
+    return df[~df.index.duplicated(keep="last")].sort_index()
+
+
+def _trim(df: pd.DataFrame, start: datetime, end: datetime) -> pd.DataFrame:
+    """Slice a sorted bar frame to [start, end] (UTC bounds) by binary search."""
+    if df.index.tz is None:
+        start, end = start.replace(tzinfo=None), end.replace(tzinfo=None)
+    return df.loc[start:end]
+
+
+def _coverage_path(path: Path) -> Path:
+    return path.with_suffix(".json")
+
+
+def _read_coverage(path: Path) -> Coverage | None:
+    """Read a cache file's covered ranges, or None if it has no usable cache."""
+    try:
+        mtime = path.stat().st_mtime
+        data = json.loads(_coverage_path(path).read_text())
+        if "ranges" not in data:
+            # Single-range sidecar from before per-range fetch times; the file
+            # was last written when that range was last extended
+            data = {"ranges": [{**data, "fetched_at": mtime}]}
+        ranges = (
+            CoveredRange(
+                start=datetime.fromisoformat(r["start"]),
+                end=datetime.fromisoformat(r["end"]),
+                fetched_at=float(r["fetched_at"]),
+            )
+            for r in data["ranges"]
+        )
+        return Coverage(tuple(sorted(ranges, key=lambda r: r.start)))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(path: Path, df: pd.DataFrame, coverage: Coverage) -> None:
+    _write_parquet(path, df)
+    ranges = [
+        {"start": r.start.isoformat(), "end": r.end.isoformat(), "fetched_at": r.fetched_at}
+        for r in coverage.ranges
+    ]
+    _coverage_path(path).write_text(json.dumps({"ranges": ranges}))
+
+
+def _map_io(fn: Callable[..., object], *iterables: list) -> list:
+    """Run a Parquet I/O function over the inputs, in parallel when there are several."""
+    count = len(iterables[0])
+    if count < 2:
+        return list(map(fn, *iterables))
+    with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, count)) as pool:
+        return list(pool.map(fn, *iterables))
 
 
 def _read_parquet(path: Path) -> pd.DataFrame:
@@ -93,8 +259,9 @@ def _read_parquet(path: Path) -> pd.DataFrame:
 
 
 def _write_parquet(path: Path, df: pd.DataFrame) -> None:
+    """Write bars, which callers pass already sorted by `_merge`."""
     try:
-        df.to_parquet(path, index=True)
+        df.to_parquet(path, index=True, **PARQUET_WRITE_OPTIONS)
     except ImportError as exc:
         raise ImportError(
             "Parquet caching requires pyarrow. Install with `pip install pyarrow`."
@@ -1,15 +1,30 @@
 """CSV file data provider for historical market data."""
 
+import functools
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 import pandas as pd
-import pytz
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 from kodiak.data.providers.base import DataProvider, TimeFrame
+from kodiak.data.providers.cached_provider import PARQUET_WRITE_OPTIONS
 from kodiak.utils.logging import get_logger
 
-_EASTERN_TZ = pytz.timezone("US/Eastern")
+_EASTERN_TZ = ZoneInfo("US/Eastern")
+
+# Parsed CSVs kept in memory across provider instances (e.g. an optimizer sweep)
+MAX_CACHED_FILES = 128
+
+logger = get_logger("trader.data.csv")
+
+# Declared up front so Arrow's multi-threaded reader skips type inference
+_CSV_COLUMN_TYPES = {col: pa.float64() for col in ("open", "high", "low", "close", "volume")}
 
 
 class CSVDataProvider(DataProvider):
@@ -24,15 +39,22 @@ class CSVDataProvider(DataProvider):
         2024-01-02 09:30:00,176.20,177.00,175.50,176.80,1200000
 
     Currently supports daily bars only (1Day timeframe).
+
+    Parsed frames are kept in a process-wide LRU cache keyed by (path, mtime).
+    With a `cache_dir`, each CSV version is also stored as a Parquet sidecar
+    there, so later processes skip parsing; the data directory is never
+    written to.
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, cache_dir: Path | None = None):
         """Initialize CSV data provider.
 
         Args:
             data_dir: Directory containing CSV files (e.g., "data/historical").
+            cache_dir: Optional app cache directory for Parquet sidecars.
         """
         self.data_dir = Path(data_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self.logger = get_logger("trader.data.csv")
 
     def get_bars(
@@ -76,31 +98,57 @@ class CSVDataProvider(DataProvider):
                 f"Data directory not found: {self.data_dir}. {suggestion}"
             )
 
-        # Load data for each symbol
-        result = {}
-        for symbol in symbols:
-            csv_file = self.data_dir / f"{symbol}.csv"
-
-            # Load and filter CSV
-            self.logger.debug(f"Loading {symbol} from {csv_file}")
-            df = self._load_file(csv_file)
-            df = df[(df.index >= start) & (df.index <= end)]
-
-            if df.empty:
-                raise ValueError(
-                    f"No data found for {symbol} in date range "
-                    f"{start.date()} to {end.date()}. "
-                    f"Check that {csv_file} contains data in this range."
+        # Parsing releases the GIL in pyarrow, so symbols load in parallel
+        symbols = list(dict.fromkeys(symbols))
+        if len(symbols) < 2:
+            frames = [self._load_symbol(symbol, start, end) for symbol in symbols]
+        else:
+            workers = min(len(symbols), os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                frames = list(
+                    pool.map(lambda symbol: self._load_symbol(symbol, start, end), symbols)
                 )
+        return dict(zip(symbols, frames))
+
+    def _load_symbol(self, symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        """Load one symbol's bars in [start, end], failing if there are none."""
+        csv_file = self.data_dir / f"{symbol}.csv"
+
+        self.logger.debug(f"Loading {symbol} from {csv_file}")
+        df = self._load_range(csv_file, start, end)
+
+        if df.empty:
+            raise ValueError(
+                f"No data found for {symbol} in date range "
+                f"{start.date()} to {end.date()}. "
+                f"Check that {csv_file} contains data in this range."
+            )
+
+        self.logger.info(f"Loaded {len(df)} bars for {symbol}")
+        return df
 
-            self.logger.info(f"Loaded {len(df)} bars for {symbol}")
-            result[symbol] = df
+    def _load_range(self, file_path: Path, start: datetime, end: datetime) -> pd.DataFrame:
+        """Load bars in [start, end] for one CSV.
 
-        return result
+        Args:
+            file_path: Path to CSV file.
+            start: Start datetime (inclusive).
+            end: End datetime (inclusive).
+
+        Returns:
+            DataFrame with DatetimeIndex and OHLCV columns.
+        """
+        # Label slicing is a binary search on the sorted index, not a full mask.
+        # The copy keeps callers from editing the cached frame in place, which
+        # pandas before copy-on-write would let leak into every later load.
+        return self._load_file(file_path).loc[_as_eastern(start) : _as_eastern(end)].copy()
 
     def _load_file(self, file_path: Path) -> pd.DataFrame:
         """Load and validate a single CSV file.
 
+        Parsed frames are cached in memory per (path, mtime), so repeated
+        loads of an unchanged file skip parsing entirely.
+
         Args:
             file_path: Path to CSV file.
 
@@ -111,7 +159,9 @@ class CSVDataProvider(DataProvider):
             FileNotFoundError: If file doesn't exist.
             ValueError: If CSV format is invalid.
         """
-        if not file_path.exists():
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
             default_dir = Path.home() / ".kodiak" / "data" / "historical"
             suggestion = (
                 f"Expected format: {self.data_dir}/{{SYMBOL}}.csv. "
@@ -121,43 +171,115 @@ class CSVDataProvider(DataProvider):
             )
             raise FileNotFoundError(
                 f"CSV file not found: {file_path}. {suggestion}"
-            )
+            ) from None
+        sidecar_dir = None
+        if self.cache_dir is not None:
+            sidecar_dir = self.cache_dir / "csv" / _path_key(file_path)
+        return _load_bars(file_path, mtime_ns, sidecar_dir)
+
+
+def _path_key(file_path: Path) -> str:
+    """Stable directory name for one CSV path's sidecars."""
+    resolved = str(file_path.resolve())
+    return hashlib.sha1(resolved.encode(), usedforsecurity=False).hexdigest()[:16]
+
+
+def _as_eastern(value: datetime) -> pd.Timestamp:
+    """Coerce a range bound to the index's zone; naive values are Eastern, like the CSVs."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        return ts.tz_localize(_EASTERN_TZ)
+    return ts.tz_convert(_EASTERN_TZ)
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_FILES)
+def _load_bars(file_path: Path, mtime_ns: int, sidecar_dir: Path | None) -> pd.DataFrame:
+    """Load all bars for one version of a CSV, from its Parquet sidecar if present.
 
+    Args:
+        file_path: Path to CSV file.
+        mtime_ns: CSV modification time; part of the cache key so edits reload.
+        sidecar_dir: Cache directory for this CSV's sidecars, or None for none.
+
+    Returns:
+        DataFrame with DatetimeIndex and OHLCV columns.
+    """
+    if sidecar_dir is None:
+        return _parse_csv(file_path)
+
+    sidecar = sidecar_dir / f"{mtime_ns}.parquet"
+    if sidecar.exists():
         try:
-            df = pd.read_csv(file_path, parse_dates=["timestamp"])
+            return pd.read_parquet(sidecar, engine="pyarrow")
         except Exception as e:
-            raise ValueError(f"Failed to read CSV file {file_path}: {e}")
+            logger.debug(f"Ignoring unreadable sidecar {sidecar}: {e}")
 
-        # Validate required columns
-        required_columns = ["timestamp", "open", "high", "low", "close", "volume"]
-        missing_columns = set(required_columns) - set(df.columns)
-        if missing_columns:
-            raise ValueError(
-                f"CSV {file_path.name} missing required columns: {missing_columns}. "
-                f"Expected columns: {required_columns}"
-            )
+    df = _parse_csv(file_path)
+    try:
+        sidecar_dir.mkdir(parents=True, exist_ok=True)
+        # Sidecars of earlier versions of this CSV are never read again
+        for stale in sidecar_dir.glob("*.parquet"):
+            stale.unlink(missing_ok=True)
+        df.to_parquet(sidecar, index=True, **PARQUET_WRITE_OPTIONS)
+    except (OSError, ImportError) as e:
+        logger.debug(f"Could not write sidecar {sidecar}: {e}")
+    return df
 
-        # Set timestamp as index
-        df = df.set_index("timestamp")
 
-        # Ensure timezone-aware index (US/Eastern preferred)
-        if df.index.tz is None:
-            df.index = df.index.tz_localize(_EASTERN_TZ)
-        else:
-            df.index = df.index.tz_convert(_EASTERN_TZ)
+def _parse_csv(file_path: Path) -> pd.DataFrame:
+    """Parse and validate a CSV file of OHLCV bars.
 
-        # Sort by timestamp
+    Raises:
+        ValueError: If CSV format is invalid.
+    """
+    try:
+        table = pacsv.read_csv(
+            file_path,
+            convert_options=pacsv.ConvertOptions(column_types=_CSV_COLUMN_TYPES),
+        )
+    except Exception as e:
+        raise ValueError(f"Failed to read CSV file {file_path}: {e}")
+    df = table.to_pandas(self_destruct=True)
+    del table
+
+    # Validate required columns
+    required_columns = ["timestamp", "open", "high", "low", "close", "volume"]
+    missing_columns = set(required_columns) - set(df.columns)
+    if missing_columns:
+        raise ValueError(
+            f"CSV {file_path.name} missing required columns: {missing_columns}. "
+            f"Expected columns: {required_columns}"
+        )
+
+    # Arrow parses ISO 8601 timestamps itself; anything else falls back to pandas
+    if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+
+    # Set timestamp as index
+    df = df.set_index("timestamp")
+
+    # Ensure timezone-aware index (US/Eastern preferred)
+    if df.index.tz is None:
+        df.index = df.index.tz_localize(_EASTERN_TZ)
+    else:
+        df.index = df.index.tz_convert(_EASTERN_TZ)
+
+    # Sort by timestamp; exported history is usually already in order
+    if not df.index.is_monotonic_increasing:
         df = df.sort_index()
 
-        # Normalize column casing and dtype
-        df = df.rename(columns=str.lower)
+    # Normalize column casing and dtype; OHLCV is already float64 from the reader,
+    # so only extra columns ever need a cast (which copies on pandas < 3)
+    df.columns = df.columns.str.lower()
+    if not (df.dtypes == "float64").all():
         df = df.astype("float64")
 
-        # Validate data quality
-        if df.isnull().any().any():
-            raise ValueError(f"CSV {file_path.name} contains NaN values")
+    # Validate data quality
+    if pd.isna(df.to_numpy()).any():
+        nan_columns = df.columns[df.isna().any()].tolist()
+        raise ValueError(f"CSV {file_path.name} contains NaN values in {nan_columns}")
 
-        if df.empty:
-            raise ValueError(f"CSV {file_path.name} is empty")
+    if df.empty:
+        raise ValueError(f"CSV {file_path.name} is empty")
 
-        return df
+    return df
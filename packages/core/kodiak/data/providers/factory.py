@@ -50,7 +50,7 @@ def _build_provider(
 ) -> DataProvider:
     if source == "csv":
         data_dir = historical_dir_override or config.data.csv_dir
-        return CSVDataProvider(data_dir=data_dir)
+        return CSVDataProvider(data_dir=data_dir, cache_dir=config.data.cache.directory)
     if source == "alpaca":
         return AlpacaDataProvider(
             api_key=config.alpaca_api_key,
@@ -17,6 +17,9 @@ from typing import Any
 class AppError(Exception):
     """Base error for all application-level errors."""
 
+    # Fields live in slots, so raising an error doesn't allocate an instance dict
+    __slots__ = ("message", "code", "details", "suggestion")
+
     def __init__(
         self,
         message: str,
@@ -30,8 +33,15 @@ class AppError(Exception):
         self.suggestion = suggestion
         super().__init__(message)
 
+    def __reduce__(self) -> tuple:
+        # Exception pickling only carries args and __dict__, which misses slots
+        return (type(self), (self.message, self.code, self.details, self.suggestion))
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize error for JSON output."""
+        # Most errors carry neither extra field; return the bare payload directly
+        if not (self.details or self.suggestion):
+            return {"error": self.code, "message": self.message}
         result: dict[str, Any] = {
             "error": self.code,
             "message": self.message,
@@ -1,39 +1,96 @@
-"""Indicators library."""
+"""Indicators library.
+
+Indicator classes are imported on first use (PEP 562), so importing this
+package for specs or a single indicator doesn't load every implementation.
+"""
 
 from __future__ import annotations
 
-from typing import Any
+import functools
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from kodiak.indicators.base import IndicatorSpec
-from kodiak.indicators.custom import RollingHighLow
-from kodiak.indicators.momentum import MACD, RSI
-from kodiak.indicators.trend import EMA, SMA
-from kodiak.indicators.volatility import ATR, BollingerBands
-from kodiak.indicators.volume import OBV, VWAP
-
-INDICATORS = {
-    "sma": SMA,
-    "ema": EMA,
-    "rsi": RSI,
-    "macd": MACD,
-    "atr": ATR,
-    "bbands": BollingerBands,
-    "obv": OBV,
-    "vwap": VWAP,
-    "rolling_high_low": RollingHighLow,
+
+if TYPE_CHECKING:
+    from kodiak.indicators.custom import RollingHighLow
+    from kodiak.indicators.momentum import MACD, RSI
+    from kodiak.indicators.trend import EMA, SMA
+    from kodiak.indicators.volatility import ATR, BollingerBands
+    from kodiak.indicators.volume import OBV, VWAP
+
+# Class name -> defining module
+_LAZY_CLASSES = {
+    "SMA": "kodiak.indicators.trend",
+    "EMA": "kodiak.indicators.trend",
+    "RSI": "kodiak.indicators.momentum",
+    "MACD": "kodiak.indicators.momentum",
+    "ATR": "kodiak.indicators.volatility",
+    "BollingerBands": "kodiak.indicators.volatility",
+    "OBV": "kodiak.indicators.volume",
+    "VWAP": "kodiak.indicators.volume",
+    "RollingHighLow": "kodiak.indicators.custom",
 }
 
+# Indicator name -> class name
+_INDICATOR_CLASSES = MappingProxyType({
+    "sma": "SMA",
+    "ema": "EMA",
+    "rsi": "RSI",
+    "macd": "MACD",
+    "atr": "ATR",
+    "bbands": "BollingerBands",
+    "obv": "OBV",
+    "vwap": "VWAP",
+    "rolling_high_low": "RollingHighLow",
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name == "INDICATORS":
+        value: Any = MappingProxyType(
+            {key: _load(cls_name) for key, cls_name in _INDICATOR_CLASSES.items()}
+        )
+    elif name in _LAZY_CLASSES:
+        value = getattr(importlib.import_module(_LAZY_CLASSES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def _load(name: str) -> Any:
+    """Return a lazily imported attribute, importing it on first use."""
+    value = globals().get(name)
+    return value if value is not None else __getattr__(name)
+
+
+@functools.cache
+def _specs() -> tuple[IndicatorSpec, ...]:
+    # Specs are static metadata, so build them once rather than per listing
+    return tuple(cls().spec for cls in _load("INDICATORS").values())
+
 
 def list_indicators() -> list[IndicatorSpec]:
     """Return specs for all available indicators."""
-    return [cls().spec for cls in INDICATORS.values()]
+    return list(_specs())
 
 
 def get_indicator(name: str, **params: Any):
-    """Instantiate indicator by name."""
-    if name not in INDICATORS:
+    """Instantiate indicator by name.
+
+    The class lookup is cached; each call returns a new instance, so callers
+    may hold on to or mutate their indicator without affecting others.
+    """
+    return _indicator_class(name)(**params)
+
+
+@functools.cache
+def _indicator_class(name: str) -> Any:
+    if name not in _INDICATOR_CLASSES:
         raise ValueError(f"Unknown indicator: {name}")
-    return INDICATORS[name](**params)
+    return _load(_INDICATOR_CLASSES[name])
 
 
 __all__ = [
@@ -24,7 +24,11 @@ class RollingHighLow(Indicator):
 
     def calculate(self, data: pd.DataFrame) -> pd.DataFrame:
         validate_ohlcv(data, ("high", "low"))
-        df = pd.DataFrame(index=data.index)
-        df["rolling_high"] = data["high"].rolling(self.period).max()
-        df["rolling_low"] = data["low"].rolling(self.period).min()
-        return df
+        # Rolling max/min are O(N) in pandas (monotonic deque), whatever the period
+        return pd.DataFrame(
+            {
+                "rolling_high": data["high"].rolling(self.period).max(),
+                "rolling_low": data["low"].rolling(self.period).min(),
+            },
+            index=data.index,
+        )
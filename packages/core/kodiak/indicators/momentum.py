@@ -32,10 +32,14 @@ class RSI(Indicator):
                 raise ValueError("Failed to compute RSI")
         else:
             delta = data["close"].diff()
-            gain = delta.clip(lower=0).rolling(self.period).mean()
-            loss = (-delta.clip(upper=0)).rolling(self.period).mean()
-            rs = gain / loss
-            series = 100 - (100 / (1 + rs))
+            gain = delta.clip(lower=0)
+            # Wilder smoothing of gains and losses in one EWM pass, as pandas-ta does
+            avg = (
+                pd.DataFrame({"gain": gain, "loss": gain - delta})
+                .ewm(alpha=1 / self.period, min_periods=self.period)
+                .mean()
+            )
+            series = 100 * avg["gain"] / (avg["gain"] + avg["loss"])
         series.name = f"rsi_{self.period}"
         return series
 
@@ -72,16 +76,11 @@ class MACD(Indicator):
                 raise ValueError("Failed to compute MACD")
             return df
 
-        ema_fast = data["close"].ewm(span=self.fast, adjust=False).mean()
-        ema_slow = data["close"].ewm(span=self.slow, adjust=False).mean()
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=self.signal, adjust=False).mean()
-        histogram = macd_line - signal_line
-        return pd.DataFrame(
-            {
-                "MACD": macd_line,
-                "SIGNAL": signal_line,
-                "HISTOGRAM": histogram,
-            },
-            index=data.index,
-        )
+        # Arithmetic on the raw arrays skips index alignment; the frame is built once
+        close = data["close"]
+        ema_fast = close.ewm(span=self.fast, adjust=False).mean().to_numpy()
+        ema_slow = close.ewm(span=self.slow, adjust=False).mean().to_numpy()
+        df = pd.DataFrame({"MACD": ema_fast - ema_slow}, index=data.index)
+        df["SIGNAL"] = df["MACD"].ewm(span=self.signal, adjust=False).mean()
+        df["HISTOGRAM"] = df["MACD"].to_numpy() - df["SIGNAL"].to_numpy()
+        return df
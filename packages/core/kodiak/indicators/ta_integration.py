@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 
+@functools.cache
 def get_pandas_ta() -> Any:
-    """Return pandas-ta module if installed, otherwise None."""
+    """Return pandas-ta module if installed, otherwise None.
+
+    The result is cached: a failed import is not recorded in sys.modules, so
+    without pandas-ta every indicator call would otherwise search the path again.
+    """
     try:
         import pandas_ta as ta
     except ImportError:
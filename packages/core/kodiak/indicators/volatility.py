@@ -36,10 +36,10 @@ class ATR(Indicator):
             if series is None:
                 raise ValueError("Failed to compute ATR")
         else:
-            high_low = data["high"] - data["low"]
-            high_close = (data["high"] - data["close"].shift()).abs()
-            low_close = (data["low"] - data["close"].shift()).abs()
-            tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+            prev_close = data["close"].shift()
+            # True range = max(high, prev close) - min(low, prev close); clip skips
+            # the missing first prev close, leaving high - low there
+            tr = data["high"].clip(lower=prev_close) - data["low"].clip(upper=prev_close)
             series = tr.rolling(self.period).mean()
         series.name = f"atr_{self.period}"
         return series
@@ -73,10 +73,13 @@ class BollingerBands(Indicator):
                 raise ValueError("Failed to compute Bollinger Bands")
             return df
 
-        mid = data["close"].rolling(self.period).mean()
-        std = data["close"].rolling(self.period).std()
-        upper = mid + self.stddev * std
-        lower = mid - self.stddev * std
+        # pandas' rolling mean/std are already single-pass online updates; the
+        # band arithmetic runs on the raw arrays to skip index alignment
+        window = data["close"].rolling(self.period)
+        mid = window.mean().to_numpy()
+        width = self.stddev * window.std().to_numpy()
+        upper = mid + width
+        lower = mid - width
         return pd.DataFrame(
             {
                 "BBL": lower,
@@ -28,8 +28,9 @@ class OBV(Indicator):
             if series is None:
                 raise ValueError("Failed to compute OBV")
         else:
-            delta = data["close"].diff().fillna(0)
-            direction = delta.where(delta == 0, delta / delta.abs())
+            delta = data["close"].diff()
+            # Sign of each move without dividing; the leading NaN compares false -> 0
+            direction = (delta > 0).astype("float64") - (delta < 0)
             series = (direction * data["volume"]).cumsum()
         series.name = "obv"
         return series
@@ -60,9 +61,10 @@ class VWAP(Indicator):
             if series is None:
                 raise ValueError("Failed to compute VWAP")
         else:
+            volume = data["volume"]
             typical_price = (data["high"] + data["low"] + data["close"]) / 3
-            cumulative_vp = (typical_price * data["volume"]).cumsum()
-            cumulative_vol = data["volume"].cumsum()
+            cumulative_vp = (typical_price * volume).cumsum()
+            cumulative_vol = volume.cumsum()
             series = cumulative_vp / cumulative_vol
         series.name = "vwap"
         return series
@@ -5,18 +5,22 @@ Phase 3 (MCP roadmap): protect the server from runaway agents by
 - enforcing a maximum wall-clock time per invocation
 
 Configuration is via environment variables; see README for MCP_* env vars.
+They are read once per process; call `_reset_limits_cache()` after changing them.
 """
 
 from __future__ import annotations
 
+import functools
+import importlib
 import os
 import threading
 import time
-from collections import deque
+from collections import OrderedDict
 from collections.abc import Callable
 from concurrent.futures import Future, ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
-from typing import TypeVar
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
 from kodiak.errors import RateLimitError, TaskTimeoutError
 
@@ -27,65 +31,130 @@ DEFAULT_BACKTEST_TIMEOUT_SECONDS = 300  # 5 minutes
 DEFAULT_OPTIMIZATION_TIMEOUT_SECONDS = 600  # 10 minutes
 DEFAULT_RATE_LIMIT_WINDOW_SECONDS = 60
 DEFAULT_RATE_LIMIT_CALLS_PER_WINDOW = 10  # max 10 long-running calls per minute
+DEFAULT_RATE_LIMIT_MAX_KEYS = 10_000  # least recently used keys beyond this are forgotten
+# Timed-out tasks keep running and hold their worker until they finish
+DEFAULT_TASK_POOL_SIZE = 4
+
+# Imported once before the first timed task so cold imports don't count against it
+_TASK_PRELOAD_MODULES = ("pandas",)
 
 _executor: ThreadPoolExecutor | None = None
 _executor_lock = threading.Lock()
 
 
 def _get_executor() -> ThreadPoolExecutor:
-    """Lazy single-thread executor for running timed tasks."""
+    """Lazy executor for running timed tasks, sized by MCP_TASK_POOL_SIZE."""
     global _executor
     with _executor_lock:
         if _executor is None:
-            _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mcp_task")
+            _executor = ThreadPoolExecutor(
+                max_workers=max(get_task_pool_size(), 1), thread_name_prefix="mcp_task"
+            )
     return _executor
 
 
+@functools.cache
+def _preload_task_modules() -> None:
+    """Import the heavy modules timed tasks use, once, outside any timer."""
+    for name in _TASK_PRELOAD_MODULES:
+        importlib.import_module(name)
+
+
+@functools.lru_cache(maxsize=1)
 def get_backtest_timeout_seconds() -> int:
     """Backtest timeout in seconds (0 = no timeout)."""
     return int(os.getenv("MCP_BACKTEST_TIMEOUT_SECONDS", str(DEFAULT_BACKTEST_TIMEOUT_SECONDS)))
 
 
+@functools.lru_cache(maxsize=1)
 def get_optimization_timeout_seconds() -> int:
     """Optimization timeout in seconds (0 = no timeout)."""
     return int(os.getenv("MCP_OPTIMIZATION_TIMEOUT_SECONDS", str(DEFAULT_OPTIMIZATION_TIMEOUT_SECONDS)))
 
 
+@functools.lru_cache(maxsize=1)
 def get_rate_limit_calls_per_minute() -> int:
     """Max long-running tool calls per minute (0 = no limit)."""
     return int(os.getenv("MCP_RATE_LIMIT_LONG_RUNNING_PER_MINUTE", str(DEFAULT_RATE_LIMIT_CALLS_PER_WINDOW)))
 
 
+@functools.lru_cache(maxsize=1)
+def get_rate_limit_max_keys() -> int:
+    """Max rate-limit keys tracked at once; the least recently used is evicted."""
+    return int(os.getenv("MCP_RATE_LIMIT_MAX_KEYS", str(DEFAULT_RATE_LIMIT_MAX_KEYS)))
+
+
+@functools.lru_cache(maxsize=1)
+def get_task_pool_size() -> int:
+    """Worker threads for timed tasks off the main thread."""
+    return int(os.getenv("MCP_TASK_POOL_SIZE", str(DEFAULT_TASK_POOL_SIZE)))
+
+
+def _reset_limits_cache() -> None:
+    """Forget the cached env-derived limits so the next call re-reads them."""
+    get_backtest_timeout_seconds.cache_clear()
+    get_optimization_timeout_seconds.cache_clear()
+    get_rate_limit_calls_per_minute.cache_clear()
+    get_rate_limit_max_keys.cache_clear()
+    get_task_pool_size.cache_clear()
+
+
 # -----------------------------------------------------------------------------
 # Rate limiter (in-memory, per process)
 # -----------------------------------------------------------------------------
 
-_rate_limit_entries: dict[str, deque[float]] = {}
+@dataclass
+class _Bucket:
+    """Token bucket for one rate-limit key."""
+
+    tokens: float
+    last_refill: float
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# Buckets in least-recently-used order; a forgotten key starts over with a full
+# bucket, so eviction can only ever make the limiter more lenient
+_rate_limit_entries: OrderedDict[str, _Bucket] = OrderedDict()
+# Guards the bucket map only; token arithmetic takes the per-key bucket lock
 _rate_limit_lock = threading.Lock()
 
 
 def check_rate_limit(key: str) -> None:
-    """Raise RateLimitError if the key has exceeded the allowed calls per minute."""
+    """Raise RateLimitError if the key has exceeded the allowed calls per minute.
+
+    Each key has a token bucket holding up to `limit` calls that refills at
+    `limit` per window. Checks on different keys only share the brief bucket
+    lookup, never the refill arithmetic.
+    """
     limit = get_rate_limit_calls_per_minute()
     if limit <= 0:
         return
     window = DEFAULT_RATE_LIMIT_WINDOW_SECONDS
+    # Read the clock before locking; a thread that read it earlier but locks
+    # later sees no elapsed time rather than a negative refill
     now = time.monotonic()
     with _rate_limit_lock:
-        if key not in _rate_limit_entries:
-            _rate_limit_entries[key] = deque(maxlen=limit + 64)
-        q = _rate_limit_entries[key]
-        # Drop timestamps outside the window
-        while q and q[0] < now - window:
-            q.popleft()
-        if len(q) >= limit:
+        bucket = _rate_limit_entries.get(key)
+        if bucket is None:
+            bucket = _rate_limit_entries[key] = _Bucket(float(limit), now)
+            max_keys = get_rate_limit_max_keys()
+            while len(_rate_limit_entries) > max(max_keys, 1):
+                _rate_limit_entries.popitem(last=False)
+        else:
+            _rate_limit_entries.move_to_end(key)
+    with bucket.lock:
+        if now > bucket.last_refill:
+            refill = (now - bucket.last_refill) * limit / window
+            bucket.tokens = min(limit, bucket.tokens + refill)
+            bucket.last_refill = now
+        if bucket.tokens < 1:
             raise RateLimitError(
                 message=f"Rate limit exceeded for {key}: max {limit} calls per {window}s",
                 code="RATE_LIMIT_EXCEEDED",
                 details={"key": key, "limit": limit, "window_seconds": window},
                 suggestion="Wait a minute before retrying or increase MCP_RATE_LIMIT_LONG_RUNNING_PER_MINUTE",
             )
-        q.append(now)
+        bucket.tokens -= 1
 
 
 # -----------------------------------------------------------------------------
@@ -94,25 +163,32 @@ def check_rate_limit(key: str) -> None:
 
 
 def run_with_timeout(
-    fn: Callable[[], T],
+    fn: Callable[..., T],
+    *args: Any,
     timeout_seconds: int,
     task_name: str = "task",
+    **kwargs: Any,
 ) -> T:
-    """Run a callable in a thread and return its result, or raise TaskTimeoutError on timeout.
+    """Run `fn(*args, **kwargs)` in a thread and return its result, or raise TaskTimeoutError.
 
     If timeout is 0 or negative, the callable runs in the current thread with no timeout.
     """
     if timeout_seconds <= 0:
-        return fn()
+        return fn(*args, **kwargs)
 
+    _preload_task_modules()
     executor = _get_executor()
-    future: Future[T] = executor.submit(fn)
+    future: Future[T] = executor.submit(fn, *args, **kwargs)
     try:
         return future.result(timeout=timeout_seconds)
     except FuturesTimeoutError:
-        raise TaskTimeoutError(
-            message=f"{task_name} did not complete within {timeout_seconds}s",
-            code="TASK_TIMEOUT",
-            details={"task": task_name, "timeout_seconds": timeout_seconds},
-            suggestion="Use a shorter date range or increase MCP_BACKTEST_TIMEOUT_SECONDS / MCP_OPTIMIZATION_TIMEOUT_SECONDS",
-        )
+        raise _timeout_error(task_name, timeout_seconds)
+
+
+def _timeout_error(task_name: str, timeout_seconds: int) -> TaskTimeoutError:
+    return TaskTimeoutError(
+        message=f"{task_name} did not complete within {timeout_seconds}s",
+        code="TASK_TIMEOUT",
+        details={"task": task_name, "timeout_seconds": timeout_seconds},
+        suggestion="Use a shorter date range or increase MCP_BACKTEST_TIMEOUT_SECONDS / MCP_OPTIMIZATION_TIMEOUT_SECONDS",
+    )
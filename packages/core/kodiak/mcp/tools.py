@@ -1,42 +1,131 @@
 """Kodiak MCP tool definitions (transport-agnostic).
 
-All 32 MCP tools are defined here as plain functions. The register_tools()
-function wires them onto any FastMCP server instance. Transport selection
-(stdio vs streamable-http) is handled by the CLI and server packages.
+All MCP tools are defined here as plain functions marked with @_mcp_tool.
+build_server() creates a FastMCP instance from their tool metadata, which is
+introspected once per process; register_tools() wires them onto any other
+FastMCP server instance. Transport selection (stdio vs streamable-http) is
+handled by the CLI and server packages.
 """
 
 from __future__ import annotations
 
+import functools
 import json
-from decimal import Decimal
-from typing import Any
-
-from mcp.server.fastmcp import FastMCP
-
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from kodiak.audit import set_audit_source
 from kodiak.errors import AppError, ValidationError
+from kodiak.mcp.limits import (
+    check_rate_limit,
+    get_backtest_timeout_seconds,
+    get_optimization_timeout_seconds,
+    run_with_timeout,
+)
+from kodiak.utils.config import dotenv_files, load_config
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+    from mcp.server.fastmcp.tools import Tool
+    from pydantic import BaseModel
+
+# datetimes and dataclasses go through default=str, matching json.dumps output
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+# Tools in definition order, collected by @_mcp_tool
+_ALL_TOOLS: list[Callable[..., str]] = []
+
+
+def _mcp_tool(fn: Callable[..., str]) -> Callable[..., str]:
+    """Mark a function as an MCP tool; it is registered on every server built."""
+    _ALL_TOOLS.append(fn)
+    return fn
+
 
 # =============================================================================
 # Helpers
 # =============================================================================
 
 
+# Tool calls reuse a loaded config for a few seconds; an edited .env file
+# invalidates it immediately
+CONFIG_CACHE_SECONDS = 5.0
+
+_config_cache: tuple[float, tuple[int | None, ...], Any] | None = None
+_config_lock = threading.Lock()
+
+
 def _config() -> Any:
-    """Load config lazily (avoids import-time side effects)."""
-    from kodiak.utils.config import load_config
+    """Load config lazily (avoids import-time side effects), cached briefly across calls."""
+    global _config_cache
+    key = tuple(_mtime_ns(path) for path in dotenv_files())
+    now = time.monotonic()
+    with _config_lock:
+        if _config_cache is not None:
+            loaded_at, cached_key, config = _config_cache
+            if cached_key == key and now - loaded_at < CONFIG_CACHE_SECONDS:
+                return config
+        config = load_config()
+        _config_cache = (now, key, config)
+        return config
 
-    return load_config()
 
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return int(path.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _ok(data: BaseModel) -> str:
+    """Serialize a Pydantic model to JSON."""
+    return data.model_dump_json(indent=2)
 
-def _ok(data: object) -> str:
-    """Serialize a Pydantic model or dict/list to JSON."""
-    if hasattr(data, "model_dump_json"):
-        return str(data.model_dump_json(indent=2))
+
+def _ok_json(data: object) -> str:
+    """Serialize dicts/lists to indented JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
     return json.dumps(data, indent=2, default=str)
 
 
+@functools.cache
+def _list_adapter(model: type) -> Any:
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def _ok_list(model: type, items: list[Any]) -> str:
+    """Serialize a list of Pydantic models to JSON in one pass, like `model_dump_json`."""
+    data: bytes = _list_adapter(model).dump_json(items, indent=2)
+    return data.decode()
+
+
+# Fixed responses are serialized once at import
+_NO_TRADES_JSON = json.dumps({"message": "No trades found for analysis."})
+
+
 def _err(e: AppError) -> str:
     """Serialize an AppError to JSON."""
-    return json.dumps(e.to_dict(), indent=2)
+    return _ok_json(e.to_dict())
 
 
 # =============================================================================
@@ -44,6 +133,7 @@ def _err(e: AppError) -> str:
 # =============================================================================
 
 
+@_mcp_tool
 def get_status() -> str:
     """Get current Kodiak engine status.
 
@@ -60,6 +150,7 @@ def get_status() -> str:
         return _err(e)
 
 
+@_mcp_tool
 def start_engine(dry_run: bool = False, interval: int = 60) -> str:
     """Start the trading engine as a background process.
 
@@ -74,11 +165,12 @@ def start_engine(dry_run: bool = False, interval: int = 60) -> str:
     from kodiak.app.engine import start_engine as _start_engine
 
     try:
-        return _ok(_start_engine(dry_run=dry_run, interval=interval))
+        return _ok_json(_start_engine(dry_run=dry_run, interval=interval))
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def stop_engine(force: bool = False) -> str:
     """Stop the running trading engine.
 
@@ -88,7 +180,7 @@ def stop_engine(force: bool = False) -> str:
     from kodiak.app.engine import stop_engine as _stop_engine
 
     try:
-        return _ok(_stop_engine(force=force))
+        return _ok_json(_stop_engine(force=force))
     except AppError as e:
         return _err(e)
 
@@ -98,6 +190,7 @@ def stop_engine(force: bool = False) -> str:
 # =============================================================================
 
 
+@_mcp_tool
 def get_balance() -> str:
     """Get account balance, equity, buying power, and daily P/L."""
     from kodiak.app.portfolio import get_balance as _get_balance
@@ -108,19 +201,20 @@ def get_balance() -> str:
         return _err(e)
 
 
+@_mcp_tool
 def get_positions() -> str:
     """List all open positions with current prices and unrealized P/L."""
     from kodiak.app.portfolio import get_positions as _get_positions
+    from kodiak.schemas.portfolio import PositionInfo
 
     try:
         result = _get_positions(_config())
-        return json.dumps(
-            [p.model_dump() for p in result], indent=2, default=str
-        )
+        return _ok_list(PositionInfo, result)
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def get_portfolio() -> str:
     """Get detailed portfolio summary with position weights and P/L breakdown."""
     from kodiak.app.portfolio import get_portfolio_summary
@@ -131,6 +225,7 @@ def get_portfolio() -> str:
         return _err(e)
 
 
+@_mcp_tool
 def get_quote(symbol: str) -> str:
     """Get current bid/ask/last quote for a symbol.
 
@@ -145,6 +240,7 @@ def get_quote(symbol: str) -> str:
         return _err(e)
 
 
+@_mcp_tool
 def get_top_movers(market_type: str = "stocks", limit: int = 10) -> str:
     """Get top market movers (gainers and losers).
 
@@ -156,7 +252,7 @@ def get_top_movers(market_type: str = "stocks", limit: int = 10) -> str:
 
     try:
         result = _get_top_movers(_config(), market_type=market_type, limit=limit)
-        return json.dumps(result, indent=2, default=str)
+        return _ok_json(result)
     except AppError as e:
         return _err(e)
 
@@ -166,30 +262,51 @@ def get_top_movers(market_type: str = "stocks", limit: int = 10) -> str:
 # =============================================================================
 
 
-def place_order(symbol: str, qty: int, side: str, price: float) -> str:
+@_mcp_tool
+def place_order(symbol: str, qty: int, side: str, price: str | float) -> str:
     """Place a limit order (with safety checks).
 
     Args:
         symbol: Stock ticker (e.g. "AAPL").
         qty: Number of shares (must be >= 1).
         side: "buy" or "sell".
-        price: Limit price per share.
+        price: Limit price per share. A string such as "150.25" is used exactly
+            as written; a number is converted via its shortest repr.
     """
     from kodiak.app.orders import place_order as _place_order
     from kodiak.schemas.orders import OrderRequest
 
+    try:
+        limit_price = _to_decimal(price)
+    except InvalidOperation:
+        return _err(
+            ValidationError(
+                message=f"Invalid price: {price}. Use a positive number such as '150.25'",
+                code="INVALID_PRICE",
+            )
+        )
+
     try:
         request = OrderRequest(
             symbol=symbol.upper(),
             qty=qty,
             side=side.lower(),
-            price=Decimal(str(price)),
+            price=limit_price,
         )
         return _ok(_place_order(_config(), request))
     except AppError as e:
         return _err(e)
 
 
+def _to_decimal(value: str | float) -> Decimal:
+    """Parse a price without going through float when the client sent a string."""
+    result = Decimal(value) if isinstance(value, str) else Decimal(str(value))
+    if not result.is_finite():
+        raise InvalidOperation(value)
+    return result
+
+
+@_mcp_tool
 def list_orders(show_all: bool = False) -> str:
     """List orders. By default shows only open/pending orders.
 
@@ -197,16 +314,16 @@ def list_orders(show_all: bool = False) -> str:
         show_all: If true, include filled, cancelled, and expired orders.
     """
     from kodiak.app.orders import list_orders as _list_orders
+    from kodiak.schemas.orders import OrderResponse
 
     try:
         result = _list_orders(_config(), show_all=show_all)
-        return json.dumps(
-            [o.model_dump() for o in result], indent=2, default=str
-        )
+        return _ok_list(OrderResponse, result)
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def cancel_order(order_id: str) -> str:
     """Cancel an open order by ID.
 
@@ -216,7 +333,7 @@ def cancel_order(order_id: str) -> str:
     from kodiak.app.orders import cancel_order as _cancel_order
 
     try:
-        return _ok(_cancel_order(_config(), order_id))
+        return _ok_json(_cancel_order(_config(), order_id))
     except AppError as e:
         return _err(e)
 
@@ -226,6 +343,7 @@ def cancel_order(order_id: str) -> str:
 # =============================================================================
 
 
+@_mcp_tool
 def list_strategies() -> str:
     """List all configured trading strategies."""
     from kodiak.app.strategies import list_strategies as _list_strategies
@@ -236,6 +354,7 @@ def list_strategies() -> str:
         return _err(e)
 
 
+@_mcp_tool
 def get_strategy(strategy_id: str) -> str:
     """Get detailed information about a specific strategy.
 
@@ -250,6 +369,7 @@ def get_strategy(strategy_id: str) -> str:
         return _err(e)
 
 
+@_mcp_tool
 def create_strategy(
     strategy_type: str,
     symbol: str,
@@ -294,6 +414,7 @@ def create_strategy(
         return _err(e)
 
 
+@_mcp_tool
 def remove_strategy(strategy_id: str) -> str:
     """Delete a strategy by ID.
 
@@ -303,11 +424,12 @@ def remove_strategy(strategy_id: str) -> str:
     from kodiak.app.strategies import remove_strategy as _remove_strategy
 
     try:
-        return _ok(_remove_strategy(strategy_id))
+        return _ok_json(_remove_strategy(strategy_id))
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def pause_strategy(strategy_id: str) -> str:
     """Pause an active strategy.
 
@@ -317,11 +439,12 @@ def pause_strategy(strategy_id: str) -> str:
     from kodiak.app.strategies import pause_strategy as _pause_strategy
 
     try:
-        return _ok(_pause_strategy(strategy_id))
+        return _ok_json(_pause_strategy(strategy_id))
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def resume_strategy(strategy_id: str) -> str:
     """Resume a paused strategy.
 
@@ -331,11 +454,12 @@ def resume_strategy(strategy_id: str) -> str:
     from kodiak.app.strategies import resume_strategy as _resume_strategy
 
     try:
-        return _ok(_resume_strategy(strategy_id))
+        return _ok_json(_resume_strategy(strategy_id))
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def set_strategy_enabled(strategy_id: str, enabled: bool) -> str:
     """Enable or disable a strategy.
 
@@ -346,11 +470,12 @@ def set_strategy_enabled(strategy_id: str, enabled: bool) -> str:
     from kodiak.app.strategies import set_strategy_enabled as _set_enabled
 
     try:
-        return _ok(_set_enabled(strategy_id, enabled))
+        return _ok_json(_set_enabled(strategy_id, enabled))
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def schedule_strategy(strategy_id: str, schedule_at: str) -> str:
     """Schedule a strategy to start at a specific time.
 
@@ -361,14 +486,10 @@ def schedule_strategy(strategy_id: str, schedule_at: str) -> str:
         strategy_id: The strategy ID to schedule.
         schedule_at: ISO datetime string (e.g., "2026-02-13T09:30:00").
     """
-    from datetime import datetime
-
     from kodiak.app.strategies import schedule_strategy as _schedule_strategy
 
     try:
-        # Parse ISO datetime string
-        schedule_dt = datetime.fromisoformat(schedule_at)
-        return _ok(_schedule_strategy(strategy_id, schedule_dt))
+        schedule_dt = _parse_schedule_time(schedule_at)
     except ValueError:
         return _err(
             ValidationError(
@@ -376,10 +497,22 @@ def schedule_strategy(strategy_id: str, schedule_at: str) -> str:
                 code="INVALID_DATETIME_FORMAT",
             )
         )
+
+    try:
+        return _ok_json(_schedule_strategy(strategy_id, schedule_dt))
     except AppError as e:
         return _err(e)
 
 
+def _parse_schedule_time(value: str) -> datetime:
+    """Parse an ISO datetime into the naive local time schedules are stored in."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+@_mcp_tool
 def cancel_schedule(strategy_id: str) -> str:
     """Cancel a scheduled strategy.
 
@@ -391,11 +524,12 @@ def cancel_schedule(strategy_id: str) -> str:
     from kodiak.app.strategies import cancel_schedule as _cancel_schedule
 
     try:
-        return _ok(_cancel_schedule(strategy_id))
+        return _ok_json(_cancel_schedule(strategy_id))
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def list_scheduled_strategies() -> str:
     """List all strategies with active schedules.
 
@@ -404,7 +538,7 @@ def list_scheduled_strategies() -> str:
     from kodiak.app.strategies import list_scheduled_strategies as _list_scheduled
 
     try:
-        return _ok(_list_scheduled())
+        return _ok_json(_list_scheduled())
     except AppError as e:
         return _err(e)
 
@@ -414,6 +548,7 @@ def list_scheduled_strategies() -> str:
 # =============================================================================
 
 
+@_mcp_tool
 def run_backtest(
     strategy_type: str,
     symbol: str,
@@ -445,11 +580,6 @@ def run_backtest(
         save: Whether to save results to disk.
     """
     from kodiak.app.backtests import run_backtest as _run_backtest
-    from kodiak.mcp.limits import (
-        check_rate_limit,
-        get_backtest_timeout_seconds,
-        run_with_timeout,
-    )
     from kodiak.schemas.backtests import BacktestRequest
 
     try:
@@ -469,28 +599,27 @@ def run_backtest(
         )
         timeout = get_backtest_timeout_seconds()
         result = run_with_timeout(
-            lambda: _run_backtest(_config(), request),
-            timeout_seconds=timeout,
-            task_name="run_backtest",
+            _run_backtest, _config(), request, timeout_seconds=timeout, task_name="run_backtest"
         )
         return _ok(result)
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def list_backtests() -> str:
     """List all saved backtest results."""
     from kodiak.app.backtests import list_backtests_app
+    from kodiak.schemas.backtests import BacktestSummary
 
     try:
         result = list_backtests_app()
-        return json.dumps(
-            [b.model_dump() for b in result], indent=2, default=str
-        )
+        return _ok_list(BacktestSummary, result)
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def show_backtest(backtest_id: str) -> str:
     """Get full results for a specific backtest.
 
@@ -505,6 +634,7 @@ def show_backtest(backtest_id: str) -> str:
         return _err(e)
 
 
+@_mcp_tool
 def compare_backtests(backtest_ids: list[str]) -> str:
     """Compare multiple backtests side by side.
 
@@ -512,16 +642,16 @@ def compare_backtests(backtest_ids: list[str]) -> str:
         backtest_ids: List of backtest IDs to compare.
     """
     from kodiak.app.backtests import compare_backtests as _compare
+    from kodiak.schemas.backtests import BacktestResponse
 
     try:
         results = _compare(backtest_ids)
-        return json.dumps(
-            [r.model_dump() for r in results], indent=2, default=str
-        )
+        return _ok_list(BacktestResponse, results)
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def delete_backtest(backtest_id: str) -> str:
     """Delete a saved backtest result.
 
@@ -531,7 +661,7 @@ def delete_backtest(backtest_id: str) -> str:
     from kodiak.app.backtests import delete_backtest_app
 
     try:
-        return _ok(delete_backtest_app(backtest_id))
+        return _ok_json(delete_backtest_app(backtest_id))
     except AppError as e:
         return _err(e)
 
@@ -541,6 +671,7 @@ def delete_backtest(backtest_id: str) -> str:
 # =============================================================================
 
 
+@_mcp_tool
 def analyze_performance(
     symbol: str | None = None,
     days: int = 30,
@@ -562,12 +693,13 @@ def analyze_performance(
             limit=limit,
         )
         if result is None:
-            return json.dumps({"message": "No trades found for analysis."})
+            return _NO_TRADES_JSON
         return _ok(result)
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def get_trade_history(symbol: str | None = None, limit: int = 20) -> str:
     """Get recent trade records.
 
@@ -581,18 +713,19 @@ def get_trade_history(symbol: str | None = None, limit: int = 20) -> str:
         result = _get_history(
             symbol=symbol.upper() if symbol else None, limit=limit
         )
-        return json.dumps(result, indent=2, default=str)
+        return _ok_json(result)
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def get_today_pnl() -> str:
     """Get today's realized profit/loss."""
     from kodiak.app.analysis import get_today_pnl as _get_today_pnl
 
     try:
         pnl = _get_today_pnl()
-        return json.dumps({"today_pnl": str(pnl)}, indent=2)
+        return _ok_json({"today_pnl": str(pnl)})
     except AppError as e:
         return _err(e)
 
@@ -602,19 +735,20 @@ def get_today_pnl() -> str:
 # =============================================================================
 
 
+@_mcp_tool
 def list_indicators() -> str:
     """List all available technical indicators (SMA, RSI, MACD, etc.)."""
     from kodiak.app.indicators import list_all_indicators
+    from kodiak.schemas.indicators import IndicatorInfo
 
     try:
         result = list_all_indicators()
-        return json.dumps(
-            [i.model_dump() for i in result], indent=2, default=str
-        )
+        return _ok_list(IndicatorInfo, result)
     except AppError as e:
         return _err(e)
 
 
+@_mcp_tool
 def describe_indicator(name: str) -> str:
     """Get detailed information about a specific technical indicator.
 
@@ -634,6 +768,7 @@ def describe_indicator(name: str) -> str:
 # =============================================================================
 
 
+@_mcp_tool
 def run_optimization(
     strategy_type: str,
     symbol: str,
@@ -668,11 +803,6 @@ def run_optimization(
         save: Whether to save results to disk.
     """
     from kodiak.app.optimization import run_optimization as _run_opt
-    from kodiak.mcp.limits import (
-        check_rate_limit,
-        get_optimization_timeout_seconds,
-        run_with_timeout,
-    )
     from kodiak.schemas.optimization import OptimizeRequest
 
     try:
@@ -692,9 +822,7 @@ def run_optimization(
         )
         timeout = get_optimization_timeout_seconds()
         result = run_with_timeout(
-            lambda: _run_opt(_config(), request),
-            timeout_seconds=timeout,
-            task_name="run_optimization",
+            _run_opt, _config(), request, timeout_seconds=timeout, task_name="run_optimization"
         )
         return _ok(result)
     except AppError as e:
@@ -706,6 +834,7 @@ def run_optimization(
 # =============================================================================
 
 
+@_mcp_tool
 def get_safety_status() -> str:
     """Get current safety check status and limits.
 
@@ -714,7 +843,7 @@ def get_safety_status() -> str:
     from kodiak.app.data import get_safety_status as _get_safety
 
     try:
-        return _ok(_get_safety(_config()))
+        return _ok_json(_get_safety(_config()))
     except AppError as e:
         return _err(e)
 
@@ -724,64 +853,22 @@ def get_safety_status() -> str:
 # =============================================================================
 
 
+@functools.cache
 def _with_mcp_audit(fn: Any) -> Any:
-    """Wrap a tool so audit source is set to 'mcp' for the duration of the call."""
-    import functools
+    """Wrap a tool so audit source is set to 'mcp' for the duration of the call.
+
+    Each tool is wrapped once per process; every server built afterwards
+    registers the same wrapper.
+    """
 
     @functools.wraps(fn)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        from kodiak.audit import set_audit_source
-
         set_audit_source("mcp")
         return fn(*args, **kwargs)
 
     return wrapper
 
 
-_ALL_TOOLS = [
-    # Engine
-    get_status,
-    start_engine,
-    stop_engine,
-    # Portfolio & Market Data
-    get_balance,
-    get_positions,
-    get_portfolio,
-    get_quote,
-    get_top_movers,
-    # Orders
-    place_order,
-    list_orders,
-    cancel_order,
-    # Strategies
-    list_strategies,
-    get_strategy,
-    create_strategy,
-    remove_strategy,
-    pause_strategy,
-    resume_strategy,
-    set_strategy_enabled,
-    schedule_strategy,
-    cancel_schedule,
-    list_scheduled_strategies,
-    # Backtests
-    run_backtest,
-    list_backtests,
-    show_backtest,
-    compare_backtests,
-    delete_backtest,
-    # Analysis
-    analyze_performance,
-    get_trade_history,
-    get_today_pnl,
-    # Indicators
-    list_indicators,
-    describe_indicator,
-    # Optimization
-    run_optimization,
-    # Safety
-    get_safety_status,
-]
 
 
 def register_tools(server: FastMCP) -> None:
@@ -790,6 +877,14 @@ def register_tools(server: FastMCP) -> None:
         server.tool()(_with_mcp_audit(tool_fn))  # type: ignore[arg-type]
 
 
+@functools.cache
+def _tool_specs() -> tuple[Tool, ...]:
+    """FastMCP tool metadata for all tools, introspected once per process."""
+    from mcp.server.fastmcp.tools import Tool
+
+    return tuple(Tool.from_function(_with_mcp_audit(fn)) for fn in _ALL_TOOLS)
+
+
 def build_server(
     host: str = "127.0.0.1",
     port: int = 8000,
@@ -798,7 +893,14 @@ def build_server(
     """Create a FastMCP server with all Kodiak tools registered.
 
     Transport selection (stdio vs streamable-http) is handled by the caller.
+    FastMCP is imported here so importing the tool functions stays cheap.
     """
-    server = FastMCP("kodiak", host=host, port=port, log_level=log_level)
-    register_tools(server)
-    return server
+    from mcp.server.fastmcp import FastMCP
+
+    return FastMCP(
+        "kodiak",
+        host=host,
+        port=port,
+        log_level=log_level,
+        tools=list(_tool_specs()),
+    )
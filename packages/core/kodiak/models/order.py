@@ -22,7 +22,11 @@ class OrderStatus(Enum):
     CANCELED = "canceled"
 
 
-@dataclass
+# Statuses after which an order no longer needs reconciling
+FINAL_STATUSES = frozenset({OrderStatus.FILLED, OrderStatus.CANCELED})
+
+
+@dataclass(slots=True)
 class Order:
     symbol: str
     side: OrderSide
@@ -1,9 +1,74 @@
-"""Base notification channel."""
+"""Base notification channel and the HTTP session shared by webhook channels."""
 
+import threading
 from abc import ABC, abstractmethod
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from kodiak.notifications.formatters import TradeNotification
 
+# Webhook POSTs aren't idempotent: a 5xx or read timeout may come after the
+# message was accepted, so only a rate-limit answer is retried
+RETRY_STATUS_CODES = (429,)
+# Upper bound on any single retry wait, Retry-After included
+MAX_RETRY_WAIT_SECONDS = 5.0
+
+
+class _CappedRetry(Retry):
+    """Retry whose Retry-After waits are capped like its backoff."""
+
+    def get_retry_after(self, response: object) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_WAIT_SECONDS)
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def http_session() -> requests.Session:
+    """Return the process-wide session webhook channels post through.
+
+    Managers and channels are rebuilt for each notification, so the session
+    lives at module level to keep TLS connections to webhook hosts alive
+    between sends.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update({"Content-Type": "application/json"})
+            retry = _CappedRetry(
+                total=2,
+                # Connect errors never reached the host and are safe to repeat;
+                # read errors may follow a delivered message
+                read=0,
+                other=0,
+                backoff_factor=0.2,
+                backoff_max=MAX_RETRY_WAIT_SECONDS,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset({"POST"}),
+                # Hand the last response back so raise_for_status reports it
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def close_http_session() -> None:
+    """Close pooled webhook connections; the next send opens a new session."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
 
 class NotificationChannel(ABC):
     """Base class for notification channels."""
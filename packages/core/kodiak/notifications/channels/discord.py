@@ -5,7 +5,7 @@ from typing import Any
 
 import requests
 
-from kodiak.notifications.channels.base import NotificationChannel
+from kodiak.notifications.channels.base import NotificationChannel, http_session
 from kodiak.notifications.formatters import TradeNotification, format_trade_discord
 
 logger = logging.getLogger(__name__)
@@ -29,12 +29,7 @@ class DiscordChannel(NotificationChannel):
         if kwargs.get("username"):
             payload["username"] = str(kwargs["username"])
         try:
-            resp = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=10,
-                headers={"Content-Type": "application/json"},
-            )
+            resp = http_session().post(self.webhook_url, json=payload, timeout=10)
             resp.raise_for_status()
         except requests.RequestException as e:
             logger.warning("Discord webhook send failed: %s", e)
@@ -5,7 +5,7 @@ from typing import Any
 
 import requests
 
-from kodiak.notifications.channels.base import NotificationChannel
+from kodiak.notifications.channels.base import NotificationChannel, http_session
 from kodiak.notifications.formatters import TradeNotification, format_trade_plain
 
 logger = logging.getLogger(__name__)
@@ -29,12 +29,7 @@ class WebhookChannel(NotificationChannel):
         if kwargs.get("event"):
             payload["event"] = str(kwargs["event"])
         try:
-            resp = requests.post(
-                self.url,
-                json=payload,
-                timeout=10,
-                headers={"Content-Type": "application/json"},
-            )
+            resp = http_session().post(self.url, json=payload, timeout=10)
             resp.raise_for_status()
         except requests.RequestException as e:
             logger.warning("Webhook send failed: %s", e)
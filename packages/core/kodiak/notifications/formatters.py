@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeNotification:
     """Payload for trade open/close notifications."""
 
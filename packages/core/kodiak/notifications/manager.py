@@ -1,7 +1,10 @@
 """Notification manager: routes events to configured channels."""
 
+import atexit
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from kodiak.notifications.channels.base import NotificationChannel
@@ -11,6 +14,15 @@ from kodiak.notifications.formatters import TradeNotification, format_error_plai
 
 logger = logging.getLogger(__name__)
 
+# Webhook sends are I/O bound; this bounds concurrent deliveries per process
+NOTIFY_POOL_SIZE = 4
+# Deliveries queued or in flight beyond this are dropped, so a dead webhook can't grow memory
+MAX_PENDING_NOTIFICATIONS = 1024
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_pending = threading.BoundedSemaphore(MAX_PENDING_NOTIFICATIONS)
+
 DEFAULT_EVENTS = {
     "trade_opened": True,
     "trade_closed": True,
@@ -59,8 +71,35 @@ def _build_channels(config: dict[str, Any]) -> list[NotificationChannel]:
     return channels
 
 
+def _get_executor() -> ThreadPoolExecutor:
+    """Lazy process-wide delivery pool, drained and shut down at exit."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=NOTIFY_POOL_SIZE, thread_name_prefix="notify"
+            )
+            atexit.register(_executor.shutdown)
+    return _executor
+
+
+def _release_pending(_future: object) -> None:
+    _pending.release()
+
+
+def _send_one(ch: NotificationChannel, message: str, event: str | None) -> None:
+    try:
+        ch.send(message, event=event)
+    except Exception as e:
+        logger.warning("Notification channel %s failed: %s", ch.name, e)
+
+
 class NotificationManager:
-    """Manages notification delivery across channels."""
+    """Manages notification delivery across channels.
+
+    Sends are handed to a process-wide thread pool, so they return without
+    waiting for any channel.
+    """
 
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Load notification channels from config (and env).
@@ -98,11 +137,28 @@ class NotificationManager:
     def _send_to_all(self, message: str, event: str | None = None) -> None:
         if not self.enabled:
             return
-        for ch in self._channels:
+        self._dispatch([(ch, message) for ch in self._channels], event)
+
+    def _dispatch(
+        self, messages: list[tuple[NotificationChannel, str]], event: str | None
+    ) -> None:
+        """Queue each channel's message on the shared delivery pool and return.
+
+        Callers never wait on webhook I/O. Deliveries still queued when the
+        process exits are sent before the pool shuts down.
+        """
+        for ch, message in messages:
+            if not _pending.acquire(blocking=False):
+                logger.warning("Notification backlog full; dropped message for %s", ch.name)
+                continue
             try:
-                ch.send(message, event=event)
-            except Exception as e:
-                logger.warning("Notification channel %s failed: %s", ch.name, e)
+                future = _get_executor().submit(_send_one, ch, message, event)
+            except RuntimeError:
+                # Pool already shut down (interpreter exiting): deliver inline
+                _pending.release()
+                _send_one(ch, message, event)
+                continue
+            future.add_done_callback(_release_pending)
 
     def send(self, event: str, data: dict[str, Any]) -> None:
         """Send notification to all enabled channels.
@@ -119,12 +175,13 @@ class NotificationManager:
         """Format and send trade notification to all channels."""
         if not self._enabled or not self._event_enabled(trade.event):
             return
+        messages = []
         for ch in self._channels:
             try:
-                msg = ch.format_trade(trade)
-                ch.send(msg, event=trade.event)
+                messages.append((ch, ch.format_trade(trade)))
             except Exception as e:
                 logger.warning("Notification channel %s failed: %s", ch.name, e)
+        self._dispatch(messages, trade.event)
 
     def send_error(self, error: Exception) -> None:
         """Format and send error notification."""
@@ -0,0 +1,161 @@
+"""Pending-orders cache used by safety checks, filled from the broker."""
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+
+from kodiak.api.broker import OPEN_ORDER_STATUSES, Broker
+from kodiak.api.broker import Order as BrokerOrder
+from kodiak.api.broker import OrderSide as BrokerOrderSide
+from kodiak.models.order import FINAL_STATUSES
+from kodiak.models.order import OrderSide as LocalOrderSide
+from kodiak.oms.store import get_orders_file, load_orders
+from kodiak.utils.logging import get_logger
+
+# How long broker-sourced pending orders are trusted before re-asking the broker
+PENDING_ORDERS_TTL_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class PendingOrder:
+    """An open order that reserves position size and buying power."""
+
+    symbol: str
+    is_buy: bool
+    qty: int
+    limit_price: Decimal | None = None
+
+    @classmethod
+    def from_broker_order(cls, order: BrokerOrder) -> "PendingOrder":
+        return cls(
+            symbol=order.symbol,
+            is_buy=order.side == BrokerOrderSide.BUY,
+            qty=int(order.qty),
+            limit_price=(
+                Decimal(str(order.limit_price)) if order.limit_price is not None else None
+            ),
+        )
+
+
+class PendingOrdersCache:
+    """Pending orders indexed by symbol, filled by `OrderReconciler.refresh`."""
+
+    def __init__(self) -> None:
+        self._pending: dict[str, list[PendingOrder]] = {}
+        self.from_broker = True
+        # (mtime_ns, size) of the orders file a local fallback was read from
+        self.local_key: tuple[int, int] | None = None
+        self.refreshed_at: float | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once the cache has been refreshed at least once."""
+        return self.refreshed_at is not None
+
+    def update(
+        self,
+        pending: dict[str, list[PendingOrder]],
+        from_broker: bool = True,
+        local_key: tuple[int, int] | None = None,
+    ) -> None:
+        """Replace the cached pending orders.
+
+        Args:
+            pending: Pending orders by symbol.
+            from_broker: False if these came from the local store because the
+                broker could not be reached.
+            local_key: Orders file (mtime_ns, size) for a local fallback.
+        """
+        self._pending = pending
+        self.from_broker = from_broker
+        self.local_key = local_key
+        self.refreshed_at = time.monotonic()
+
+    def get(self, symbol: str) -> list[PendingOrder]:
+        """Get pending orders for a symbol."""
+        return self._pending.get(symbol, [])
+
+
+class OrderReconciler:
+    """Indexes pending orders from the broker, or from the local store as a fallback."""
+
+    def __init__(self, broker: Broker, orders_dir: Path | None = None) -> None:
+        """Initialize reconciler.
+
+        Args:
+            broker: Broker instance.
+            orders_dir: Optional custom orders directory. Local pending orders
+                are only used as a fallback reserve when this is set.
+        """
+        self.broker = broker
+        self.orders_dir = orders_dir
+        self.logger = get_logger("trader.oms")
+
+    def refresh(self, cache: PendingOrdersCache) -> None:
+        """Fetch broker orders once and fill the cache.
+
+        Broker orders are authoritative whenever the broker answers, even with
+        no open orders. Locally persisted orders are only used as the pending
+        reserve when the broker call fails.
+
+        Args:
+            cache: Cache to update.
+        """
+        try:
+            broker_orders = self.broker.get_orders()
+        except Exception as e:
+            self.logger.debug(f"Failed to get broker orders, falling back to local: {e}")
+            # Stat before reading so a concurrent write is seen as a change
+            local_key = self._orders_file_key()
+            cache.update(self._local_pending(), from_broker=False, local_key=local_key)
+            return
+
+        broker_pending: dict[str, list[PendingOrder]] = {}
+        for o in broker_orders:
+            if o.status in OPEN_ORDER_STATUSES:
+                broker_pending.setdefault(o.symbol, []).append(PendingOrder.from_broker_order(o))
+        cache.update(broker_pending)
+
+    def is_stale(self, cache: PendingOrdersCache) -> bool:
+        """True if the cache needs a refresh before it can be trusted.
+
+        Broker-sourced caches expire after `PENDING_ORDERS_TTL_SECONDS`; a local
+        fallback is re-read whenever the orders file changes.
+        """
+        if not cache.is_loaded:
+            return True
+        if cache.from_broker:
+            return time.monotonic() - cache.refreshed_at > PENDING_ORDERS_TTL_SECONDS
+        return cache.local_key != self._orders_file_key()
+
+    def _orders_file_key(self) -> tuple[int, int] | None:
+        if self.orders_dir is None:
+            return None
+        try:
+            st = get_orders_file(self.orders_dir).stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _local_pending(self) -> dict[str, list[PendingOrder]]:
+        """Index non-final locally persisted orders by symbol."""
+        local_pending: dict[str, list[PendingOrder]] = {}
+        if self.orders_dir is None:
+            return local_pending
+        try:
+            local_orders = load_orders(self.orders_dir)
+        except Exception as e:
+            self.logger.debug(f"Failed to load local orders: {e}")
+            return local_pending
+        for lo in local_orders:
+            if lo.status in FINAL_STATUSES:
+                continue
+            local_pending.setdefault(lo.symbol, []).append(
+                PendingOrder(
+                    symbol=lo.symbol,
+                    is_buy=lo.side == LocalOrderSide.BUY,
+                    qty=int(lo.qty),
+                    limit_price=lo.limit_price,
+                )
+            )
+        return local_pending
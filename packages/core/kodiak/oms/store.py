@@ -1,9 +1,38 @@
-"""Simple order persistence (YAML) for the OMS scaffold."""
+"""Simple order persistence (JSON lines) for the OMS scaffold.
+
+The orders file is an append-only journal: `save_order` appends the updated
+order and `load_orders` replays the journal, later records replacing earlier
+ones with a matching id. `save_orders` rewrites it with one line per order.
+A partial last line left by a crash mid-append is skipped on load and cut off
+before the next append.
+"""
+import json
+import os
+import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 
-import yaml
+from kodiak.api.broker import OrderStatus as BrokerOrderStatus
+from kodiak.models.order import Order, OrderStatus
+from kodiak.utils.logging import get_logger
+from kodiak.utils.yaml_io import load_yaml
 
-from kodiak.models.order import Order
+ORDERS_FILENAME = "orders.jsonl"
+# Pre-JSON store; read only when no orders.jsonl exists yet
+LEGACY_ORDERS_FILENAME = "orders.yaml"
+# Journal size past which `save_order` compacts it to one line per order
+COMPACT_THRESHOLD_BYTES = 1 << 20
+# How far back from the end to look for the last complete line of the journal
+_TAIL_SCAN_BYTES = 1 << 16
+
+logger = get_logger("trader.oms")
+
+# Local status for each broker status; broker-only states map to NEW
+_LOCAL_VALUES = {s.value for s in OrderStatus}
+LOCAL_STATUS_BY_BROKER = {
+    bs: OrderStatus(bs.value) if bs.value in _LOCAL_VALUES else OrderStatus.NEW
+    for bs in BrokerOrderStatus
+}
 
 
 def get_orders_file(config_dir: Path | None = None) -> Path:
@@ -11,22 +40,84 @@ def get_orders_file(config_dir: Path | None = None) -> Path:
         from kodiak.utils.paths import get_config_dir
         config_dir = get_config_dir()
     config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / "orders.yaml"
+    return config_dir / ORDERS_FILENAME
 
 
 def save_orders(orders: list[Order], config_dir: Path | None = None) -> None:
+    """Rewrite the orders file with one line per order.
+
+    The new file is written and fsynced beside the old one, then swapped in,
+    so a crash leaves either the old journal or the new one, never a mix.
+    """
     path = get_orders_file(config_dir)
-    data = {"orders": [o.to_dict() for o in orders]}
-    with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{ORDERS_FILENAME}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.writelines(json.dumps(o.to_dict()) + "\n" for o in orders)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
 
 
 def load_orders(config_dir: Path | None = None) -> list[Order]:
     path = get_orders_file(config_dir)
     if not path.exists():
+        return _load_legacy_orders(path.with_name(LEGACY_ORDERS_FILENAME))
+    if path.stat().st_size == 0:
         return []
     with open(path) as f:
-        data = yaml.safe_load(f) or {}
+        lines = [line for line in f if line.strip()]
+    records = []
+    for n, line in enumerate(lines, start=1):
+        try:
+            records.append(Order.from_dict(json.loads(line)))
+        except json.JSONDecodeError:
+            if n < len(lines):
+                raise
+            logger.warning(f"Skipping partial last line of {path}")
+    return _replay(records)
+
+
+def compact_orders(config_dir: Path | None = None) -> None:
+    """Rewrite the orders journal with only the latest record per order."""
+    save_orders(load_orders(config_dir), config_dir)
+
+
+def _replay(records: Iterable[Order]) -> list[Order]:
+    """Apply order records in turn, each replacing the first order it matches.
+
+    IDs match across fields too (broker vs local mapping), so both of each
+    order's IDs are indexed and both of a record's are looked up.
+    """
+    orders: list[Order] = []
+    index: dict[str, int] = {}
+    for record in records:
+        hits = [index[key] for key in (record.id, record.external_id) if key and key in index]
+        if hits:
+            i = min(hits)
+            old = orders[i]
+            for key in (old.id, old.external_id):
+                if key and index.get(key) == i:
+                    del index[key]
+            orders[i] = record
+        else:
+            i = len(orders)
+            orders.append(record)
+        for key in (record.id, record.external_id):
+            if key:
+                index[key] = min(index.get(key, i), i)
+    return orders
+
+
+def _load_legacy_orders(path: Path) -> list[Order]:
+    """Load orders from the old YAML store; the next save migrates them."""
+    if not path.exists():
+        return []
+    with open(path) as f:
+        data = load_yaml(f) or {}
     items = data.get("orders", [])
     return [Order.from_dict(i) for i in items]
 
@@ -61,7 +152,10 @@ def _to_local_order(order_obj: object) -> Order:
 
     status_raw = getattr(order_obj, "status", None)
     try:
-        status = LocalStatus(status_raw.value) if hasattr(status_raw, "value") else LocalStatus(status_raw)
+        if isinstance(status_raw, BrokerOrderStatus):
+            status = LOCAL_STATUS_BY_BROKER[status_raw]
+        else:
+            status = LocalStatus(status_raw.value) if hasattr(status_raw, "value") else LocalStatus(status_raw)
     except Exception:
         status = LocalStatus.NEW
 
@@ -81,26 +175,38 @@ def save_order(order_obj: object, config_dir: Path | None = None) -> None:
     """Save or update a single order to the orders file.
 
     Accepts either a local `Order` instance or a broker-like Order object.
+    The order is appended to the journal, replacing any order sharing an id
+    or external id on the next load.
     """
-    orders = load_orders(config_dir)
-
     local = order_obj if isinstance(order_obj, Order) else _to_local_order(order_obj)
 
-    # Replace existing by id if found
-    replaced = False
-    for i, o in enumerate(orders):
-        # Replace when IDs match, or when external IDs match (broker vs local mapping)
-        if (
-            (o.id and local.id and o.id == local.id)
-            or (o.external_id and local.external_id and o.external_id == local.external_id)
-            or (o.external_id and local.id and o.external_id == local.id)
-            or (o.id and local.external_id and o.id == local.external_id)
-        ):
-            orders[i] = local
-            replaced = True
-            break
-
-    if not replaced:
-        orders.append(local)
-
-    save_orders(orders, config_dir)
+    path = get_orders_file(config_dir)
+    if not path.exists():
+        # Starts the journal, migrating any legacy YAML orders into it
+        save_orders(_replay([*load_orders(config_dir), local]), config_dir)
+        return
+    _truncate_partial_line(path)
+    with open(path, "a") as f:
+        f.write(json.dumps(local.to_dict()) + "\n")
+    if path.stat().st_size > COMPACT_THRESHOLD_BYTES:
+        compact_orders(config_dir)
+
+
+def _truncate_partial_line(path: Path) -> None:
+    """Cut off a trailing line with no newline, so the next append starts clean."""
+    with open(path, "rb+") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        start = max(0, size - _TAIL_SCAN_BYTES)
+        f.seek(start)
+        tail = f.read()
+        if tail.endswith(b"\n"):
+            return
+        cut = tail.rfind(b"\n")
+        if cut < 0 and start > 0:
+            # No line break in sight; just end the line, which load then rejects loudly
+            f.write(b"\n")
+            return
+        logger.warning(f"Truncating partial last line of {path}")
+        f.truncate(start + cut + 1)
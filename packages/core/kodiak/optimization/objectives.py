@@ -1,24 +1,37 @@
 """Objective functions for optimization runs."""
 
+from collections.abc import Callable
 from decimal import Decimal
+from operator import attrgetter
 
 from kodiak.backtest.results import BacktestResult
 
+Scorer = Callable[[BacktestResult], Decimal]
+
+_SCORERS: dict[str, Scorer] = {
+    "total_return": attrgetter("total_return"),
+    "total_return_pct": attrgetter("total_return_pct"),
+    "win_rate": attrgetter("win_rate"),
+    "profit_factor": attrgetter("profit_factor"),
+    "max_drawdown_pct": lambda result: Decimal("0") - result.max_drawdown_pct,
+}
+
+
+def get_scorer(objective: str) -> Scorer:
+    """Return the scoring function for an objective.
+
+    Raises:
+        ValueError: if the objective is unknown.
+    """
+    try:
+        return _SCORERS[objective]
+    except KeyError:
+        raise ValueError(f"Unknown objective: {objective}") from None
+
 
 def score_result(result: BacktestResult, objective: str) -> Decimal:
     """Score a backtest result based on the requested objective."""
-    if objective == "total_return":
-        return result.total_return
-    if objective == "total_return_pct":
-        return result.total_return_pct
-    if objective == "win_rate":
-        return result.win_rate
-    if objective == "profit_factor":
-        return result.profit_factor
-    if objective == "max_drawdown_pct":
-        return Decimal("0") - result.max_drawdown_pct
-
-    raise ValueError(f"Unknown objective: {objective}")
+    return get_scorer(objective)(result)
 
 
 OBJECTIVES = {
@@ -2,22 +2,47 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from pathlib import Path
 from time import perf_counter
 from typing import Any
 
 import pandas as pd
 
-from kodiak.backtest import BacktestEngine, HistoricalBroker, load_data_for_backtest
-from kodiak.optimization.objectives import score_result
+from kodiak.backtest import BacktestEngine, BacktestResult, HistoricalBroker, load_data_for_backtest
+from kodiak.optimization.objectives import get_scorer
 from kodiak.optimization.results import OptimizationResult, new_result_id
 from kodiak.optimization.search import generate_grid, generate_random
 from kodiak.utils.logging import get_logger
 
 
+@dataclass(frozen=True)
+class _BacktestSpec:
+    """Everything a backtest needs besides its parameters and bars."""
+
+    strategy_type: str
+    symbol: str
+    start_date: datetime
+    end_date: datetime
+    initial_capital: Decimal
+    objective: str
+
+
 class Optimizer:
-    """Optimizes strategy parameters using backtesting."""
+    """Optimizes strategy parameters using backtesting.
+
+    Each parameter combination is an independent backtest over the same bars,
+    so combinations are spread across worker processes, one per CPU by default.
+    """
 
     def __init__(
         self,
@@ -30,6 +55,7 @@ class Optimizer:
         data_dir: str | None = None,
         initial_capital: float = 100000.0,
         historical_data: dict[str, pd.DataFrame] | None = None,
+        max_workers: int | None = None,
     ) -> None:
         self.strategy_type = strategy_type
         self.symbol = symbol
@@ -40,6 +66,8 @@ class Optimizer:
         self.data_dir = data_dir
         self.initial_capital = Decimal(str(initial_capital))
         self.historical_data = historical_data
+        # None means one worker process per CPU; 1 runs every backtest in-process
+        self.max_workers = max_workers
         self.logger = get_logger("trader.optimization")
 
     def optimize(
@@ -61,31 +89,37 @@ class Optimizer:
         if not param_sets:
             raise ValueError("No parameter combinations to evaluate")
 
+        # Resolved before any backtest runs, so an unknown objective fails fast
+        get_scorer(self.objective)
+
         start_time = perf_counter()
         best_score = None
         best_params = None
         best_backtest = None
+        best_entry: dict[str, Any] = {}
         results_summary: list[dict[str, Any]] = []
 
-        for params in param_sets:
-            backtest_result = self._run_single_backtest(params)
-            score = score_result(backtest_result, self.objective)
-            results_summary.append(
-                {
-                    "params": params,
-                    "score": score,
-                    "backtest_id": backtest_result.id,
-                }
-            )
+        spec = self._spec()
+        historical_data = self._load_data()
+        outcomes = _run_backtests(spec, historical_data, param_sets, self.max_workers)
+        for params, (score, backtest_id, backtest_result) in zip(param_sets, outcomes):
+            entry = {"params": params, "score": score, "backtest_id": backtest_id}
+            results_summary.append(entry)
 
             if best_score is None or score > best_score:
                 best_score = score
                 best_params = params
                 best_backtest = backtest_result
+                best_entry = entry
 
-        if best_score is None or best_params is None or best_backtest is None:
+        if best_score is None or best_params is None:
             raise ValueError("Optimization failed to produce any results")
 
+        if best_backtest is None:
+            # Worker processes return only scores; rebuild the winner's full result here
+            best_backtest = _run_backtest(spec, historical_data, best_params)
+            best_entry["backtest_id"] = best_backtest.id
+
         runtime = perf_counter() - start_time
 
         return OptimizationResult(
@@ -105,36 +139,166 @@ class Optimizer:
             runtime_seconds=runtime,
         )
 
-    def _run_single_backtest(self, params: dict[str, Any]):
-        strategy_config = _build_strategy_config(
+    def _spec(self) -> _BacktestSpec:
+        return _BacktestSpec(
             strategy_type=self.strategy_type,
             symbol=self.symbol,
-            params=params,
-        )
-
-        historical_data = self.historical_data
-        if historical_data is None:
-            historical_data = load_data_for_backtest(
-                symbols=[self.symbol],
-                start_date=self.start_date,
-                end_date=self.end_date,
-                data_source=self.data_source,
-                data_dir=self.data_dir,
-            )
-
-        broker = HistoricalBroker(
-            historical_data=historical_data,
-            initial_cash=self.initial_capital,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            initial_capital=self.initial_capital,
+            objective=self.objective,
         )
 
-        engine = BacktestEngine(
-            broker=broker,
-            strategy_config=strategy_config,
+    def _load_data(self) -> dict[str, pd.DataFrame]:
+        if self.historical_data is not None:
+            return self.historical_data
+        return load_data_for_backtest(
+            symbols=[self.symbol],
             start_date=self.start_date,
             end_date=self.end_date,
+            data_source=self.data_source,
+            data_dir=self.data_dir,
+        )
+
+
+# Score, backtest id, and the full result (None when it stayed in a worker process)
+_Outcome = tuple[Decimal, str, BacktestResult | None]
+
+
+def _run_backtests(
+    spec: _BacktestSpec,
+    historical_data: dict[str, pd.DataFrame],
+    param_sets: Sequence[dict[str, Any]],
+    max_workers: int | None,
+) -> Iterator[_Outcome]:
+    """Backtest each parameter set, yielding outcomes in `param_sets` order.
+
+    Worker processes send back only the score and id of each backtest, so a
+    large sweep never holds every result in memory.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(param_sets))
+    if workers < 2:
+        scorer = get_scorer(spec.objective)
+        for params in param_sets:
+            result = _run_backtest(spec, historical_data, params)
+            yield scorer(result), result.id, result
+        return
+
+    context = _process_context()
+    with ExitStack() as stack:
+        if context.get_start_method() == "fork":
+            # Forked workers read the parent's frames from copy-on-write pages
+            shared: SharedBars = historical_data
+        else:
+            # Other start methods would pickle the frames into every worker
+            tmp = stack.enter_context(
+                tempfile.TemporaryDirectory(prefix="kodiak-bars-", ignore_cleanup_errors=True)
+            )
+            shared = _write_shared_bars(historical_data, Path(tmp))
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(spec, shared),
         )
+        # An interrupted caller (e.g. a timeout) shouldn't wait on queued combinations
+        stack.callback(pool.shutdown, wait=False, cancel_futures=True)
+        for score, backtest_id in pool.map(
+            _run_worker_backtest,
+            param_sets,
+            chunksize=max(1, len(param_sets) // (4 * workers)),
+        ):
+            yield score, backtest_id, None
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    """Start method for worker processes.
+
+    Forking copies only the calling thread, so a lock held by any other thread
+    (a server's worker pool, a logging handler) stays locked in the child. Fork
+    is used only when this is the sole thread; otherwise a fork server is used
+    where available, and spawn elsewhere.
+    """
+    default = multiprocessing.get_start_method()
+    if default != "fork" or threading.active_count() == 1:
+        return multiprocessing.get_context(default)
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _run_backtest(
+    spec: _BacktestSpec, historical_data: dict[str, pd.DataFrame], params: dict[str, Any]
+) -> BacktestResult:
+    strategy_config = _build_strategy_config(
+        strategy_type=spec.strategy_type,
+        symbol=spec.symbol,
+        params=params,
+    )
+
+    broker = HistoricalBroker(
+        historical_data=historical_data,
+        initial_cash=spec.initial_capital,
+    )
+
+    engine = BacktestEngine(
+        broker=broker,
+        strategy_config=strategy_config,
+        start_date=spec.start_date,
+        end_date=spec.end_date,
+    )
+
+    return engine.run()
+
+
+# Set in each worker process by `_init_worker`
+_worker_spec: _BacktestSpec | None = None
+_worker_data: dict[str, pd.DataFrame] | None = None
+
+# Bars handed to workers: the frames themselves, or Arrow files holding them
+SharedBars = dict[str, pd.DataFrame] | dict[str, Path]
+
+
+def _init_worker(spec: _BacktestSpec, shared: SharedBars) -> None:
+    global _worker_spec, _worker_data
+    _worker_spec = spec
+    _worker_data = {
+        symbol: _read_shared_bars(bars) if isinstance(bars, Path) else bars
+        for symbol, bars in shared.items()
+    }
+
+
+def _write_shared_bars(
+    historical_data: dict[str, pd.DataFrame], directory: Path
+) -> dict[str, Path]:
+    """Write each symbol's bars to an Arrow IPC file that workers memory-map."""
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    paths = {}
+    for i, (symbol, df) in enumerate(historical_data.items()):
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        paths[symbol] = directory / f"{i}.arrow"
+        with ipc.new_file(paths[symbol], table.schema) as writer:
+            writer.write_table(table)
+    return paths
+
+
+def _read_shared_bars(path: Path) -> pd.DataFrame:
+    """Load bars written by `_write_shared_bars`, backed by the mapped file where possible."""
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    with pa.memory_map(str(path)) as source:
+        table = ipc.open_file(source).read_all()
+    # One block per column lets numeric columns stay views on the mapped pages
+    return table.to_pandas(split_blocks=True)
+
 
-        return engine.run()
+def _run_worker_backtest(params: dict[str, Any]) -> tuple[Decimal, str]:
+    assert _worker_spec is not None and _worker_data is not None
+    result = _run_backtest(_worker_spec, _worker_data, params)
+    return get_scorer(_worker_spec.objective)(result), result.id
 
 
 def _build_strategy_config(
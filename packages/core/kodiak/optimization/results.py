@@ -13,7 +13,7 @@ import pandas as pd
 from kodiak.backtest.results import BacktestResult
 
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationResult:
     """Results from parameter optimization."""
 
@@ -3,21 +3,64 @@
 from __future__ import annotations
 
 import itertools
+import math
 import random
-from typing import Any
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
 
 
-def generate_grid(param_grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
-    """Generate all combinations from a parameter grid."""
+class ParamGrid(Sequence[dict[str, Any]]):
+    """All combinations of a parameter grid, built on demand.
+
+    Combinations come in `itertools.product` order (last key varies fastest).
+    Only the grid itself is stored, so a large grid costs no memory until
+    its combinations are used.
+    """
+
+    def __init__(self, param_grid: dict[str, list[Any]]) -> None:
+        self._keys = list(param_grid.keys())
+        self._values = [list(param_grid[key]) for key in self._keys]
+        self._size = grid_size(param_grid)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if not self._size:
+            return
+        for combo in itertools.product(*self._values):
+            yield dict(zip(self._keys, combo, strict=True))
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ParamGrid index out of range")
+        combo = {}
+        for key, options in zip(reversed(self._keys), reversed(self._values), strict=True):
+            index, position = divmod(index, len(options))
+            combo[key] = options[position]
+        return {key: combo[key] for key in self._keys}
+
+
+def grid_size(param_grid: dict[str, list[Any]]) -> int:
+    """Number of combinations in a parameter grid (0 for an empty grid)."""
     if not param_grid:
-        return []
+        return 0
+    return math.prod(len(options) for options in param_grid.values())
 
-    keys = list(param_grid.keys())
-    values = [param_grid[key] for key in keys]
-    combos = []
-    for combo in itertools.product(*values):
-        combos.append(dict(zip(keys, combo, strict=False)))
-    return combos
+
+def generate_grid(param_grid: dict[str, list[Any]]) -> ParamGrid:
+    """Generate all combinations from a parameter grid."""
+    return ParamGrid(param_grid)
 
 
 def generate_random(
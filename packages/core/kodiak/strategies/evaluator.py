@@ -4,12 +4,21 @@ This module evaluates trading strategies and determines what actions to take
 based on current market conditions and strategy state.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
-from kodiak.api.broker import Broker, OrderSide, OrderStatus, OrderType
+from kodiak.api.broker import (
+    DEAD_ORDER_STATUSES,
+    Broker,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+from kodiak.api.snapshot import BrokerSnapshot
 from kodiak.oms.store import save_order
 from kodiak.strategies.loader import get_strategy, save_strategy
 from kodiak.strategies.models import EntryType, Strategy, StrategyPhase, StrategyType
@@ -28,6 +37,10 @@ class ActionType(Enum):
     FAIL = "fail"
 
 
+# Actions that submit an order to the broker.
+ORDER_ACTIONS = (ActionType.PLACE_ENTRY_ORDER, ActionType.PLACE_EXIT_ORDER)
+
+
 @dataclass
 class StrategyAction:
     """An action to take for a strategy.
@@ -50,44 +63,93 @@ class StrategyEvaluator:
     to take based on the strategy's current phase and market conditions.
     """
 
-    def __init__(self, broker: Broker, defaults: StrategyDefaults) -> None:
+    def __init__(
+        self,
+        broker: Broker,
+        defaults: StrategyDefaults,
+        max_order_workers: int = 8,
+        max_eval_workers: int = 16,
+    ) -> None:
         """Initialize the evaluator.
 
         Args:
             broker: Broker instance for market data and order execution.
             defaults: Default strategy parameters.
+            max_order_workers: Max concurrent broker order submissions per cycle.
+            max_eval_workers: Max symbols evaluated concurrently.
         """
         self.broker = broker
         self.defaults = defaults
+        self.max_order_workers = max_order_workers
+        self.max_eval_workers = max_eval_workers
+        self._eval_pool: ThreadPoolExecutor | None = None
         self.logger = get_logger("trader.strategies")
+        # Source of quotes; a per-cycle snapshot while evaluate() runs
+        self._market: Broker | BrokerSnapshot = broker
 
-    def evaluate(self, strategies: list[Strategy]) -> list[StrategyAction]:
+    def evaluate(
+        self, strategies: list[Strategy], snapshot: BrokerSnapshot | None = None
+    ) -> list[StrategyAction]:
         """Evaluate all strategies and return required actions.
 
         Args:
             strategies: List of strategies to evaluate.
+            snapshot: Per-cycle broker snapshot, so strategies on the same
+                symbol share one quote fetch.
 
         Returns:
             List of actions to take.
         """
-        actions = []
-
-        for strategy in strategies:
-            if not strategy.enabled:
-                continue
-
-            if strategy.is_terminal():
+        # Group by symbol: symbols are evaluated in parallel (each is dominated
+        # by broker round-trips), strategies sharing a symbol run in sequence
+        by_symbol: dict[str, list[tuple[int, Strategy]]] = {}
+        for idx, strategy in enumerate(strategies):
+            if not strategy.enabled or strategy.is_terminal():
                 continue
+            by_symbol.setdefault(strategy.symbol, []).append((idx, strategy))
 
+        self._market = snapshot if snapshot is not None else self.broker
+        try:
+            groups = list(by_symbol.values())
+            if len(groups) < 2:
+                results = [self._evaluate_group(g) for g in groups]
+            else:
+                results = list(self._get_eval_pool().map(self._evaluate_group, groups))
+        finally:
+            self._market = self.broker
+
+        # Restore input order
+        indexed = sorted(item for group in results for item in group)
+        return [action for _, action in indexed]
+
+    def _evaluate_group(
+        self, group: list[tuple[int, Strategy]]
+    ) -> list[tuple[int, StrategyAction]]:
+        """Evaluate strategies for one symbol, keeping their input positions."""
+        actions = []
+        for idx, strategy in group:
             try:
                 action = self._evaluate_strategy(strategy)
                 if action:
-                    actions.append(action)
+                    actions.append((idx, action))
             except Exception as e:
                 self.logger.error(f"Error evaluating strategy {strategy.id}: {e}")
-
         return actions
 
+    def _get_eval_pool(self) -> ThreadPoolExecutor:
+        """Get the long-lived evaluation pool, creating it on first use."""
+        if self._eval_pool is None:
+            self._eval_pool = ThreadPoolExecutor(
+                max_workers=self.max_eval_workers, thread_name_prefix="strategy_eval"
+            )
+        return self._eval_pool
+
+    def close(self) -> None:
+        """Shut down the evaluation worker pool."""
+        if self._eval_pool is not None:
+            self._eval_pool.shutdown(wait=False)
+            self._eval_pool = None
+
     def _evaluate_strategy(self, strategy: Strategy) -> StrategyAction | None:
         """Evaluate a single strategy based on its phase.
 
@@ -179,7 +241,7 @@ class StrategyEvaluator:
                 )
 
             # Get current price
-            quote = self.broker.get_quote(strategy.symbol)
+            quote = self._market.get_quote(strategy.symbol)
             current_price = (quote.bid + quote.ask) / 2
 
             # Check condition
@@ -213,7 +275,7 @@ class StrategyEvaluator:
                 reason="Pullback-trailing requires pullback_pct and trailing_stop_pct",
             )
 
-        quote = self.broker.get_quote(strategy.symbol)
+        quote = self._market.get_quote(strategy.symbol)
         current_price = (quote.bid + quote.ask) / 2
 
         # Initialize or update reference (high-water mark while waiting)
@@ -285,7 +347,7 @@ class StrategyEvaluator:
                 reason=f"Entry filled at ${order.filled_avg_price}",
             )
 
-        elif order.status in (OrderStatus.CANCELED, OrderStatus.REJECTED, OrderStatus.EXPIRED):
+        elif order.status in DEAD_ORDER_STATUSES:
             return StrategyAction(
                 strategy_id=strategy.id,
                 action_type=ActionType.FAIL,
@@ -325,7 +387,7 @@ class StrategyEvaluator:
             )
 
         # Get current price
-        quote = self.broker.get_quote(strategy.symbol)
+        quote = self._market.get_quote(strategy.symbol)
         current_price = (quote.bid + quote.ask) / 2
 
         # Update high watermark if price has risen
@@ -512,7 +574,7 @@ class StrategyEvaluator:
                     reason=f"Exit order filled at ${order.filled_avg_price}",
                 )
 
-            elif order.status in (OrderStatus.CANCELED, OrderStatus.REJECTED, OrderStatus.EXPIRED):
+            elif order.status in DEAD_ORDER_STATUSES:
                 return StrategyAction(
                     strategy_id=strategy.id,
                     action_type=ActionType.FAIL,
@@ -521,17 +583,28 @@ class StrategyEvaluator:
 
         return None
 
-    def execute_action(self, action: StrategyAction, dry_run: bool = False) -> bool:
+    def execute_action(
+        self,
+        action: StrategyAction,
+        dry_run: bool = False,
+        submitted: Order | Exception | None = None,
+        strategy: Strategy | None = None,
+    ) -> bool:
         """Execute a strategy action.
 
         Args:
             action: The action to execute.
             dry_run: If True, log but don't actually execute.
+            submitted: Result of an order already submitted for this action
+                (see ``submit_orders``). If None, the order is placed here.
+            strategy: The action's strategy, if already loaded. If None, it is
+                loaded here.
 
         Returns:
             True if action was successful.
         """
-        strategy = get_strategy(action.strategy_id)
+        if strategy is None:
+            strategy = get_strategy(action.strategy_id)
         if strategy is None:
             self.logger.error(f"Strategy {action.strategy_id} not found")
             return False
@@ -544,10 +617,10 @@ class StrategyEvaluator:
 
         try:
             if action.action_type == ActionType.PLACE_ENTRY_ORDER:
-                return self._execute_place_entry(strategy, action)
+                return self._execute_place_entry(strategy, action, submitted)
 
             elif action.action_type == ActionType.PLACE_EXIT_ORDER:
-                return self._execute_place_exit(strategy, action)
+                return self._execute_place_exit(strategy, action, submitted)
 
             elif action.action_type == ActionType.UPDATE_STATE:
                 return self._execute_update_state(strategy, action)
@@ -575,12 +648,69 @@ class StrategyEvaluator:
 
         return False
 
-    def _execute_place_entry(self, strategy: Strategy, action: StrategyAction) -> bool:
+    def _place_order(
+        self, action: StrategyAction, submitted: Order | Exception | None
+    ) -> Order:
+        """Return the order for an action, placing it unless already submitted."""
+        if isinstance(submitted, Exception):
+            raise submitted
+        if submitted is not None:
+            return submitted
+        return self.broker.place_order(**action.order_params)
+
+    def submit_orders(
+        self, actions: list[StrategyAction], strategies: dict[str, Strategy]
+    ) -> dict[int, Order | Exception]:
+        """Submit the orders of all order-placing actions concurrently.
+
+        Broker round-trips dominate a cycle with many strategies, so orders are
+        sent in parallel and persisted afterwards, serially, by ``execute_action``.
+
+        Args:
+            actions: Actions from ``evaluate``.
+            strategies: Loaded strategies by ID. Actions whose strategy is
+                missing are not submitted.
+
+        Returns:
+            Dict mapping ``id(action)`` to the placed order, or the exception
+            raised while placing it.
+        """
+        order_actions = [
+            a
+            for a in actions
+            if a.action_type in ORDER_ACTIONS
+            and a.order_params is not None
+            and a.strategy_id in strategies
+        ]
+        if len(order_actions) < 2:
+            # Nothing to overlap; let execute_action place it inline
+            return {}
+
+        results: dict[int, Order | Exception] = {}
+        workers = min(len(order_actions), self.max_order_workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="order_submit") as pool:
+            futures = {
+                id(a): pool.submit(self.broker.place_order, **a.order_params)
+                for a in order_actions
+            }
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    results[key] = e
+        return results
+
+    def _execute_place_entry(
+        self,
+        strategy: Strategy,
+        action: StrategyAction,
+        submitted: Order | Exception | None = None,
+    ) -> bool:
         """Place an entry order and update strategy state."""
         if action.order_params is None:
             return False
 
-        order = self.broker.place_order(**action.order_params)
+        order = self._place_order(action, submitted)
 
         # Persist order locally
         try:
@@ -596,12 +726,17 @@ class StrategyEvaluator:
         self.logger.info(f"Entry order {order.id} placed for strategy {strategy.id}")
         return True
 
-    def _execute_place_exit(self, strategy: Strategy, action: StrategyAction) -> bool:
+    def _execute_place_exit(
+        self,
+        strategy: Strategy,
+        action: StrategyAction,
+        submitted: Order | Exception | None = None,
+    ) -> bool:
         """Place an exit order and update strategy state."""
         if action.order_params is None:
             return False
 
-        order = self.broker.place_order(**action.order_params)
+        order = self._place_order(action, submitted)
 
         # Persist order locally
         try:
@@ -630,25 +765,52 @@ class StrategyEvaluator:
         save_strategy(strategy)
         return True
 
-    def run_once(self, strategies: list[Strategy], dry_run: bool = False) -> list[str]:
+    def run_once(
+        self,
+        strategies: list[Strategy],
+        dry_run: bool = False,
+        snapshot: BrokerSnapshot | None = None,
+    ) -> list[str]:
         """Evaluate all strategies and execute actions.
 
         Args:
             strategies: List of strategies to evaluate.
             dry_run: If True, don't actually execute.
+            snapshot: Per-cycle broker snapshot for read-only broker calls.
 
         Returns:
             List of strategy IDs that had actions executed.
         """
-        actions = self.evaluate(strategies)
+        actions = self.evaluate(strategies, snapshot=snapshot)
 
         if not actions:
             self.logger.debug("No strategy actions needed")
             return []
 
+        # Load strategies before any order goes out, so an order is never left
+        # at the broker for a strategy that was removed since evaluation
+        loaded: dict[str, Strategy] = {}
+        for action in actions:
+            if action.strategy_id not in loaded:
+                strategy = get_strategy(action.strategy_id)
+                if strategy is not None:
+                    loaded[action.strategy_id] = strategy
+
+        # Enqueue all broker orders at once, then apply state changes in order
+        submitted = {} if dry_run else self.submit_orders(actions, loaded)
+
         executed_ids = []
         for action in actions:
-            if self.execute_action(action, dry_run=dry_run):
+            strategy = loaded.get(action.strategy_id)
+            if strategy is None:
+                self.logger.error(f"Strategy {action.strategy_id} not found")
+                continue
+            if self.execute_action(
+                action,
+                dry_run=dry_run,
+                submitted=submitted.get(id(action)),
+                strategy=strategy,
+            ):
                 executed_ids.append(action.strategy_id)
 
         return executed_ids
@@ -6,9 +6,8 @@ Strategies are stored in YAML format at config/strategies.yaml.
 from datetime import datetime
 from pathlib import Path
 
-import yaml
-
 from kodiak.strategies.models import Strategy
+from kodiak.utils.yaml_io import dump_yaml, load_yaml
 
 
 def get_strategies_file(config_dir: Path | None = None) -> Path:
@@ -35,7 +34,7 @@ def load_strategies(config_dir: Path | None = None) -> list[Strategy]:
         return []
 
     with open(strategies_file) as f:
-        data = yaml.safe_load(f)
+        data = load_yaml(f)
 
     if not data or "strategies" not in data:
         return []
@@ -55,7 +54,7 @@ def save_strategies(strategies: list[Strategy], config_dir: Path | None = None)
     data = {"strategies": [s.to_dict() for s in strategies]}
 
     with open(strategies_file, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        dump_yaml(data, f)
 
 
 def save_strategy(strategy: Strategy, config_dir: Path | None = None) -> None:
@@ -144,21 +143,21 @@ def enable_strategy(strategy_id: str, enabled: bool = True, config_dir: Path | N
     return True
 
 
-def get_active_strategies(config_dir: Path | None = None) -> list[Strategy]:
-    """Get all active (non-terminal, enabled) strategies.
+def filter_active_strategies(
+    strategies: list[Strategy], now: datetime | None = None
+) -> list[Strategy]:
+    """Select active (non-terminal, enabled) strategies from a loaded list.
 
     Excludes strategies that are scheduled but haven't reached their schedule time yet.
 
     Args:
-        config_dir: Config directory path.
+        strategies: Strategies to filter.
+        now: Reference time for schedules (defaults to now).
 
     Returns:
         List of active strategies.
     """
-    from datetime import datetime
-
-    strategies = load_strategies(config_dir)
-    now = datetime.now()
+    now = now or datetime.now()
 
     active = []
     for s in strategies:
@@ -177,3 +176,17 @@ def get_active_strategies(config_dir: Path | None = None) -> list[Strategy]:
         active.append(s)
 
     return active
+
+
+def get_active_strategies(config_dir: Path | None = None) -> list[Strategy]:
+    """Get all active (non-terminal, enabled) strategies.
+
+    Excludes strategies that are scheduled but haven't reached their schedule time yet.
+
+    Args:
+        config_dir: Config directory path.
+
+    Returns:
+        List of active strategies.
+    """
+    return filter_active_strategies(load_strategies(config_dir))
@@ -124,6 +124,21 @@ class Config:
         return self.env == Environment.PROD
 
 
+def dotenv_files() -> list[Path]:
+    """.env files `load_config` reads, in load order.
+
+    Project root, CWD, then config .env (so CLI-set values are used).
+    """
+    from kodiak.utils.paths import get_config_dir, get_project_root
+
+    return [
+        get_project_root() / ".env",
+        Path.cwd() / ".env",
+        get_config_dir().parent / ".env",
+        Path.home() / ".kodiak" / ".env",
+    ]
+
+
 def load_config(
     service: str | None = None,
     prod: bool = False,
@@ -137,17 +152,10 @@ def load_config(
     Returns:
         Config object with loaded settings.
     """
-    from kodiak.utils.paths import get_config_dir, get_project_root
+    from kodiak.utils.paths import get_project_root
     project_root = get_project_root()
 
-    # Load .env files: project root, CWD, then config .env (so CLI-set values are used).
-    config_parent = get_config_dir().parent
-    for candidate in [
-        project_root / ".env",
-        Path.cwd() / ".env",
-        config_parent / ".env",
-        Path.home() / ".kodiak" / ".env",
-    ]:
+    for candidate in dotenv_files():
         if candidate.is_file():
             load_dotenv(candidate)
 
@@ -179,7 +187,7 @@ def load_config(
         alpaca_secret_key = os.getenv("ALPACA_SECRET_KEY", "")
 
     # Set up directories - use user directories when installed, project dirs in dev
-    from kodiak.utils.paths import get_config_dir, get_data_dir, get_log_dir
+    from kodiak.utils.paths import get_data_dir, get_log_dir
 
     # Check if we're in development mode (config dir exists in project root)
     is_dev_mode = (project_root / "config" / "strategies.yaml").exists() or (project_root / "pyproject.toml").exists()
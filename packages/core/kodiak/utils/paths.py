@@ -6,11 +6,13 @@ Uses XDG Base Directory spec on Linux, standard locations on macOS/Windows.
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 from pathlib import Path
 
 
+@functools.cache
 def _find_repo_root() -> Path | None:
     """Walk up from this file to find the monorepo root (contains .git)."""
     current = Path(__file__).resolve().parent
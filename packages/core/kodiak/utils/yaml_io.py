@@ -0,0 +1,22 @@
+"""YAML reading and writing through libyaml when PyYAML was built with it."""
+
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+
+# The C loader/dumper parse and emit the same documents as the pure-Python
+# ones, several times faster; PyYAML builds without libyaml lack them
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+def load_yaml(stream: IO[str] | str) -> Any:
+    """Parse a YAML document with safe (plain data only) semantics."""
+    return yaml.load(stream, Loader=_Loader)
+
+
+def dump_yaml(data: Any, stream: IO[str]) -> None:
+    """Write data as block-style YAML, keeping dict key order."""
+    yaml.dump(data, stream, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
+import gzip
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
 import pandas as pd
-from bokeh.embed import json_item
+from bokeh.embed import file_html, json_item
 from bokeh.io import output_file, save, show
 from bokeh.layouts import column
 from bokeh.models import ColumnDataSource, HoverTool
 from bokeh.plotting import figure
+from bokeh.resources import CDN
 
 from kodiak.backtest.results import BacktestResult
 
@@ -66,10 +68,19 @@ class ChartBuilder:
         return self._layout
 
     def save_html(self, filepath: str) -> None:
-        """Save chart to a standalone HTML file."""
+        """Save chart to a standalone HTML file.
+
+        Paths ending in ``.gz`` are written gzip-compressed.
+        """
         if self._layout is None:
             self.build()
-        output_file(filepath, title=f"Backtest {self.result.id}")
+        title = f"Backtest {self.result.id}"
+        if str(filepath).endswith(".gz"):
+            html = file_html(self._layout, CDN, title)
+            with gzip.open(filepath, "wt", encoding="utf-8") as f:
+                f.write(html)
+            return
+        output_file(filepath, title=title)
         save(self._layout)
 
     def to_json(self) -> dict:
@@ -0,0 +1,11 @@
+"""Shared pytest fixtures."""
+from pathlib import Path
+
+import pytest
+from kodiak.data import ledger
+
+
+@pytest.fixture(autouse=True)
+def _isolated_ledger(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the default TradeLedger out of the source tree's data directory."""
+    monkeypatch.setattr(ledger, "DEFAULT_DB_PATH", tmp_path / "trades.db")
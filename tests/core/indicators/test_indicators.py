@@ -46,3 +46,85 @@ def test_indicator_calculations() -> None:
         indicator_obj = get_indicator(name, **params)
         output = indicator_obj.calculate(data)
         assert output is not None
+
+
+def test_rsi_fallback_uses_wilder_smoothing(monkeypatch) -> None:
+    from kodiak.indicators import momentum
+
+    monkeypatch.setattr(momentum, "get_pandas_ta", lambda: None)
+    close = pd.Series([10.0, 11.0, 10.0, 11.0, 12.0])
+    rsi = get_indicator("rsi", period=2).calculate(pd.DataFrame({"close": close}))
+
+    # avg = EWM(alpha=1/2) of gains [1, 0, 1, 1] and losses [0, 1, 0, 0]
+    assert rsi.name == "rsi_2"
+    assert rsi.iloc[:2].isna().all()
+    assert rsi.iloc[2:].round(4).tolist() == [33.3333, 71.4286, 86.6667]
+
+
+def test_macd_fallback_matches_ema_definition(monkeypatch) -> None:
+    from kodiak.indicators import momentum
+
+    monkeypatch.setattr(momentum, "get_pandas_ta", lambda: None)
+    data = _sample_data()
+    data["close"] = data["close"] + [(-1) ** i * 2 for i in range(30)]
+    macd = get_indicator("macd", fast=3, slow=6, signal=4).calculate(data)
+
+    close = data["close"]
+    expected = close.ewm(span=3, adjust=False).mean() - close.ewm(span=6, adjust=False).mean()
+    signal = expected.ewm(span=4, adjust=False).mean()
+    assert list(macd.columns) == ["MACD", "SIGNAL", "HISTOGRAM"]
+    pd.testing.assert_series_equal(macd["MACD"], expected, check_names=False)
+    pd.testing.assert_series_equal(macd["SIGNAL"], signal, check_names=False)
+    pd.testing.assert_series_equal(macd["HISTOGRAM"], expected - signal, check_names=False)
+
+
+def test_obv_fallback_accumulates_signed_volume(monkeypatch) -> None:
+    from kodiak.indicators import volume
+
+    monkeypatch.setattr(volume, "get_pandas_ta", lambda: None)
+    data = pd.DataFrame(
+        {"close": [10.0, 11.0, 11.0, 9.0, 12.0], "volume": [100.0, 200.0, 300.0, 400.0, 500.0]}
+    )
+    obv = get_indicator("obv").calculate(data)
+
+    assert obv.name == "obv"
+    assert obv.tolist() == [0.0, 200.0, 200.0, -200.0, 300.0]
+
+
+def test_bbands_fallback_uses_sample_std(monkeypatch) -> None:
+    from kodiak.indicators import volatility
+
+    monkeypatch.setattr(volatility, "get_pandas_ta", lambda: None)
+    data = pd.DataFrame({"close": [1.0, 2.0, 3.0, 4.0]})
+    bands = get_indicator("bbands", period=3, stddev=2.0).calculate(data)
+
+    assert list(bands.columns) == ["BBL", "BBM", "BBU"]
+    assert bands["BBM"].iloc[2:].tolist() == [2.0, 3.0]
+    assert bands["BBU"].iloc[2:].tolist() == [4.0, 5.0]
+    assert bands["BBL"].iloc[2:].tolist() == [0.0, 1.0]
+    assert bands.iloc[:2].isna().all().all()
+
+
+def test_atr_fallback_true_range_includes_gaps(monkeypatch) -> None:
+    from kodiak.indicators import volatility
+
+    monkeypatch.setattr(volatility, "get_pandas_ta", lambda: None)
+    data = pd.DataFrame(
+        {
+            "high": [11.0, 15.0, 9.0],
+            "low": [9.0, 13.0, 7.0],
+            "close": [10.0, 14.0, 8.0],
+        }
+    )
+    atr = get_indicator("atr", period=1).calculate(data)
+
+    # Gap up from 10 and gap down from 14 widen the range past high - low
+    assert atr.tolist() == [2.0, 5.0, 7.0]
+
+
+def test_get_indicator_returns_a_new_instance_per_call() -> None:
+    first = get_indicator("sma", period=20)
+    second = get_indicator("sma", period=20)
+
+    assert first is not second
+    assert type(first) is type(second)
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
+from kodiak.notifications.channels.base import http_session
 from kodiak.notifications.channels.discord import DiscordChannel
 from kodiak.notifications.formatters import TradeNotification
 
@@ -20,7 +21,7 @@ def test_discord_channel_requires_url() -> None:
 
 def test_discord_channel_name() -> None:
     """Discord channel name is 'discord'."""
-    with patch.object(requests, "post") as mock_post:
+    with patch.object(requests.Session, "post") as mock_post:
         mock_post.return_value = MagicMock(status_code=204)
         ch = DiscordChannel("https://discord.com/api/webhooks/123/abc")
     assert ch.name == "discord"
@@ -28,19 +29,19 @@ def test_discord_channel_name() -> None:
 
 def test_discord_send_posts_json() -> None:
     """Discord send POSTs content to webhook URL."""
-    with patch.object(requests, "post") as mock_post:
+    with patch.object(requests.Session, "post") as mock_post:
         mock_post.return_value = MagicMock(status_code=204)
         ch = DiscordChannel("https://discord.com/api/webhooks/123/abc")
         ch.send("Hello world")
     mock_post.assert_called_once()
     call_kw = mock_post.call_args[1]
     assert call_kw["json"]["content"] == "Hello world"
-    assert "application/json" in str(call_kw["headers"])
+    assert http_session().headers["Content-Type"] == "application/json"
 
 
 def test_discord_send_raises_on_http_error() -> None:
     """Discord send raises on non-2xx response."""
-    with patch.object(requests, "post") as mock_post:
+    with patch.object(requests.Session, "post") as mock_post:
         mock_post.return_value = MagicMock(status_code=400)
         mock_post.return_value.raise_for_status.side_effect = requests.HTTPError("400")
         ch = DiscordChannel("https://discord.com/api/webhooks/123/abc")
@@ -1,8 +1,10 @@
 """Tests for NotificationManager."""
 
 import os
+import threading
 from unittest.mock import patch
 
+from kodiak.notifications.channels.base import NotificationChannel
 from kodiak.notifications.formatters import TradeNotification
 from kodiak.notifications.manager import NotificationManager, _resolve_url
 
@@ -74,3 +76,47 @@ def test_manager_get_channel() -> None:
         manager = NotificationManager({})
     assert manager.get_channel("discord") is not None
     assert manager.get_channel("nonexistent") is None
+
+
+class _SlowChannel(NotificationChannel):
+    def __init__(
+        self, name: str, barrier: threading.Barrier, release: threading.Event, fail: bool = False
+    ) -> None:
+        self._name = name
+        self.barrier = barrier
+        self.release = release
+        self.fail = fail
+        self.done = threading.Event()
+        self.sent: list[tuple[str, object]] = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def send(self, message: str, **kwargs: object) -> None:
+        try:
+            # Both channels must be in flight at once for the barrier to release
+            self.barrier.wait(timeout=5)
+            self.release.wait(timeout=5)
+            if self.fail:
+                raise RuntimeError("webhook down")
+            self.sent.append((message, kwargs.get("event")))
+        finally:
+            self.done.set()
+
+
+def test_manager_sends_to_channels_concurrently_without_blocking() -> None:
+    """send returns before delivery; channels run in parallel and one failure is isolated."""
+    barrier, release = threading.Barrier(2), threading.Event()
+    ok = _SlowChannel("ok", barrier, release)
+    down = _SlowChannel("down", barrier, release, fail=True)
+    manager = NotificationManager({})
+    manager._channels = [ok, down]
+
+    manager.send("error", {"message": "boom"})
+    assert ok.sent == []
+
+    release.set()
+    assert ok.done.wait(timeout=5) and down.done.wait(timeout=5)
+    assert ok.sent == [("boom", "error")]
+    assert not barrier.broken
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
+from kodiak.notifications.channels import base
 from kodiak.notifications.channels.webhook import WebhookChannel
 
 
@@ -18,7 +19,7 @@ def test_webhook_channel_requires_url() -> None:
 
 def test_webhook_send_posts_json() -> None:
     """Webhook send POSTs JSON with message and optional event."""
-    with patch.object(requests, "post") as mock_post:
+    with patch.object(requests.Session, "post") as mock_post:
         mock_post.return_value = MagicMock(status_code=200)
         ch = WebhookChannel("https://example.com/webhook")
         ch.send("Test message", event="trade_opened")
@@ -26,3 +27,23 @@ def test_webhook_send_posts_json() -> None:
     call_kw = mock_post.call_args[1]
     assert call_kw["json"]["message"] == "Test message"
     assert call_kw["json"]["event"] == "trade_opened"
+
+
+def test_channels_share_one_pooled_session() -> None:
+    """Sends reuse one session, retrying only what can't duplicate a message."""
+    base.close_http_session()
+    session = base.http_session()
+    assert base.http_session() is session
+
+    retry = session.get_adapter("https://example.com").max_retries
+    assert retry.total == 2
+    assert retry.read == 0
+    assert tuple(retry.status_forcelist) == (429,)
+    assert "POST" in retry.allowed_methods
+
+    # A long Retry-After is cut down so a rate-limited send can't stall close()
+    response = MagicMock(headers={"Retry-After": "3600"})
+    assert retry.get_retry_after(response) == base.MAX_RETRY_WAIT_SECONDS
+
+    base.close_http_session()
+    assert base.http_session() is not session
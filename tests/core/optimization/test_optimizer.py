@@ -4,6 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 
 import pandas as pd
+import pytest
 
 from kodiak.backtest.results import BacktestResult
 from kodiak.optimization.objectives import score_result
@@ -88,3 +89,86 @@ def test_optimizer_grid_search() -> None:
         Decimal("2"),
         Decimal("3"),
     )
+
+
+def test_optimizer_worker_processes_match_in_process_run() -> None:
+    def run(max_workers: int):
+        optimizer = Optimizer(
+            strategy_type="trailing-stop",
+            symbol="AAPL",
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 10),
+            historical_data=_sample_data(),
+            max_workers=max_workers,
+        )
+        return optimizer.optimize(
+            param_grid={"trailing_stop_pct": [Decimal("1"), Decimal("2"), Decimal("3")]},
+        )
+
+    serial, parallel = run(1), run(2)
+
+    assert [r["params"] for r in parallel.all_results] == [r["params"] for r in serial.all_results]
+    assert [r["score"] for r in parallel.all_results] == [r["score"] for r in serial.all_results]
+    assert parallel.best_params == serial.best_params
+    assert parallel.best_backtest.total_return_pct == serial.best_backtest.total_return_pct
+    best_ids = [r["backtest_id"] for r in parallel.all_results if r["params"] == parallel.best_params]
+    assert best_ids == [parallel.best_backtest.id]
+
+
+def test_worker_processes_are_not_forked_while_other_threads_run() -> None:
+    import threading
+
+    from kodiak.optimization.optimizer import _process_context
+
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        assert _process_context().get_start_method() != "fork"
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_shared_bars_round_trip_through_arrow_files(tmp_path) -> None:
+    from kodiak.optimization.optimizer import _read_shared_bars, _write_shared_bars
+
+    data = _sample_data()
+    paths = _write_shared_bars(data, tmp_path)
+
+    pd.testing.assert_frame_equal(_read_shared_bars(paths["AAPL"]), data["AAPL"], check_freq=False)
+
+
+def test_param_grid_indexes_combinations_lazily() -> None:
+    from kodiak.optimization.search import grid_size
+
+    param_grid = {"a": [1, 2, 3], "b": ["x", "y"], "c": [True]}
+    grid = generate_grid(param_grid)
+
+    assert len(grid) == grid_size(param_grid) == 6
+    assert [grid[i] for i in range(len(grid))] == list(grid)
+    assert grid[-1] == {"a": 3, "b": "y", "c": True}
+    assert grid[1:3] == [{"a": 1, "b": "y", "c": True}, {"a": 2, "b": "x", "c": True}]
+    assert len(generate_grid({})) == 0
+    assert len(generate_grid({"a": []})) == 0
+
+
+def test_optimizer_rejects_unknown_objective_before_backtesting(monkeypatch) -> None:
+    from kodiak.optimization import optimizer as optimizer_module
+
+    def fail(*args, **kwargs):
+        raise AssertionError("backtest should not run")
+
+    monkeypatch.setattr(optimizer_module, "_run_backtest", fail)
+    optimizer = Optimizer(
+        strategy_type="trailing-stop",
+        symbol="AAPL",
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 1, 10),
+        objective="sortino",
+        historical_data=_sample_data(),
+        max_workers=1,
+    )
+
+    with pytest.raises(ValueError, match="Unknown objective: sortino"):
+        optimizer.optimize(param_grid={"trailing_stop_pct": [Decimal("2")]})
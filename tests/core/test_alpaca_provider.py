@@ -0,0 +1,86 @@
+"""Tests for AlpacaDataProvider request handling."""
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from kodiak.data.providers import alpaca_provider
+from kodiak.data.providers.alpaca_provider import AlpacaDataProvider
+
+
+class FakeBarsClient:
+    def __init__(self) -> None:
+        self.requested: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def get_stock_bars(self, request):
+        symbols = list(request.symbol_or_symbols)
+        with self._lock:
+            self.requested.append(symbols)
+        index = pd.MultiIndex.from_product(
+            [symbols, pd.date_range("2024-01-02", periods=2, freq="D", tz="UTC")],
+            names=["symbol", "timestamp"],
+        )
+        df = pd.DataFrame(
+            {"open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 10.0},
+            index=index,
+        )
+        return SimpleNamespace(df=df)
+
+
+def test_large_symbol_lists_are_chunked(monkeypatch) -> None:
+    monkeypatch.setattr(alpaca_provider, "MAX_SYMBOLS_PER_REQUEST", 2)
+    provider = AlpacaDataProvider("key", "secret")
+    provider.client = FakeBarsClient()
+    symbols = ["AAPL", "GOOGL", "MSFT", "TSLA", "AMZN"]
+
+    bars = provider.get_bars(symbols, datetime(2024, 1, 1), datetime(2024, 1, 5))
+
+    assert sorted(map(tuple, provider.client.requested)) == [
+        ("AAPL", "GOOGL"),
+        ("AMZN",),
+        ("MSFT", "TSLA"),
+    ]
+    assert set(bars) == set(symbols)
+    assert all(len(df) == 2 for df in bars.values())
+
+
+def test_normalize_bars_converts_naive_utc_index_to_eastern() -> None:
+    index = pd.DatetimeIndex(["2024-01-03 15:00", "2024-01-02 15:00"], name="timestamp")
+    df = pd.DataFrame(
+        {"Open": [1, 2], "High": [1, 2], "Low": [1, 2], "Close": [1, 2], "Volume": [5, 6]},
+        index=index,
+    )
+
+    bars = alpaca_provider._normalize_bars(df, ["AAPL"])
+
+    assert list(bars.index.strftime("%Y-%m-%d %H:%M")) == ["2024-01-02 10:00", "2024-01-03 10:00"]
+    assert str(bars.index.tz) == "US/Eastern"
+    assert (bars.dtypes == "float64").all()
+    assert bars["close"].tolist() == [2.0, 1.0]
+
+
+def test_normalize_bars_names_nan_columns() -> None:
+    index = pd.DatetimeIndex(["2024-01-02 15:00"], name="timestamp")
+    df = pd.DataFrame(
+        {"open": [1.0], "high": [None], "low": [1.0], "close": [1.0], "volume": [5.0]},
+        index=index,
+    )
+
+    with pytest.raises(ValueError, match=r"NaN values in \['high'\]"):
+        alpaca_provider._normalize_bars(df, ["AAPL"])
+
+
+def test_bars_are_split_per_symbol_in_eastern_time() -> None:
+    provider = AlpacaDataProvider("key", "secret")
+    provider.client = FakeBarsClient()
+
+    bars = provider.get_bars(["MSFT", "AAPL"], datetime(2024, 1, 1), datetime(2024, 1, 5))
+
+    assert list(bars) == ["AAPL", "MSFT"]
+    for df in bars.values():
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert df.index.name == "timestamp"
+        assert str(df.index.tz) == "US/Eastern"
+        assert df.index[0] == pd.Timestamp("2024-01-02", tz="UTC")
@@ -0,0 +1,71 @@
+"""Tests for the per-cycle BrokerSnapshot."""
+from decimal import Decimal
+
+from kodiak.api.broker import Position
+from kodiak.api.snapshot import BrokerSnapshot
+
+from tests.core.mocks import MockBroker
+
+
+class CountingBroker(MockBroker):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def get_account(self):
+        self._count("get_account")
+        return super().get_account()
+
+    def get_positions(self):
+        self._count("get_positions")
+        return super().get_positions()
+
+    def get_quote(self, symbol: str):
+        self._count("get_quote")
+        return super().get_quote(symbol)
+
+
+def test_snapshot_fetches_each_resource_once() -> None:
+    broker = CountingBroker()
+    broker.add_position(
+        Position(
+            symbol="AAPL",
+            qty=Decimal("1"),
+            avg_entry_price=Decimal("170"),
+            current_price=Decimal("175"),
+            market_value=Decimal("175"),
+            unrealized_pl=Decimal("5"),
+            unrealized_pl_pct=Decimal("0.03"),
+        )
+    )
+    snapshot = BrokerSnapshot(broker)
+
+    for _ in range(3):
+        snapshot.get_account()
+        snapshot.get_quote("AAPL")
+        assert snapshot.get_position("AAPL").qty == Decimal("1")
+        assert snapshot.get_position("MSFT") is None
+
+    assert broker.calls == {"get_account": 1, "get_positions": 1, "get_quote": 1}
+
+
+def test_prefetch_quotes_batches_missing_symbols() -> None:
+    broker = CountingBroker()
+    batches = []
+    original = broker.get_quotes
+
+    def get_quotes(symbols):
+        batches.append(list(symbols))
+        return original(symbols)
+
+    broker.get_quotes = get_quotes
+    snapshot = BrokerSnapshot(broker)
+    snapshot.get_quote("AAPL")
+    snapshot.prefetch_quotes(["AAPL", "GOOGL", "MSFT", "GOOGL"])
+
+    assert batches == [["GOOGL", "MSFT"]]
+    assert snapshot.get_quote("MSFT").symbol == "MSFT"
+    assert broker.calls["get_quote"] == 3  # 1 direct + 2 via default get_quotes
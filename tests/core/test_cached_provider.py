@@ -0,0 +1,134 @@
+"""Tests for the Parquet-backed CachedDataProvider."""
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+from kodiak.data.providers.base import DataProvider, TimeFrame
+from kodiak.data.providers.cached_provider import CachedDataProvider
+
+
+class CountingProvider(DataProvider):
+    def __init__(self) -> None:
+        self.requests: list[tuple[list[str], datetime, datetime]] = []
+
+    def get_bars(self, symbols, start, end, timeframe=TimeFrame.DAY_1):
+        self.requests.append((list(symbols), start, end))
+        index = pd.date_range(start, end, freq="D", tz="UTC", name="timestamp")
+        return {
+            symbol: pd.DataFrame(
+                {
+                    "open": float(i),
+                    "high": float(i),
+                    "low": float(i),
+                    "close": float(i),
+                    "volume": 100.0,
+                },
+                index=index,
+            )
+            for i, symbol in enumerate(symbols)
+        }
+
+
+def test_cached_bars_are_read_back_per_symbol(tmp_path: Path) -> None:
+    upstream = CountingProvider()
+    provider = CachedDataProvider(upstream, tmp_path)
+    symbols = ["AAPL", "GOOGL", "MSFT"]
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 10)
+
+    first = provider.get_bars(symbols, start, end)
+    second = provider.get_bars(symbols, start, end)
+
+    assert [r[0] for r in upstream.requests] == [symbols]
+    for symbol in symbols:
+        pd.testing.assert_frame_equal(second[symbol], first[symbol], check_freq=False)
+
+
+def test_overlapping_range_fetches_only_the_gap(tmp_path: Path) -> None:
+    upstream = CountingProvider()
+    provider = CachedDataProvider(upstream, tmp_path)
+
+    provider.get_bars(["AAPL"], datetime(2024, 1, 1), datetime(2024, 1, 10))
+    bars = provider.get_bars(["AAPL"], datetime(2024, 1, 5), datetime(2024, 1, 20))["AAPL"]
+
+    assert upstream.requests[1] == (
+        ["AAPL"],
+        datetime(2024, 1, 10, tzinfo=UTC),
+        datetime(2024, 1, 20, tzinfo=UTC),
+    )
+    assert bars.index[0] == pd.Timestamp("2024-01-05", tz="UTC")
+    assert bars.index[-1] == pd.Timestamp("2024-01-20", tz="UTC")
+    assert bars.index.is_unique
+
+    # Anything inside the stored union is served without an upstream call
+    inner = provider.get_bars(["AAPL"], datetime(2024, 1, 2), datetime(2024, 1, 15))["AAPL"]
+    assert len(upstream.requests) == 2
+    assert len(inner) == 14
+    assert sorted(p.name for p in (tmp_path / "AAPL").iterdir()) == ["1Day.json", "1Day.parquet"]
+
+
+def test_cache_files_are_zstd_compressed(tmp_path: Path) -> None:
+    provider = CachedDataProvider(CountingProvider(), tmp_path)
+    provider.get_bars(["AAPL"], datetime(2024, 1, 1), datetime(2024, 1, 10))
+
+    metadata = pq.ParquetFile(tmp_path / "AAPL" / "1Day.parquet").metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def _backdate(sidecar: Path, seconds: float) -> None:
+    data = json.loads(sidecar.read_text())
+    for r in data["ranges"]:
+        r["fetched_at"] -= seconds
+    sidecar.write_text(json.dumps(data))
+
+
+def test_expired_cache_file_is_refetched(tmp_path: Path) -> None:
+    upstream = CountingProvider()
+    provider = CachedDataProvider(upstream, tmp_path, ttl_minutes=1)
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 10)
+
+    provider.get_bars(["AAPL"], start, end)
+    provider.get_bars(["AAPL"], start, end)
+    assert len(upstream.requests) == 1
+
+    _backdate(tmp_path / "AAPL" / "1Day.json", 120)
+    provider.get_bars(["AAPL"], start, end)
+    assert len(upstream.requests) == 2
+
+
+def test_old_range_expires_even_after_newer_ranges_are_fetched(tmp_path: Path) -> None:
+    upstream = CountingProvider()
+    provider = CachedDataProvider(upstream, tmp_path, ttl_minutes=1)
+
+    provider.get_bars(["AAPL"], datetime(2024, 1, 1), datetime(2024, 1, 10))
+    _backdate(tmp_path / "AAPL" / "1Day.json", 120)
+    # Extending the range rewrites the Parquet file but must not refresh the old range
+    provider.get_bars(["AAPL"], datetime(2024, 1, 20), datetime(2024, 1, 25))
+    provider.get_bars(["AAPL"], datetime(2024, 1, 2), datetime(2024, 1, 5))
+
+    assert upstream.requests[-1] == (
+        ["AAPL"],
+        datetime(2024, 1, 2, tzinfo=UTC),
+        datetime(2024, 1, 5, tzinfo=UTC),
+    )
+
+
+def test_failed_gap_fetch_is_not_recorded_as_covered(tmp_path: Path) -> None:
+    upstream = CountingProvider()
+    provider = CachedDataProvider(upstream, tmp_path)
+    provider.get_bars(["AAPL"], datetime(2024, 1, 1), datetime(2024, 1, 10))
+
+    original = upstream.get_bars
+
+    def empty(symbols, start, end, timeframe=TimeFrame.DAY_1):
+        upstream.requests.append((list(symbols), start, end))
+        raise ValueError("no bars")
+
+    upstream.get_bars = empty
+    provider.get_bars(["AAPL"], datetime(2024, 1, 5), datetime(2024, 1, 20))
+    upstream.get_bars = original
+    bars = provider.get_bars(["AAPL"], datetime(2024, 1, 5), datetime(2024, 1, 20))["AAPL"]
+
+    assert len(upstream.requests) == 3
+    assert bars.index[-1] == pd.Timestamp("2024-01-20", tz="UTC")
@@ -0,0 +1,120 @@
+"""Tests for CSVDataProvider."""
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytz
+from kodiak.data.providers import csv_provider
+from kodiak.data.providers.csv_provider import CSVDataProvider
+
+EASTERN = pytz.timezone("US/Eastern")
+
+
+def _write_csv(path: Path, closes: list[float]) -> None:
+    rows = ["timestamp,open,high,low,close,volume"]
+    for day, close in enumerate(closes, start=2):
+        rows.append(f"2024-01-{day:02d} 09:30:00,{close},{close},{close},{close},1000")
+    path.write_text("\n".join(rows) + "\n")
+
+
+def test_csv_is_cached_in_parquet_sidecar(tmp_path: Path) -> None:
+    data_dir, cache_dir = tmp_path / "data", tmp_path / "cache"
+    data_dir.mkdir()
+    _write_csv(data_dir / "AAPL.csv", [100.0, 101.0, 102.0, 103.0, 104.0])
+    provider = CSVDataProvider(data_dir, cache_dir=cache_dir)
+    start = EASTERN.localize(datetime(2024, 1, 3))
+    end = EASTERN.localize(datetime(2024, 1, 5, 23))
+
+    first = provider.get_bars(["AAPL"], start, end)["AAPL"]
+    assert len(list(cache_dir.rglob("*.parquet"))) == 1
+    assert sorted(p.name for p in data_dir.iterdir()) == ["AAPL.csv"]
+    second = provider.get_bars(["AAPL"], start, end)["AAPL"]
+
+    assert first["close"].tolist() == [101.0, 102.0, 103.0]
+    pd.testing.assert_frame_equal(second, first, check_freq=False)
+
+
+def test_sidecar_is_rebuilt_when_csv_changes(tmp_path: Path) -> None:
+    data_dir, cache_dir = tmp_path / "data", tmp_path / "cache"
+    data_dir.mkdir()
+    csv_file = data_dir / "AAPL.csv"
+    _write_csv(csv_file, [100.0, 101.0])
+    provider = CSVDataProvider(data_dir, cache_dir=cache_dir)
+    start = EASTERN.localize(datetime(2024, 1, 1))
+    end = EASTERN.localize(datetime(2024, 1, 31))
+    provider.get_bars(["AAPL"], start, end)
+
+    _write_csv(csv_file, [200.0, 201.0, 202.0])
+    mtime = csv_file.stat().st_mtime_ns + 1
+    os.utime(csv_file, ns=(mtime, mtime))
+
+    bars = provider.get_bars(["AAPL"], start, end)["AAPL"]
+    assert bars["close"].tolist() == [200.0, 201.0, 202.0]
+    assert [p.name for p in cache_dir.rglob("*.parquet")] == [f"{mtime}.parquet"]
+
+
+def test_parsed_csv_is_reused_across_providers(tmp_path: Path, monkeypatch) -> None:
+    _write_csv(tmp_path / "AAPL.csv", [100.0, 101.0, 102.0])
+    parsed = []
+    original = csv_provider._parse_csv
+    monkeypatch.setattr(
+        csv_provider, "_parse_csv", lambda path: parsed.append(path) or original(path)
+    )
+    start = EASTERN.localize(datetime(2024, 1, 1))
+    end = EASTERN.localize(datetime(2024, 1, 31))
+
+    CSVDataProvider(tmp_path).get_bars(["AAPL"], start, end)
+    bars = CSVDataProvider(tmp_path).get_bars(
+        ["AAPL"], start, EASTERN.localize(datetime(2024, 1, 3, 12))
+    )["AAPL"]
+
+    assert parsed == [tmp_path / "AAPL.csv"]
+    assert bars["close"].tolist() == [100.0, 101.0]
+
+
+def test_editing_returned_bars_does_not_change_the_cache(tmp_path: Path) -> None:
+    _write_csv(tmp_path / "AAPL.csv", [100.0, 101.0, 102.0])
+    start = EASTERN.localize(datetime(2024, 1, 1))
+    end = EASTERN.localize(datetime(2024, 1, 31))
+
+    first = CSVDataProvider(tmp_path).get_bars(["AAPL"], start, end)["AAPL"]
+    first.iloc[0, first.columns.get_loc("close")] = -1.0
+
+    again = CSVDataProvider(tmp_path).get_bars(["AAPL"], start, end)["AAPL"]
+    assert again["close"].tolist() == [100.0, 101.0, 102.0]
+
+
+def test_unordered_csv_rows_are_sorted(tmp_path: Path) -> None:
+    (tmp_path / "AAPL.csv").write_text(
+        "timestamp,open,high,low,close,volume\n"
+        "2024-01-03 09:30:00,2,2,2,2,10\n"
+        "2024-01-02 09:30:00,1,1,1,1,10\n"
+    )
+    bars = CSVDataProvider(tmp_path).get_bars(
+        ["AAPL"], EASTERN.localize(datetime(2024, 1, 1)), EASTERN.localize(datetime(2024, 1, 5))
+    )["AAPL"]
+
+    assert bars["close"].tolist() == [1.0, 2.0]
+
+
+def test_multiple_symbols_load_in_request_order(tmp_path: Path) -> None:
+    for i, symbol in enumerate(["MSFT", "AAPL", "GOOGL"]):
+        _write_csv(tmp_path / f"{symbol}.csv", [100.0 + i, 101.0 + i])
+    start = EASTERN.localize(datetime(2024, 1, 1))
+    end = EASTERN.localize(datetime(2024, 1, 31))
+
+    bars = CSVDataProvider(tmp_path).get_bars(["MSFT", "AAPL", "GOOGL"], start, end)
+
+    assert list(bars) == ["MSFT", "AAPL", "GOOGL"]
+    assert [df["close"].iloc[0] for df in bars.values()] == [100.0, 101.0, 102.0]
+
+
+def test_naive_range_bounds_are_eastern(tmp_path: Path) -> None:
+    _write_csv(tmp_path / "AAPL.csv", [100.0, 101.0, 102.0])
+
+    bars = CSVDataProvider(tmp_path).get_bars(
+        ["AAPL"], datetime(2024, 1, 3, 9, 30), datetime(2024, 1, 4, 9, 30)
+    )["AAPL"]
+
+    assert bars["close"].tolist() == [101.0, 102.0]
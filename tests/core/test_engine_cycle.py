@@ -0,0 +1,76 @@
+"""Tests for TradingEngine cycle caching and loop control."""
+import os
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import kodiak.core.engine as engmod
+from kodiak.core.engine import TradingEngine
+from kodiak.strategies.loader import load_strategies, save_strategies
+from kodiak.strategies.models import Strategy, StrategyType
+
+from tests.core.mocks import MockBroker
+
+
+class CountingBroker(MockBroker):
+    def __init__(self) -> None:
+        super().__init__()
+        self.market_open_calls = 0
+
+    def is_market_open(self) -> bool:
+        self.market_open_calls += 1
+        return super().is_market_open()
+
+
+def test_market_open_is_cached_within_ttl() -> None:
+    broker = CountingBroker()
+    engine = TradingEngine(broker)
+
+    assert engine._is_market_open() is True
+    broker.set_market_open(False)
+    assert engine._is_market_open() is True
+    assert broker.market_open_calls == 1
+
+    engine._market_open_cache = (0.0, True)  # expire
+    assert engine._is_market_open() is False
+    assert broker.market_open_calls == 2
+
+
+def test_strategies_reloaded_only_when_file_changes(tmp_path: Path, monkeypatch) -> None:
+    strategies_file = tmp_path / "strategies.yaml"
+    save_strategies([Strategy(id="s1", symbol="AAPL", strategy_type=StrategyType.TRAILING_STOP, quantity=1, trailing_stop_pct=Decimal("5"))], tmp_path)
+
+    loads = []
+
+    def counting_load(config_dir=None):
+        loads.append(1)
+        return load_strategies(tmp_path)
+
+    monkeypatch.setattr(engmod, "get_strategies_file", lambda config_dir=None: strategies_file)
+    monkeypatch.setattr(engmod, "load_strategies", counting_load)
+
+    # Backdate the file so it is not treated as racily modified
+    os.utime(strategies_file, (1_000_000_000, 1_000_000_000))
+
+    engine = TradingEngine(MockBroker())
+    first = engine._load_strategies()
+    second = engine._load_strategies()
+    assert first is second
+    assert len(loads) == 1
+
+    save_strategies([], tmp_path)
+    assert engine._load_strategies() == []
+    assert len(loads) == 2
+
+
+def test_stop_wakes_the_inter_cycle_wait() -> None:
+    engine = TradingEngine(MockBroker(), poll_interval=60)
+    engine._run_cycle = lambda: []
+
+    thread = threading.Thread(target=engine._run_loop)
+    thread.start()
+    time.sleep(0.05)
+    engine.stop()
+    thread.join(timeout=2)
+    assert not thread.is_alive()
@@ -0,0 +1,42 @@
+"""Tests for the engine's single-instance lock file."""
+import os
+from pathlib import Path
+
+import kodiak.core.engine as engmod
+import pytest
+from kodiak.core.engine import EngineAlreadyRunningError, TradingEngine
+
+from tests.core.mocks import MockBroker
+
+
+@pytest.fixture
+def lock_path(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / ".engine.lock"
+    monkeypatch.setattr(engmod, "get_lock_file_path", lambda: path)
+    return path
+
+
+def test_lock_writes_pid_and_is_kept_on_release(lock_path: Path) -> None:
+    engine = TradingEngine(MockBroker())
+    engine._acquire_lock()
+    assert lock_path.read_text() == str(os.getpid())
+
+    engine._release_lock()
+    assert lock_path.exists()
+    assert lock_path.read_text() == ""
+
+
+def test_second_engine_is_rejected_while_locked(lock_path: Path) -> None:
+    first = TradingEngine(MockBroker())
+    first._acquire_lock()
+    try:
+        with pytest.raises(EngineAlreadyRunningError, match=str(os.getpid())):
+            TradingEngine(MockBroker())._acquire_lock()
+        # The rejected attempt must not clobber the holder's PID
+        assert lock_path.read_text() == str(os.getpid())
+    finally:
+        first._release_lock()
+
+    second = TradingEngine(MockBroker())
+    second._acquire_lock()
+    second._release_lock()
@@ -46,15 +46,18 @@ def test_reconcile_updates_persisted_order(tmp_path: Path):
     # Reconcile using tmp_path as config dir by setting engine attribute orders_dir via monkeypatching load_orders
     # We'll temporarily monkeypatch kodiak.oms.store.load_orders and save_order to use tmp_path
     # direct import path
+    import importlib
+
     import kodiak.oms.store as store
+    engmod = importlib.import_module("kodiak.core.engine")
 
     # Backup
     orig_load = store.load_orders
     orig_save = store.save_order
+    orig_engine_load = engmod.load_orders
+    orig_engine_save = engmod.save_order
 
     try:
-        import importlib
-        engmod = importlib.import_module("kodiak.core.engine")
         # Monkeypatch engine module's load/save to point to tmp_path
         engmod.load_orders = lambda config_dir=None: load_orders(tmp_path)
         engmod.save_order = lambda order_obj, config_dir=None: orig_save(order_obj, tmp_path)
@@ -69,3 +72,63 @@ def test_reconcile_updates_persisted_order(tmp_path: Path):
     finally:
         store.load_orders = orig_load
         store.save_order = orig_save
+        engmod.load_orders = orig_engine_load
+        engmod.save_order = orig_engine_save
+
+
+def test_reconcile_skips_unchanged_settled_orders(tmp_path: Path, monkeypatch):
+    from kodiak.core import engine as engmod
+    from kodiak.models.order import OrderStatus as LocalOrderStatus
+
+    filled = LocalOrder(
+        id="o1", symbol="AAPL", side=OrderSide.BUY, qty=Decimal("1"),
+        order_type=OrderType.MARKET, status=LocalOrderStatus.FILLED,
+    )
+    save_orders([filled], tmp_path)
+
+    loads = []
+
+    def counting_load(config_dir=None):
+        loads.append(config_dir)
+        return load_orders(config_dir)
+
+    monkeypatch.setattr(engmod, "load_orders", counting_load)
+    engine = engmod.TradingEngine(MockBroker(), orders_dir=tmp_path)
+
+    engine._reconcile_orders()
+    engine._reconcile_orders()
+    assert len(loads) == 1
+
+    # A new open order changes the file and is reconciled again
+    pending = LocalOrder(
+        id="o2", symbol="MSFT", side=OrderSide.BUY, qty=Decimal("1"), order_type=OrderType.MARKET,
+    )
+    save_orders([filled, pending], tmp_path)
+    engine._reconcile_orders()
+    assert len(loads) == 2
+
+
+def test_each_cycle_reconciles_persisted_orders(tmp_path: Path):
+    from kodiak.core.engine import TradingEngine
+    from kodiak.models.order import OrderStatus as LocalOrderStatus
+
+    local = LocalOrder(
+        id="o1", symbol="AAPL", side=OrderSide.BUY, qty=Decimal("1"),
+        order_type=OrderType.LIMIT, limit_price=Decimal("100"), status=LocalOrderStatus.SUBMITTED,
+    )
+    save_orders([local], tmp_path)
+    broker_order = BrokerOrder(
+        id="o1", symbol="AAPL", side=OrderSide.BUY, qty=Decimal("1"),
+        order_type=OrderType.LIMIT, status=BrokerOrderStatus.ACCEPTED, limit_price=Decimal("100"),
+    )
+    broker = MockBroker({"o1": broker_order})
+    engine = TradingEngine(broker, orders_dir=tmp_path)
+    engine._check_scheduled_strategies = lambda: None
+    engine._load_strategies = lambda: []
+
+    engine._run_cycle()
+    assert load_orders(tmp_path)[0].status != LocalOrderStatus.FILLED
+
+    broker_order.status = BrokerOrderStatus.FILLED
+    engine._run_cycle()
+    assert load_orders(tmp_path)[0].status == LocalOrderStatus.FILLED
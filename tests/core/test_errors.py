@@ -62,6 +62,14 @@ class TestAppError:
         err = AppError("test", code="APP_ERROR")
         assert isinstance(err, Exception)
 
+    def test_pickle_round_trip(self) -> None:
+        import pickle
+
+        err = SafetyError("blocked", details={"symbol": "AAPL"}, suggestion="Wait")
+        restored = pickle.loads(pickle.dumps(err))
+        assert type(restored) is SafetyError
+        assert restored.to_dict() == err.to_dict()
+
 
 class TestSubclasses:
     """Test each error subclass has correct defaults."""
@@ -0,0 +1,133 @@
+"""Tests for concurrent order submission in StrategyEvaluator."""
+from decimal import Decimal
+
+from kodiak.api.broker import OrderSide, OrderType
+from kodiak.strategies import evaluator as evaluator_module
+from kodiak.strategies.evaluator import ActionType, StrategyAction, StrategyEvaluator
+from kodiak.strategies.models import Strategy, StrategyType
+from kodiak.utils.config import StrategyDefaults
+
+from tests.core.mocks import MockBroker
+
+
+def _entry(strategy_id: str, symbol: str) -> StrategyAction:
+    return StrategyAction(
+        strategy_id=strategy_id,
+        action_type=ActionType.PLACE_ENTRY_ORDER,
+        order_params={
+            "symbol": symbol,
+            "qty": Decimal("1"),
+            "side": OrderSide.BUY,
+            "order_type": OrderType.LIMIT,
+            "limit_price": Decimal("100"),
+        },
+    )
+
+
+def _strategy(strategy_id: str, symbol: str) -> Strategy:
+    return Strategy(
+        id=strategy_id,
+        symbol=symbol,
+        strategy_type=StrategyType.TRAILING_STOP,
+        quantity=1,
+        trailing_stop_pct=Decimal("5"),
+    )
+
+
+def _loaded(*actions: StrategyAction) -> dict[str, Strategy]:
+    return {a.strategy_id: _strategy(a.strategy_id, a.order_params["symbol"]) for a in actions}
+
+
+def test_submit_orders_places_all_order_actions() -> None:
+    broker = MockBroker()
+    evaluator = StrategyEvaluator(broker, StrategyDefaults())
+    actions = [
+        _entry("s1", "AAPL"),
+        _entry("s2", "GOOGL"),
+        StrategyAction(strategy_id="s3", action_type=ActionType.UPDATE_STATE, state_updates={}),
+    ]
+
+    submitted = evaluator.submit_orders(actions, _loaded(*actions[:2]))
+
+    assert set(submitted) == {id(actions[0]), id(actions[1])}
+    assert {o.symbol for o in submitted.values()} == {"AAPL", "GOOGL"}
+    assert len(broker.get_orders()) == 2
+
+
+def test_submit_orders_single_action_is_left_inline() -> None:
+    broker = MockBroker()
+    evaluator = StrategyEvaluator(broker, StrategyDefaults())
+
+    action = _entry("s1", "AAPL")
+    assert evaluator.submit_orders([action], _loaded(action)) == {}
+    assert broker.get_orders() == []
+
+
+def test_submit_orders_captures_broker_errors() -> None:
+    broker = MockBroker()
+
+    def fail(**kwargs):
+        raise RuntimeError("rejected")
+
+    broker.place_order = fail
+    evaluator = StrategyEvaluator(broker, StrategyDefaults())
+    actions = [_entry("s1", "AAPL"), _entry("s2", "GOOGL")]
+
+    submitted = evaluator.submit_orders(actions, _loaded(*actions))
+
+    assert all(isinstance(r, RuntimeError) for r in submitted.values())
+
+
+def test_submit_orders_skips_actions_without_a_loaded_strategy() -> None:
+    broker = MockBroker()
+    evaluator = StrategyEvaluator(broker, StrategyDefaults())
+    actions = [_entry("s1", "AAPL"), _entry("s2", "GOOGL"), _entry("gone", "MSFT")]
+
+    submitted = evaluator.submit_orders(actions, _loaded(*actions[:2]))
+
+    assert set(submitted) == {id(actions[0]), id(actions[1])}
+    assert {o.symbol for o in broker.get_orders()} == {"AAPL", "GOOGL"}
+
+
+def test_run_once_places_no_order_for_a_removed_strategy(monkeypatch) -> None:
+    broker = MockBroker()
+    evaluator = StrategyEvaluator(broker, StrategyDefaults())
+    kept = _strategy("s1", "AAPL")
+    actions = [_entry("s1", "AAPL"), _entry("gone", "GOOGL")]
+    loads: list[str] = []
+
+    def get_strategy(strategy_id: str) -> Strategy | None:
+        loads.append(strategy_id)
+        return kept if strategy_id == "s1" else None
+
+    monkeypatch.setattr(evaluator, "evaluate", lambda strategies, snapshot=None: actions)
+    monkeypatch.setattr(evaluator_module, "get_strategy", get_strategy)
+    monkeypatch.setattr(evaluator_module, "save_strategy", lambda strategy: None)
+    monkeypatch.setattr(evaluator_module, "save_order", lambda order: None)
+
+    assert evaluator.run_once([]) == ["s1"]
+    assert [o.symbol for o in broker.get_orders()] == ["AAPL"]
+    assert kept.entry_order_id == broker.get_orders()[0].id
+    assert sorted(loads) == ["gone", "s1"]
+
+
+def test_evaluate_preserves_input_order_across_symbols() -> None:
+    evaluator = StrategyEvaluator(MockBroker(), StrategyDefaults(), max_eval_workers=4)
+    symbols = ["AAPL", "GOOGL", "AAPL", "MSFT", "TSLA", "GOOGL"]
+    strategies = [
+        Strategy(
+            id=f"s{i}",
+            symbol=symbol,
+            strategy_type=StrategyType.TRAILING_STOP,
+            quantity=1,
+            trailing_stop_pct=Decimal("5"),
+        )
+        for i, symbol in enumerate(symbols)
+    ]
+
+    try:
+        actions = evaluator.evaluate(strategies)
+    finally:
+        evaluator.close()
+
+    assert [a.strategy_id for a in actions] == [s.id for s in strategies]
@@ -1,14 +1,14 @@
 """Tests for trade ledger."""
 
+import sqlite3
 import tempfile
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
-
 from kodiak.api.broker import OrderSide, OrderStatus
-from kodiak.data.ledger import TradeLedger, TradeRecord
+from kodiak.data.ledger import NewTrade, TradeLedger, TradeRecord
 
 
 @pytest.fixture
@@ -30,6 +30,53 @@ def test_ledger_init(temp_db: Path) -> None:
     assert temp_db.exists()
 
 
+def test_ledger_uses_wal_journal(temp_db: Path) -> None:
+    """Test the ledger switches the database to WAL and closes cleanly."""
+    led = TradeLedger(db_path=temp_db)
+    led.close()
+    with sqlite3.connect(temp_db) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_today_pnl_scan_uses_covering_index(ledger: TradeLedger) -> None:
+    """Test the today's-P/L query is answered from the covering index."""
+    plan = ledger._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id, symbol, side, quantity, price, epoch_ms FROM trades "
+        "WHERE id > 0 AND epoch_ms >= 1704067200000 ORDER BY epoch_ms, id"
+    ).fetchall()
+    assert "COVERING INDEX idx_trades_epoch" in " ".join(row[-1] for row in plan)
+
+
+def test_existing_ledger_gains_epoch_column(temp_db: Path) -> None:
+    """Test a database created before epoch_ms is migrated and backfilled."""
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("""
+            CREATE TABLE trades (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                order_id TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                side TEXT NOT NULL,
+                quantity REAL NOT NULL,
+                price REAL NOT NULL,
+                total REAL NOT NULL,
+                status TEXT NOT NULL,
+                rule_id TEXT,
+                timestamp TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "INSERT INTO trades (order_id, symbol, side, quantity, price, total, status, timestamp) "
+            "VALUES ('old-1', 'AAPL', 'buy', 10, 150, 1500, 'filled', '2024-01-15T10:00:00')"
+        )
+    conn.close()
+
+    led = TradeLedger(db_path=temp_db)
+
+    assert [t.order_id for t in led.get_trades(since=datetime(2024, 1, 15))] == ["old-1"]
+    assert led.get_trades(since=datetime(2024, 1, 16)) == []
+
+
 def test_record_trade(ledger: TradeLedger) -> None:
     """Test recording a trade."""
     trade_id = ledger.record_trade(
@@ -43,6 +90,37 @@ def test_record_trade(ledger: TradeLedger) -> None:
     assert trade_id > 0
 
 
+def test_record_trades_batch(ledger: TradeLedger) -> None:
+    """Test recording several trades in one transaction."""
+    first = ledger.record_trade(
+        order_id="order-0",
+        symbol="AAPL",
+        side=OrderSide.BUY,
+        quantity=Decimal("1"),
+        price=Decimal("100"),
+        status=OrderStatus.FILLED,
+    )
+    ids = ledger.record_trades_batch(
+        [
+            NewTrade(
+                order_id=f"order-{i}",
+                symbol="MSFT",
+                side=OrderSide.BUY,
+                quantity=Decimal("2"),
+                price=Decimal("300"),
+                status=OrderStatus.FILLED,
+            )
+            for i in range(1, 4)
+        ]
+    )
+    assert ids == [first + 1, first + 2, first + 3]
+    assert ledger.record_trades_batch([]) == []
+
+    by_id = {t.id: t for t in ledger.get_trades()}
+    assert [by_id[i].order_id for i in ids] == ["order-1", "order-2", "order-3"]
+    assert by_id[ids[0]].total == Decimal("600")
+
+
 def test_get_trades(ledger: TradeLedger) -> None:
     """Test getting trades."""
     # Record some trades
@@ -217,6 +295,86 @@ def test_get_total_today_pnl(ledger: TradeLedger) -> None:
     assert total_pnl == Decimal("100.00")  # 10 * (160 - 150)
 
 
+def test_today_pnl_is_updated_incrementally(ledger: TradeLedger, temp_db: Path) -> None:
+    """Test today's totals pick up new, external and out-of-order trades."""
+    base = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
+
+    def trade(led: TradeLedger, side: OrderSide, qty: str, price: str, minutes: int) -> None:
+        led.record_trade(
+            order_id=f"order-{minutes}",
+            symbol="AAPL",
+            side=side,
+            quantity=Decimal(qty),
+            price=Decimal(price),
+            status=OrderStatus.FILLED,
+            timestamp=base + timedelta(minutes=minutes),
+        )
+
+    trade(ledger, OrderSide.BUY, "10", "100", 0)
+    trade(ledger, OrderSide.SELL, "5", "110", 10)
+    assert ledger.get_total_today_pnl() == Decimal("50")
+
+    # Trades recorded through another ledger instance (e.g. the engine process)
+    trade(TradeLedger(db_path=temp_db), OrderSide.SELL, "5", "120", 20)
+    assert ledger.get_total_today_pnl() == Decimal("150")
+    assert ledger.get_trade_count_today() == 3
+
+    # A trade timestamped before folded ones forces a FIFO rebuild
+    trade(ledger, OrderSide.BUY, "5", "90", 5)
+    assert ledger.get_total_today_pnl() == Decimal("150")
+    assert ledger.get_trade_count_today() == 4
+    assert ledger.get_today_pnl() == {"AAPL": Decimal("150")}
+    assert ledger.get_today_stats() == (Decimal("150"), 4)
+
+
+def test_today_stats_skip_query_when_unchanged(ledger: TradeLedger, temp_db: Path) -> None:
+    """Test repeated stats reads don't re-query trades until something is written."""
+    ledger.record_trade(
+        order_id="order-1",
+        symbol="AAPL",
+        side=OrderSide.BUY,
+        quantity=Decimal("10"),
+        price=Decimal("100"),
+        status=OrderStatus.FILLED,
+    )
+    assert ledger.get_today_stats() == (Decimal("0"), 1)
+
+    statements: list[str] = []
+    ledger._conn.set_trace_callback(statements.append)
+    assert ledger.get_today_stats() == (Decimal("0"), 1)
+    assert not any("FROM trades" in sql for sql in statements)
+
+    TradeLedger(db_path=temp_db).record_trade(
+        order_id="order-2",
+        symbol="AAPL",
+        side=OrderSide.SELL,
+        quantity=Decimal("10"),
+        price=Decimal("105"),
+        status=OrderStatus.FILLED,
+    )
+    assert ledger.get_today_stats() == (Decimal("50"), 2)
+    assert any("FROM trades" in sql for sql in statements)
+
+
+def test_trade_amounts_hydrate_as_decimal(ledger: TradeLedger) -> None:
+    """Test stored amounts come back as the same Decimal values."""
+    ledger.record_trade(
+        order_id="order-1",
+        symbol="AAPL",
+        side=OrderSide.BUY,
+        quantity=Decimal("3"),
+        price=Decimal("0.1"),
+        status=OrderStatus.FILLED,
+    )
+
+    trade = ledger.get_trades()[0]
+    assert (trade.quantity, trade.price, trade.total) == (
+        Decimal("3"),
+        Decimal("0.1"),
+        Decimal("0.3"),
+    )
+
+
 def test_export_csv(ledger: TradeLedger, temp_db: Path) -> None:
     """Test CSV export."""
     ledger.record_trade(
@@ -0,0 +1,95 @@
+"""Tests for OrderReconciler and the pending-orders cache."""
+from decimal import Decimal
+from pathlib import Path
+
+from kodiak.api.broker import OrderSide, OrderType
+from kodiak.models.order import Order as LocalOrder
+from kodiak.models.order import OrderSide as LocalOrderSide
+from kodiak.models.order import OrderStatus as LocalOrderStatus
+from kodiak.models.order import OrderType as LocalOrderType
+from kodiak.oms import reconcile
+from kodiak.oms.reconcile import OrderReconciler, PendingOrdersCache
+from kodiak.oms.store import load_orders, save_orders
+
+from tests.core.mocks import MockBroker
+
+
+def test_refresh_indexes_pending_broker_orders_by_symbol(tmp_path: Path) -> None:
+    broker = MockBroker()
+    broker.place_order("AAPL", Decimal("5"), OrderSide.BUY, OrderType.LIMIT, limit_price=Decimal("170"))
+    broker.place_order("AAPL", Decimal("3"), OrderSide.SELL, OrderType.LIMIT, limit_price=Decimal("190"))
+    broker.place_order("GOOGL", Decimal("2"), OrderSide.BUY, OrderType.MARKET)  # fills immediately
+
+    cache = PendingOrdersCache()
+    OrderReconciler(broker, tmp_path).refresh(cache)
+
+    assert cache.is_loaded
+    aapl = cache.get("AAPL")
+    assert [(o.is_buy, o.qty, o.limit_price) for o in aapl] == [
+        (True, 5, Decimal("170")),
+        (False, 3, Decimal("190")),
+    ]
+    assert cache.get("GOOGL") == []
+
+
+def test_refresh_does_not_write_local_orders(tmp_path: Path) -> None:
+    broker = MockBroker()
+    placed = broker.place_order("AAPL", Decimal("1"), OrderSide.BUY, OrderType.MARKET)
+    local = LocalOrder(
+        id=placed.id,
+        symbol="AAPL",
+        side=LocalOrderSide.BUY,
+        qty=Decimal("1"),
+        order_type=LocalOrderType.MARKET,
+    )
+    save_orders([local], tmp_path)
+
+    OrderReconciler(broker, tmp_path).refresh(PendingOrdersCache())
+    assert load_orders(tmp_path)[0].status == LocalOrderStatus.NEW
+
+
+def test_local_orders_used_when_broker_unavailable(tmp_path: Path) -> None:
+    class FailingBroker(MockBroker):
+        def get_orders(self, status=None):
+            raise RuntimeError("down")
+
+    local = LocalOrder(
+        symbol="AAPL",
+        side=LocalOrderSide.BUY,
+        qty=Decimal("4"),
+        order_type=LocalOrderType.LIMIT,
+        limit_price=Decimal("100"),
+    )
+    save_orders([local], tmp_path)
+
+    cache = PendingOrdersCache()
+    OrderReconciler(FailingBroker(), tmp_path).refresh(cache)
+    assert not cache.from_broker
+    assert [o.qty for o in cache.get("AAPL")] == [4]
+
+
+def test_empty_broker_answer_is_authoritative(tmp_path: Path) -> None:
+    local = LocalOrder(
+        symbol="AAPL",
+        side=LocalOrderSide.BUY,
+        qty=Decimal("4"),
+        order_type=LocalOrderType.LIMIT,
+        limit_price=Decimal("100"),
+    )
+    save_orders([local], tmp_path)
+
+    cache = PendingOrdersCache()
+    OrderReconciler(MockBroker(), tmp_path).refresh(cache)
+    assert cache.from_broker
+    assert cache.get("AAPL") == []
+
+
+def test_broker_cache_goes_stale_after_ttl(tmp_path: Path, monkeypatch) -> None:
+    cache = PendingOrdersCache()
+    reconciler = OrderReconciler(MockBroker(), tmp_path)
+    reconciler.refresh(cache)
+    assert not reconciler.is_stale(cache)
+
+    monkeypatch.setattr(reconcile, "PENDING_ORDERS_TTL_SECONDS", 0.0)
+    cache.refreshed_at -= 1
+    assert reconciler.is_stale(cache)
@@ -3,8 +3,17 @@
 from decimal import Decimal
 
 import pytest
-
+import yaml
+from kodiak.api.broker import OrderStatus as BrokerOrderStatus
 from kodiak.models.order import Order, OrderSide, OrderStatus, OrderType
+from kodiak.oms.store import (
+    LOCAL_STATUS_BY_BROKER,
+    compact_orders,
+    get_orders_file,
+    load_orders,
+    save_order,
+    save_orders,
+)
 
 
 def test_order_creation():
@@ -40,8 +49,6 @@ def test_order_validation():
 
 
 def test_order_persistence(tmp_path):
-    from kodiak.oms.store import load_orders, save_orders
-
     o1 = Order(symbol="AAPL", side=OrderSide.BUY, qty=Decimal("2"), order_type=OrderType.MARKET)
     o2 = Order(symbol="TSLA", side=OrderSide.SELL, qty=Decimal("3"), order_type=OrderType.LIMIT, limit_price=Decimal("400"))
 
@@ -51,3 +58,94 @@ def test_order_persistence(tmp_path):
     assert len(loaded) == 2
     assert loaded[0].symbol == "AAPL"
     assert loaded[1].symbol == "TSLA"
+
+
+def test_order_persistence_reads_legacy_yaml(tmp_path):
+    o1 = Order(symbol="AAPL", side=OrderSide.BUY, qty=Decimal("2"), order_type=OrderType.MARKET)
+    with open(tmp_path / "orders.yaml", "w") as f:
+        yaml.dump({"orders": [o1.to_dict()]}, f)
+
+    loaded = load_orders(tmp_path)
+    assert [o.symbol for o in loaded] == ["AAPL"]
+
+    # Saving migrates to the JSON lines store
+    save_orders(loaded, tmp_path)
+    assert get_orders_file(tmp_path).name == "orders.jsonl"
+    assert load_orders(tmp_path)[0].qty == Decimal("2")
+
+
+def test_broker_status_maps_to_local_status():
+    assert LOCAL_STATUS_BY_BROKER[BrokerOrderStatus.FILLED] == OrderStatus.FILLED
+    assert LOCAL_STATUS_BY_BROKER[BrokerOrderStatus.CANCELED] == OrderStatus.CANCELED
+    assert LOCAL_STATUS_BY_BROKER[BrokerOrderStatus.ACCEPTED] == OrderStatus.NEW
+    assert set(LOCAL_STATUS_BY_BROKER) == set(BrokerOrderStatus)
+
+
+def test_save_order_replaces_by_id_or_external_id(tmp_path):
+    first = Order(symbol="AAPL", side=OrderSide.BUY, qty=Decimal("1"), order_type=OrderType.MARKET, id="o1")
+    second = Order(symbol="TSLA", side=OrderSide.BUY, qty=Decimal("1"), order_type=OrderType.MARKET, id="o2", external_id="ext-2")
+    save_orders([first, second], tmp_path)
+
+    # A broker-side copy is keyed by the local order's external id
+    filled = Order(symbol="TSLA", side=OrderSide.BUY, qty=Decimal("1"), order_type=OrderType.MARKET, id="ext-2", status=OrderStatus.FILLED)
+    save_order(filled, tmp_path)
+    save_order(Order(symbol="MSFT", side=OrderSide.SELL, qty=Decimal("2"), order_type=OrderType.MARKET, id="o3"), tmp_path)
+
+    loaded = load_orders(tmp_path)
+    assert [o.symbol for o in loaded] == ["AAPL", "TSLA", "MSFT"]
+    assert loaded[1].status == OrderStatus.FILLED
+
+
+def test_save_order_appends_to_journal_until_compacted(tmp_path):
+    order = Order(symbol="AAPL", side=OrderSide.BUY, qty=Decimal("1"), order_type=OrderType.MARKET, id="o1")
+    save_order(order, tmp_path)
+    order.mark_submitted("ext-1")
+    save_order(order, tmp_path)
+    order.mark_filled()
+    save_order(order, tmp_path)
+
+    path = get_orders_file(tmp_path)
+    assert len(path.read_text().splitlines()) == 3
+    assert [o.status for o in load_orders(tmp_path)] == [OrderStatus.FILLED]
+
+    compact_orders(tmp_path)
+    assert len(path.read_text().splitlines()) == 1
+    assert load_orders(tmp_path)[0].external_id == "ext-1"
+
+
+def test_partial_last_line_is_skipped_and_cut_before_next_append(tmp_path):
+    first = Order(symbol="AAPL", side=OrderSide.BUY, qty=Decimal("1"), order_type=OrderType.MARKET, id="o1")
+    save_order(first, tmp_path)
+    path = get_orders_file(tmp_path)
+    with open(path, "a") as f:
+        f.write('{"id": "o2", "sym')
+
+    assert [o.id for o in load_orders(tmp_path)] == ["o1"]
+
+    second = Order(symbol="TSLA", side=OrderSide.SELL, qty=Decimal("2"), order_type=OrderType.MARKET, id="o3")
+    save_order(second, tmp_path)
+    assert [o.id for o in load_orders(tmp_path)] == ["o1", "o3"]
+    assert len(path.read_text().splitlines()) == 2
+
+
+def test_corrupt_line_before_the_end_still_raises(tmp_path):
+    path = get_orders_file(tmp_path)
+    path.write_text('{"id": "o1"\n{}\n')
+
+    with pytest.raises(ValueError):
+        load_orders(tmp_path)
+
+
+def test_failed_rewrite_keeps_the_old_journal(tmp_path, monkeypatch):
+    order = Order(symbol="AAPL", side=OrderSide.BUY, qty=Decimal("1"), order_type=OrderType.MARKET, id="o1")
+    save_orders([order], tmp_path)
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("kodiak.oms.store.os.replace", fail)
+    with pytest.raises(OSError):
+        save_orders([], tmp_path)
+
+    assert [o.id for o in load_orders(tmp_path)] == ["o1"]
+    assert [p.name for p in tmp_path.iterdir()] == ["orders.jsonl"]
@@ -0,0 +1,96 @@
+"""Tests for Portfolio aggregation."""
+from decimal import Decimal
+
+from kodiak.api.broker import Position
+from kodiak.core.portfolio import Portfolio
+
+from tests.core.mocks import MockBroker
+
+
+class DummyLedger:
+    def get_total_today_pnl(self) -> Decimal:
+        return Decimal("10")
+
+
+def _position(symbol: str, qty: str, avg: str, price: str) -> Position:
+    qty_d, avg_d, price_d = Decimal(qty), Decimal(avg), Decimal(price)
+    return Position(
+        symbol=symbol,
+        qty=qty_d,
+        avg_entry_price=avg_d,
+        current_price=price_d,
+        market_value=qty_d * price_d,
+        unrealized_pl=(price_d - avg_d) * qty_d,
+        unrealized_pl_pct=(price_d - avg_d) / avg_d,
+    )
+
+
+def _portfolio() -> Portfolio:
+    broker = MockBroker()
+    broker.add_position(_position("AAPL", "10", "150.00", "175.25"))
+    broker.add_position(_position("GOOGL", "5", "140.50", "130.10"))
+    broker.add_position(_position("MSFT", "2.5", "400", "410.333333"))
+    return Portfolio(broker, DummyLedger())
+
+
+def test_summary_matches_decimal_arithmetic() -> None:
+    pf = _portfolio()
+    positions = pf.broker.get_positions()
+    summary = pf.get_summary()
+
+    expected_value = sum((p.market_value for p in positions), Decimal("0"))
+    expected_pl = sum((p.unrealized_pl for p in positions), Decimal("0"))
+    expected_cost = sum((p.avg_entry_price * p.qty for p in positions), Decimal("0"))
+
+    assert summary.positions_value == expected_value
+    assert summary.unrealized_pnl == expected_pl
+    assert summary.unrealized_pnl_pct == expected_pl / expected_cost
+    assert summary.total_pnl_today == expected_pl + Decimal("10")
+    assert summary.position_count == 3
+
+
+def test_summary_without_positions() -> None:
+    pf = Portfolio(MockBroker(), DummyLedger())
+    summary = pf.get_summary()
+    assert summary.positions_value == Decimal("0")
+    assert summary.unrealized_pnl_pct == Decimal("0")
+
+
+def test_positions_detail_sorted_by_market_value() -> None:
+    details = _portfolio().get_positions_detail()
+    assert [d.symbol for d in details] == ["AAPL", "MSFT", "GOOGL"]
+    assert details[0].cost_basis == Decimal("1500.00")
+
+
+def test_allocation_matches_position_details() -> None:
+    pf = _portfolio()
+    allocation = pf.get_allocation()
+    assert list(allocation) == ["AAPL", "MSFT", "GOOGL"]
+    assert allocation == {d.symbol: d.weight_pct for d in pf.get_positions_detail()}
+
+
+def test_top_gainers_and_losers() -> None:
+    pf = _portfolio()
+    assert [d.symbol for d in pf.get_top_gainers()] == ["AAPL", "MSFT"]
+    assert [d.symbol for d in pf.get_top_gainers(limit=1)] == ["AAPL"]
+    assert [d.symbol for d in pf.get_top_losers()] == ["GOOGL"]
+
+    gainers, losers = pf.get_top_movers(limit=1)
+    assert [d.symbol for d in gainers] == ["AAPL"]
+    assert [d.symbol for d in losers] == ["GOOGL"]
+
+
+def test_top_movers_break_pl_ties_by_market_value() -> None:
+    broker = MockBroker()
+    # Same P/L (+100 / -100) on different position sizes
+    broker.add_position(_position("SMALL", "10", "10", "20"))
+    broker.add_position(_position("LARGE", "100", "100", "101"))
+    broker.add_position(_position("SMALL_L", "10", "20", "10"))
+    broker.add_position(_position("LARGE_L", "100", "101", "100"))
+    pf = Portfolio(broker, DummyLedger())
+
+    gainers, losers = pf.get_top_movers()
+    assert [d.symbol for d in gainers] == ["LARGE", "SMALL"]
+    assert [d.symbol for d in losers] == ["LARGE_L", "SMALL_L"]
+    assert [d.symbol for d in pf.get_top_gainers()] == ["LARGE", "SMALL"]
+    assert [d.symbol for d in pf.get_top_losers()] == ["LARGE_L", "SMALL_L"]
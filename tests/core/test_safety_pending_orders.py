@@ -1,4 +1,4 @@
-"""Tests for safety checks that consider pending orders saved to orders.yaml."""
+"""Tests for safety checks that consider pending orders saved to the local order store."""
 from decimal import Decimal
 from pathlib import Path
 
@@ -38,6 +38,9 @@ class DummyLedger(TradeLedger):
     def get_trade_count_today(self):
         return 0
 
+    def get_today_stats(self):
+        return Decimal("0"), 0
+
 
 def test_pending_buys_reduce_buying_power(tmp_path: Path):
     # Create a pending buy order for 50 shares @ limit 100 (value 5000)
@@ -69,3 +72,18 @@ def test_pending_buys_count_toward_position_size(tmp_path: Path):
     allowed, reason = checker.check_order("AAPL", 40, Decimal("100"), is_buy=True)
     assert allowed is False
     assert "exceeds position size limit" in reason
+
+
+def test_local_fallback_rereads_changed_orders_file(tmp_path: Path):
+    broker = MockBroker(buying_power=Decimal("6000"))
+    limits = SafetyLimits(max_position_value=Decimal("100000"))
+    checker = SafetyCheck(broker, DummyLedger(), limits=limits, orders_dir=tmp_path)
+
+    assert checker.check_order("AAPL", 20, Decimal("100"), is_buy=True)[0]
+
+    # A pending buy persisted afterwards is picked up on the next check
+    o = LocalOrder(symbol="AAPL", side=OrderSide.BUY, qty=Decimal("50"), order_type=OrderType.LIMIT, limit_price=Decimal("100"))
+    save_orders([o], tmp_path)
+    allowed, reason = checker.check_order("AAPL", 20, Decimal("100"), is_buy=True)
+    assert allowed is False
+    assert "Insufficient buying power" in reason
@@ -108,3 +108,14 @@ def test_save_chart_html(tmp_path) -> None:
     output_path = tmp_path / "chart.html"
     builder.save_html(str(output_path))
     assert output_path.exists()
+
+
+def test_save_chart_html_gzip(tmp_path) -> None:
+    import gzip
+
+    result = _sample_result()
+    builder = ChartBuilder(result=result, price_data=_sample_price_data())
+    output_path = tmp_path / "chart.html.gz"
+    builder.save_html(str(output_path))
+    with gzip.open(output_path, "rt", encoding="utf-8") as f:
+        assert "<html" in f.read().lower()
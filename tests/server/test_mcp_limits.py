@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from unittest.mock import patch
 
@@ -11,6 +12,14 @@ from kodiak.errors import RateLimitError, TaskTimeoutError
 from kodiak.mcp import limits as limits_mod
 
 
+@pytest.fixture(autouse=True)
+def _fresh_limits():
+    # Limits are cached per process; tests patch the env before the first read
+    limits_mod._reset_limits_cache()
+    yield
+    limits_mod._reset_limits_cache()
+
+
 # Reset rate limit state between tests so env-driven limits don't leak
 def _clear_rate_limit_state() -> None:
     with limits_mod._rate_limit_lock:
@@ -56,6 +65,60 @@ class TestRateLimiter:
             with pytest.raises(RateLimitError):
                 limits_mod.check_rate_limit("key_b")
 
+    def test_tokens_refill_over_the_window(self) -> None:
+        _clear_rate_limit_state()
+        env = {"MCP_RATE_LIMIT_LONG_RUNNING_PER_MINUTE": "4"}
+        with patch.dict("os.environ", env, clear=False), patch.object(
+            limits_mod.time, "monotonic"
+        ) as monotonic:
+            monotonic.return_value = 6000.0
+            for _ in range(4):
+                limits_mod.check_rate_limit("refill_key")
+
+            # 4 calls per 60s refill one token every 15s
+            monotonic.return_value = 6015.0
+            limits_mod.check_rate_limit("refill_key")
+            with pytest.raises(RateLimitError):
+                limits_mod.check_rate_limit("refill_key")
+
+            # A full window later the bucket is full again, but capped at the limit
+            monotonic.return_value = 6200.0
+            for _ in range(4):
+                limits_mod.check_rate_limit("refill_key")
+            with pytest.raises(RateLimitError):
+                limits_mod.check_rate_limit("refill_key")
+
+    def test_out_of_order_timestamps_do_not_drain_tokens(self) -> None:
+        _clear_rate_limit_state()
+        env = {"MCP_RATE_LIMIT_LONG_RUNNING_PER_MINUTE": "2"}
+        with patch.dict("os.environ", env, clear=False), patch.object(
+            limits_mod.time, "monotonic"
+        ) as monotonic:
+            monotonic.return_value = 7000.0
+            limits_mod.check_rate_limit("order_key")
+            # A thread that read the clock earlier but took the lock later
+            monotonic.return_value = 6990.0
+            limits_mod.check_rate_limit("order_key")
+            with pytest.raises(RateLimitError):
+                limits_mod.check_rate_limit("order_key")
+
+            monotonic.return_value = 7030.0
+            limits_mod.check_rate_limit("order_key")
+
+    def test_least_recently_used_keys_are_evicted(self) -> None:
+        _clear_rate_limit_state()
+        env = {"MCP_RATE_LIMIT_LONG_RUNNING_PER_MINUTE": "1", "MCP_RATE_LIMIT_MAX_KEYS": "2"}
+        with patch.dict("os.environ", env, clear=False):
+            limits_mod.check_rate_limit("lru_a")
+            limits_mod.check_rate_limit("lru_b")
+            with pytest.raises(RateLimitError):
+                limits_mod.check_rate_limit("lru_a")  # a is now most recently used
+            limits_mod.check_rate_limit("lru_c")
+
+            assert list(limits_mod._rate_limit_entries) == ["lru_a", "lru_c"]
+            # b was forgotten and starts over with a full bucket
+            limits_mod.check_rate_limit("lru_b")
+
 
 class TestTimeoutRunner:
     """Test run_with_timeout."""
@@ -75,6 +138,13 @@ class TestTimeoutRunner:
         assert "slow_task" in exc_info.value.message
         assert "1" in exc_info.value.message
 
+    def test_passes_arguments_through(self) -> None:
+        def add(a: int, b: int, *, scale: int = 1) -> int:
+            return (a + b) * scale
+
+        assert limits_mod.run_with_timeout(add, 2, 3, timeout_seconds=5, scale=10) == 50
+        assert limits_mod.run_with_timeout(add, 2, 3, timeout_seconds=0) == 5
+
     def test_zero_timeout_runs_in_caller_thread(self) -> None:
         result = limits_mod.run_with_timeout(lambda: 99, timeout_seconds=0, task_name="no_timeout")
         assert result == 99
@@ -85,6 +155,27 @@ class TestTimeoutRunner:
         )
         assert result == 77
 
+    def test_main_thread_uses_executor(self) -> None:
+        result = limits_mod.run_with_timeout(
+            threading.current_thread, timeout_seconds=5, task_name="pooled"
+        )
+
+        assert result.name.startswith("mcp_task")
+
+    def test_worker_thread_uses_executor(self) -> None:
+        results: list[threading.Thread] = []
+        caller = threading.Thread(
+            target=lambda: results.append(
+                limits_mod.run_with_timeout(
+                    threading.current_thread, timeout_seconds=5, task_name="pooled"
+                )
+            )
+        )
+        caller.start()
+        caller.join()
+
+        assert results[0].name.startswith("mcp_task")
+
     def test_propagates_other_exceptions(self) -> None:
         def fail() -> None:
             raise ValueError("oops")
@@ -116,6 +207,22 @@ class TestConfigGetters:
         with patch.dict("os.environ", {}, clear=True):
             assert limits_mod.get_rate_limit_calls_per_minute() == 10
 
+    def test_rate_limit_max_keys_default(self) -> None:
+        with patch.dict("os.environ", {}, clear=True):
+            assert limits_mod.get_rate_limit_max_keys() == 10_000
+
+    def test_task_pool_size_from_env(self) -> None:
+        with patch.dict("os.environ", {"MCP_TASK_POOL_SIZE": "3"}, clear=False):
+            assert limits_mod.get_task_pool_size() == 3
+
     def test_rate_limit_from_env(self) -> None:
         with patch.dict("os.environ", {"MCP_RATE_LIMIT_LONG_RUNNING_PER_MINUTE": "5"}, clear=False):
             assert limits_mod.get_rate_limit_calls_per_minute() == 5
+
+    def test_getters_are_cached_until_reset(self) -> None:
+        with patch.dict("os.environ", {"MCP_BACKTEST_TIMEOUT_SECONDS": "120"}, clear=False):
+            assert limits_mod.get_backtest_timeout_seconds() == 120
+        with patch.dict("os.environ", {"MCP_BACKTEST_TIMEOUT_SECONDS": "30"}, clear=False):
+            assert limits_mod.get_backtest_timeout_seconds() == 120
+            limits_mod._reset_limits_cache()
+            assert limits_mod.get_backtest_timeout_seconds() == 30
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 
+from kodiak.mcp import tools as tools_mod
 from kodiak.mcp.tools import (
     _ALL_TOOLS,
     analyze_performance,
@@ -27,6 +29,65 @@ from kodiak.mcp.tools import (
 
 mcp = build_server()
 
+# =============================================================================
+# Config Cache
+# =============================================================================
+
+
+class TestConfigCache:
+    """Test that tool calls share a briefly cached config."""
+
+    def test_config_reused_until_env_file_changes(self, tmp_path, monkeypatch) -> None:
+        env_file = tmp_path / ".env"
+        env_file.write_text("A=1\n")
+        loads = []
+        monkeypatch.setattr(tools_mod, "dotenv_files", lambda: [env_file])
+        monkeypatch.setattr(tools_mod, "load_config", lambda: loads.append(1) or object())
+        monkeypatch.setattr(tools_mod, "_config_cache", None)
+
+        first = tools_mod._config()
+        assert tools_mod._config() is first
+        assert len(loads) == 1
+
+        env_file.write_text("A=2\n")
+        mtime_ns = env_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(env_file, ns=(mtime_ns, mtime_ns))
+        assert tools_mod._config() is not first
+        assert len(loads) == 2
+
+
+class TestSerialization:
+    """Test the JSON helpers shared by all tools."""
+
+    def test_dumps_matches_stdlib_json(self) -> None:
+        from datetime import date, datetime
+        from decimal import Decimal
+
+        data = {
+            "positions": [
+                {"price": Decimal("1.50"), "at": datetime(2024, 1, 2, 3, 4, 5), "qty": 3},
+            ],
+            "as_of": date(2024, 1, 2),
+            "empty": {},
+        }
+
+        assert tools_mod._ok_json(data) == json.dumps(data, indent=2, default=str)
+
+    def test_dumps_falls_back_to_stdlib_json(self, monkeypatch) -> None:
+        monkeypatch.setattr(tools_mod, "orjson", None)
+
+        assert tools_mod._ok_json({"a": [1]}) == json.dumps({"a": [1]}, indent=2)
+
+    def test_model_lists_serialize_like_model_dump_json(self) -> None:
+        from kodiak.app.indicators import list_all_indicators
+        from kodiak.schemas.indicators import IndicatorInfo
+
+        items = list_all_indicators()
+        parsed = json.loads(tools_mod._ok_list(IndicatorInfo, items))
+
+        assert parsed == [json.loads(i.model_dump_json()) for i in items]
+
+
 # =============================================================================
 # Server Setup
 # =============================================================================
@@ -51,6 +112,14 @@ class TestMCPServerSetup:
         tools = asyncio.run(mcp.list_tools())
         assert len(tools) == 33
 
+    def test_tools_are_wrapped_once_across_servers(self) -> None:
+        """Rebuilding a server should reuse each tool's audit wrapper."""
+        build_server()
+        for fn in _ALL_TOOLS:
+            wrapped = tools_mod._with_mcp_audit(fn)
+            assert tools_mod._with_mcp_audit(fn) is wrapped
+            assert wrapped.__name__ == fn.__name__
+
     def test_all_tools_have_descriptions(self) -> None:
         """Every registered tool should have a non-empty description."""
         tools = asyncio.run(mcp.list_tools())
@@ -148,6 +217,35 @@ class TestOrderTools:
         parsed = json.loads(result)
         assert isinstance(parsed, list | dict)
 
+    def test_place_order_uses_string_price_exactly(self, monkeypatch) -> None:
+        from decimal import Decimal
+
+        from kodiak.app import orders as orders_app
+        from kodiak.schemas.orders import OrderResponse
+
+        requests = []
+
+        def fake_place_order(config, request):
+            requests.append(request)
+            return OrderResponse(
+                id="1", symbol=request.symbol, side=request.side, order_type="limit",
+                qty=Decimal(request.qty), status="new", limit_price=request.price,
+            )
+
+        monkeypatch.setattr(tools_mod, "_config", lambda: None)
+        monkeypatch.setattr(orders_app, "place_order", fake_place_order)
+
+        tools_mod.place_order("aapl", 1, "BUY", "150.10")
+        tools_mod.place_order("aapl", 1, "BUY", 0.1)
+
+        assert [r.price for r in requests] == [Decimal("150.10"), Decimal("0.1")]
+        assert str(requests[0].price) == "150.10"
+
+    def test_place_order_rejects_unparseable_price(self) -> None:
+        for price in ("abc", "nan"):
+            parsed = json.loads(tools_mod.place_order("AAPL", 1, "buy", price))
+            assert parsed["error"] == "INVALID_PRICE"
+
 
 # =============================================================================
 # Strategy Tools
@@ -169,6 +267,22 @@ class TestStrategyTools:
         parsed = json.loads(result)
         assert parsed["count"] == len(parsed["strategies"])
 
+    def test_schedule_strategy_rejects_bad_datetime(self) -> None:
+        parsed = json.loads(tools_mod.schedule_strategy("missing", "next tuesday"))
+        assert parsed["error"] == "INVALID_DATETIME_FORMAT"
+
+    def test_schedule_strategy_reports_app_errors_as_is(self) -> None:
+        parsed = json.loads(tools_mod.schedule_strategy("missing", "2099-01-02T09:30:00+00:00"))
+        assert parsed["error"] == "STRATEGY_NOT_FOUND"
+
+    def test_schedule_time_is_stored_as_naive_local(self) -> None:
+        from datetime import UTC, datetime
+
+        parsed = tools_mod._parse_schedule_time("2099-01-02T09:30:00+00:00")
+
+        assert parsed.tzinfo is None
+        assert parsed == datetime(2099, 1, 2, 9, 30, tzinfo=UTC).astimezone().replace(tzinfo=None)
+
 
 # =============================================================================
 # Backtest Tools